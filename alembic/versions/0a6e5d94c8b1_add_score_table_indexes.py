@@ -0,0 +1,51 @@
+"""add_score_table_indexes
+
+Revision ID: 0a6e5d94c8b1
+Revises: f3c9d7a1b2e5
+Create Date: 2026-10-18 13:48:21.774036
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a6e5d94c8b1'
+down_revision = 'f3c9d7a1b2e5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Drop duplicate per-pool scores, keeping the first row of each MLB game and team
+    op.execute(
+        "DELETE FROM game_score WHERE api_game_id IS NOT NULL AND id NOT IN ("
+        "SELECT MIN(id) FROM game_score WHERE api_game_id IS NOT NULL "
+        "GROUP BY game_id, api_game_id, team_id)"
+    )
+
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('game_score') as batch_op:
+        batch_op.create_unique_constraint('unique_game_score', ['game_id', 'api_game_id', 'team_id'])
+
+    op.create_index('ix_game_score_game_team_date', 'game_score', ['game_id', 'team_id', 'date'])
+    op.create_index('ix_game_score_game_team_score', 'game_score', ['game_id', 'team_id', 'score', 'date'])
+    op.create_index('ix_team_game_run_totals_game_team', 'team_game_run_totals', ['game_id', 'team_id', 'run_total'])
+    op.create_index('ix_mlb_game_result_team_datetime', 'mlb_game_result', ['team_id', 'game_datetime', 'api_game_id', 'score'])
+    op.create_index('ix_mlb_game_result_date', 'mlb_game_result', ['date'])
+    op.create_index('ix_player_game_team', 'player', ['game_id', 'team_id'])
+    op.create_index('ix_game_status_start_date', 'game', ['status', 'start_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_game_status_start_date', table_name='game')
+    op.drop_index('ix_player_game_team', table_name='player')
+    op.drop_index('ix_mlb_game_result_date', table_name='mlb_game_result')
+    op.drop_index('ix_mlb_game_result_team_datetime', table_name='mlb_game_result')
+    op.drop_index('ix_team_game_run_totals_game_team', table_name='team_game_run_totals')
+    op.drop_index('ix_game_score_game_team_score', table_name='game_score')
+    op.drop_index('ix_game_score_game_team_date', table_name='game_score')
+
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('game_score') as batch_op:
+        batch_op.drop_constraint('unique_game_score', type_='unique')
@@ -0,0 +1,27 @@
+"""ingest_watermark_pending_ids
+
+Revision ID: 2d7c5e9a1f36
+Revises: 6b3e8d2f9a14
+Create Date: 2026-10-20 09:31:07.664218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d7c5e9a1f36'
+down_revision = '6b3e8d2f9a14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('ingest_watermark') as batch_op:
+        batch_op.add_column(sa.Column('pending_ids', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('ingest_watermark') as batch_op:
+        batch_op.drop_column('pending_ids')
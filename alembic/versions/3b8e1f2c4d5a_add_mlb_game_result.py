@@ -0,0 +1,63 @@
+"""add_mlb_game_result
+
+Revision ID: 3b8e1f2c4d5a
+Revises: 625fba49f227
+Create Date: 2026-10-18 09:12:40.118302
+
+"""
+from datetime import datetime, time
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8e1f2c4d5a'
+down_revision = '625fba49f227'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    mlb_game_result = op.create_table(
+        'mlb_game_result',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('api_game_id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), sa.ForeignKey('team.id'), nullable=False),
+        sa.Column('score', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('game_datetime', sa.DateTime(), nullable=False),
+        sa.Column('final', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.UniqueConstraint('api_game_id', 'team_id', name='unique_mlb_game_result'),
+    )
+
+    # Copy one row per MLB game and team out of the per-pool game_score copies.
+    # Legacy rows carry no first-pitch time, so place them at noon on their
+    # schedule date, which keeps them inside any pool that started that day.
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        "SELECT api_game_id, team_id, MIN(score) AS score, MIN(date) AS date "
+        "FROM game_score WHERE api_game_id IS NOT NULL "
+        "GROUP BY api_game_id, team_id"
+    )).fetchall()
+
+    results = []
+    for row in rows:
+        game_date = row.date
+        if isinstance(game_date, str):
+            game_date = datetime.strptime(game_date[:10], '%Y-%m-%d').date()
+        results.append({
+            'api_game_id': row.api_game_id,
+            'team_id': row.team_id,
+            'score': row.score,
+            'date': game_date,
+            'game_datetime': datetime.combine(game_date, time(12)),
+            'final': True,
+        })
+
+    if results:
+        op.bulk_insert(mlb_game_result, results)
+
+
+def downgrade() -> None:
+    op.drop_table('mlb_game_result')
@@ -0,0 +1,36 @@
+"""trim_score_indexes
+
+Revision ID: 4f2a9b7c1d68
+Revises: c81d5f2a6e37
+Create Date: 2026-10-19 10:41:05.802117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f2a9b7c1d68'
+down_revision = 'c81d5f2a6e37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nothing writes or reads game_score by pool any more; results live in mlb_game_result
+    op.drop_index('ix_game_score_game_team_score', table_name='game_score')
+    op.drop_index('ix_game_score_game_team_date', table_name='game_score')
+
+    # The games-played window also filters on final; include it so the index covers the count
+    op.drop_index('ix_mlb_game_result_team_datetime', table_name='mlb_game_result')
+    op.create_index('ix_mlb_game_result_team_datetime', 'mlb_game_result',
+                    ['team_id', 'game_datetime', 'api_game_id', 'score', 'final'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_mlb_game_result_team_datetime', table_name='mlb_game_result')
+    op.create_index('ix_mlb_game_result_team_datetime', 'mlb_game_result',
+                    ['team_id', 'game_datetime', 'api_game_id', 'score'])
+
+    op.create_index('ix_game_score_game_team_date', 'game_score', ['game_id', 'team_id', 'date'])
+    op.create_index('ix_game_score_game_team_score', 'game_score', ['game_id', 'team_id', 'score', 'date'])
@@ -0,0 +1,34 @@
+"""add_backfill_job
+
+Revision ID: 5e7b2c91d0a3
+Revises: 0a6e5d94c8b1
+Create Date: 2026-10-18 14:37:05.918263
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e7b2c91d0a3'
+down_revision = '0a6e5d94c8b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'backfill_job',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('game_id', sa.Integer(), sa.ForeignKey('game.id'), nullable=False, unique=True),
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('total_days', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_days', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('backfill_job')
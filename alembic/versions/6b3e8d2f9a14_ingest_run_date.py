@@ -0,0 +1,27 @@
+"""ingest_run_date
+
+Revision ID: 6b3e8d2f9a14
+Revises: 4f2a9b7c1d68
+Create Date: 2026-10-19 14:22:51.097436
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6b3e8d2f9a14'
+down_revision = '4f2a9b7c1d68'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('ingest_run') as batch_op:
+        batch_op.add_column(sa.Column('run_date', sa.Date(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('ingest_run') as batch_op:
+        batch_op.drop_column('run_date')
@@ -0,0 +1,30 @@
+"""add_scheduler_lease
+
+Revision ID: 7d1f4b8e2a60
+Revises: 5e7b2c91d0a3
+Create Date: 2026-10-18 15:12:37.218406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d1f4b8e2a60'
+down_revision = '5e7b2c91d0a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'scheduler_lease',
+        sa.Column('name', sa.String(50), primary_key=True),
+        sa.Column('holder', sa.String(255), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('scheduler_lease')
@@ -0,0 +1,24 @@
+"""team_coverage_run_mask_index
+
+Revision ID: 8e1a4c6b3d20
+Revises: 2d7c5e9a1f36
+Create Date: 2026-10-20 11:08:42.915530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e1a4c6b3d20'
+down_revision = '2d7c5e9a1f36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_team_coverage_run_mask', 'team_coverage', ['run_mask'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_team_coverage_run_mask', table_name='team_coverage')
@@ -0,0 +1,34 @@
+"""unique_team_game_run_total
+
+Revision ID: 9c4d2a7e6b10
+Revises: 3b8e1f2c4d5a
+Create Date: 2026-10-18 10:03:11.482907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4d2a7e6b10'
+down_revision = '3b8e1f2c4d5a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Drop duplicate run totals, keeping the first row of each triple
+    op.execute(
+        "DELETE FROM team_game_run_totals WHERE id NOT IN ("
+        "SELECT MIN(id) FROM team_game_run_totals GROUP BY team_id, game_id, run_total)"
+    )
+
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('team_game_run_totals') as batch_op:
+        batch_op.create_unique_constraint('unique_team_game_run_total', ['team_id', 'game_id', 'run_total'])
+
+
+def downgrade() -> None:
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('team_game_run_totals') as batch_op:
+        batch_op.drop_constraint('unique_team_game_run_total', type_='unique')
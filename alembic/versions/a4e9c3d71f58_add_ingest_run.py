@@ -0,0 +1,34 @@
+"""add_ingest_run
+
+Revision ID: a4e9c3d71f58
+Revises: 7d1f4b8e2a60
+Create Date: 2026-10-18 16:03:21.540917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4e9c3d71f58'
+down_revision = '7d1f4b8e2a60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ingest_run',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('job', sa.String(50), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='running'),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('summary', sa.Text(), nullable=True),
+    )
+    op.create_index('ix_ingest_run_job_started_at', 'ingest_run', ['job', 'started_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ingest_run_job_started_at', table_name='ingest_run')
+    op.drop_table('ingest_run')
@@ -0,0 +1,29 @@
+"""add_ingest_watermark
+
+Revision ID: b17f0e3a9d24
+Revises: 9c4d2a7e6b10
+Create Date: 2026-10-18 10:41:52.903114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b17f0e3a9d24'
+down_revision = '9c4d2a7e6b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ingest_watermark',
+        sa.Column('name', sa.String(50), primary_key=True),
+        sa.Column('last_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('ingest_watermark')
@@ -0,0 +1,67 @@
+"""team_run_total_first_date
+
+Revision ID: c81d5f2a6e37
+Revises: a4e9c3d71f58
+Create Date: 2026-10-19 09:12:40.318265
+
+"""
+import json
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c81d5f2a6e37'
+down_revision = 'a4e9c3d71f58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('team_game_run_totals') as batch_op:
+        batch_op.add_column(sa.Column('first_date', sa.Date(), nullable=True))
+
+    # Only 0-13 run totals count; the first dates come from the shared MLB results
+    connection = op.get_bind()
+    connection.execute(sa.text(
+        "DELETE FROM team_game_run_totals WHERE run_total NOT BETWEEN 0 AND 13"
+    ))
+    connection.execute(sa.text(
+        "UPDATE team_game_run_totals SET first_date = ("
+        "SELECT MIN(r.date) FROM mlb_game_result r JOIN game ON game.id = team_game_run_totals.game_id "
+        "WHERE r.team_id = team_game_run_totals.team_id AND r.score = team_game_run_totals.run_total "
+        "AND r.final = :final AND r.game_datetime > game.start_date)"
+    ), {'final': True})
+
+    with op.batch_alter_table('team_coverage') as batch_op:
+        batch_op.drop_column('first_achieved')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('team_coverage') as batch_op:
+        batch_op.add_column(sa.Column('first_achieved', sa.Text(), nullable=True))
+
+    # Rebuild the JSON date lists from the per-run-total rows
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        "SELECT game_id, team_id, run_total, first_date FROM team_game_run_totals "
+        "WHERE first_date IS NOT NULL AND run_total BETWEEN 0 AND 13"
+    )).fetchall()
+
+    dates = {}
+    for row in rows:
+        first_date = row.first_date
+        if isinstance(first_date, date):
+            first_date = first_date.isoformat()
+        dates.setdefault((row.game_id, row.team_id), [None] * 14)[row.run_total] = first_date[:10]
+
+    for (game_id, team_id), first_achieved in dates.items():
+        connection.execute(sa.text(
+            "UPDATE team_coverage SET first_achieved = :first_achieved WHERE game_id = :game_id AND team_id = :team_id"
+        ), {'first_achieved': json.dumps(first_achieved), 'game_id': game_id, 'team_id': team_id})
+
+    with op.batch_alter_table('team_game_run_totals') as batch_op:
+        batch_op.drop_column('first_date')
@@ -0,0 +1,64 @@
+"""add_team_coverage
+
+Revision ID: d52a8c0f7e93
+Revises: b17f0e3a9d24
+Create Date: 2026-10-18 11:26:07.351840
+
+"""
+import json
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd52a8c0f7e93'
+down_revision = 'b17f0e3a9d24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    team_coverage = op.create_table(
+        'team_coverage',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('game_id', sa.Integer(), sa.ForeignKey('game.id'), nullable=False),
+        sa.Column('team_id', sa.Integer(), sa.ForeignKey('team.id'), nullable=False),
+        sa.Column('run_mask', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('first_achieved', sa.Text(), nullable=True),
+        sa.UniqueConstraint('game_id', 'team_id', name='unique_team_coverage'),
+    )
+
+    # Build every pool's coverage from the shared MLB results
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        "SELECT game.id AS game_id, r.team_id, r.score, MIN(r.date) AS first_date "
+        "FROM mlb_game_result r JOIN game ON r.game_datetime > game.start_date "
+        "WHERE r.score BETWEEN 0 AND 13 "
+        "GROUP BY game.id, r.team_id, r.score"
+    )).fetchall()
+
+    coverage = {}
+    for row in rows:
+        record = coverage.setdefault((row.game_id, row.team_id), {'run_mask': 0, 'dates': [None] * 14})
+        record['run_mask'] |= 1 << row.score
+        first_date = row.first_date
+        if isinstance(first_date, date):
+            first_date = first_date.isoformat()
+        record['dates'][row.score] = first_date[:10]
+
+    if coverage:
+        op.bulk_insert(team_coverage, [
+            {
+                'game_id': game_id,
+                'team_id': team_id,
+                'run_mask': record['run_mask'],
+                'first_achieved': json.dumps(record['dates']),
+            }
+            for (game_id, team_id), record in coverage.items()
+        ])
+
+
+def downgrade() -> None:
+    op.drop_table('team_coverage')
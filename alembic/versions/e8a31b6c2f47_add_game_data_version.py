@@ -0,0 +1,28 @@
+"""add_game_data_version
+
+Revision ID: e8a31b6c2f47
+Revises: d52a8c0f7e93
+Create Date: 2026-10-18 12:14:29.660471
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8a31b6c2f47'
+down_revision = 'd52a8c0f7e93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('game') as batch_op:
+        batch_op.add_column(sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('game') as batch_op:
+        batch_op.drop_column('data_version')
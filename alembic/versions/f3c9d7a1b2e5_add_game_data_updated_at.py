@@ -0,0 +1,28 @@
+"""add_game_data_updated_at
+
+Revision ID: f3c9d7a1b2e5
+Revises: e8a31b6c2f47
+Create Date: 2026-10-18 13:02:54.207719
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c9d7a1b2e5'
+down_revision = 'e8a31b6c2f47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('game') as batch_op:
+        batch_op.add_column(sa.Column('data_updated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('game') as batch_op:
+        batch_op.drop_column('data_updated_at')
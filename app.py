@@ -4,19 +4,32 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from flask import Flask, render_template, request, redirect, url_for, flash, session
+from flask import Flask, render_template, request, redirect, url_for, flash, session, make_response, g
 
 from flask_sqlalchemy import SQLAlchemy
+import click
 import os
-from sqlalchemy import Column, Integer, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, ForeignKey, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import relationship, joinedload
 
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 from flask_bcrypt import Bcrypt
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
+from contextlib import contextmanager
 import secrets
+import signal
+import socket
+import sys
+import hashlib
 import pdp
 import json
+import logging
+import re
+import threading
+from collections import Counter, OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 from flask_mail import Mail, Message
 import schedule
@@ -52,6 +65,7 @@ TEAM_NAME_MAPPING = {
     'New York Yankees': 'NYY',
     'New York Mets': 'NYM',
     'Oakland Athletics': 'OAK',
+    'Athletics': 'OAK',  # Name used by the MLB Stats API since the move from Oakland
     'Philadelphia Phillies': 'PHI',
     'Pittsburgh Pirates': 'PIT',
     'San Diego Padres': 'SD',
@@ -64,17 +78,83 @@ TEAM_NAME_MAPPING = {
     'Washington Nationals': 'WAS'
 }
 
+# MLB Stats API team ids, by abbreviation
+MLB_TEAM_IDS = {
+    'ARI': 109, 'ATL': 144, 'BAL': 110, 'BOS': 111, 'CHC': 112, 'CWS': 145,
+    'CIN': 113, 'CLE': 114, 'COL': 115, 'DET': 116, 'HOU': 117, 'KC': 118,
+    'LAA': 108, 'LAD': 119, 'MIA': 146, 'MIL': 158, 'MIN': 142, 'NYM': 121,
+    'NYY': 147, 'OAK': 133, 'PHI': 143, 'PIT': 134, 'SD': 135, 'SF': 137,
+    'SEA': 136, 'STL': 138, 'TB': 139, 'TEX': 140, 'TOR': 141, 'WAS': 120
+}
+
+# A 13 Run Pool team must score every run total from 0 through 13
+RUN_TOTALS = range(14)
+FULL_COVERAGE_MASK = (1 << len(RUN_TOTALS)) - 1  # 0x3FFF
+
 mail = Mail()
 
 db = SQLAlchemy()
 
+# SQLite connection settings. WAL lets web requests keep reading while the nightly job writes,
+# and busy_timeout makes a second writer wait for the lock instead of failing with
+# "database is locked". Both are per connection except journal_mode, which sticks to the file.
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '10000'))
+SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(64 * 1024 * 1024)))
+
+# Connection pool for server databases (PostgreSQL); SQLite opens a connection per checkout
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', '1') != '0'
+
+
+def database_engine_options(database_uri):
+    """
+    SQLALCHEMY_ENGINE_OPTIONS for the configured database.
+
+    Args:
+        database_uri: The SQLALCHEMY_DATABASE_URI
+
+    Returns:
+        dict: Pool options for server databases, empty for SQLite
+    """
+    if not database_uri or database_uri.startswith('sqlite'):
+        return {}
+    return {
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_recycle': DB_POOL_RECYCLE,
+        'pool_pre_ping': DB_POOL_PRE_PING
+    }
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Engine 'connect' listener that applies the SQLite settings to every new connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')  # safe with WAL; only the last commits can be lost on power failure
+    cursor.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}')
+    cursor.execute(f'PRAGMA mmap_size={SQLITE_MMAP_SIZE}')
+    cursor.close()
+
+
 def create_app():
     app = Flask(__name__)
     app.config['SECRET_KEY'] = os.getenv('SECRET_KEY')
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URI')
+    database_uri = os.getenv('DATABASE_URI')
+    # Hosted PostgreSQL connection strings may use the postgres:// scheme, which SQLAlchemy 1.4 rejects
+    if database_uri and database_uri.startswith('postgres://'):
+        database_uri = 'postgresql://' + database_uri[len('postgres://'):]
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = database_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
 
     db.init_app(app)
 
+    # The engine exists once init_app has run, but has not opened a connection yet
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', set_sqlite_pragmas)
+
     # Flask-Mail configuration
     app.config['MAIL_SERVER'] = 'smtp.gmail.com'
     app.config['MAIL_PORT'] = 587
@@ -103,6 +183,87 @@ def update_score(player_id, new_score):
 
 app = create_app()
 
+
+## LOGGING SECTION
+# Every area of the app logs through a child of the 'runpool' logger. Production defaults to
+# INFO, which is one summary line per step, formatted as JSON; development to DEBUG as text.
+# Debug records inside loops pass extra={'sample_key': ...}; only 1 in LOG_SAMPLE_EVERY of
+# the records sharing a key is emitted.
+
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG' if os.getenv('FLASK_ENV') == 'development' else 'INFO').upper()
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text' if os.getenv('FLASK_ENV') == 'development' else 'json')
+LOG_SAMPLE_EVERY = int(os.getenv('LOG_SAMPLE_EVERY', '100'))
+
+# Attributes every LogRecord has; anything else was passed in extra={...}
+STANDARD_LOG_RECORD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonLogFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line, including its extra={...} fields."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.utcfromtimestamp(record.created).isoformat(timespec='milliseconds') + 'Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in STANDARD_LOG_RECORD_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class LogSampler(logging.Filter):
+    """Lets 1 in every ``every`` records with the same sample_key through; other records pass untouched."""
+
+    def __init__(self, every):
+        super().__init__()
+        self.every = max(every, 1)
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        key = getattr(record, 'sample_key', None)
+        if key is None:
+            return True
+
+        with self._lock:
+            self._counts[key] += 1
+            seen = self._counts[key]
+        record.sample_count = seen
+        return (seen - 1) % self.every == 0
+
+
+def configure_logging():
+    """Attach the console handler to the 'runpool' logger (once)."""
+    logger = logging.getLogger('runpool')
+    if logger.handlers:
+        return logger
+
+    handler = logging.StreamHandler()
+    if LOG_FORMAT == 'json':
+        handler.setFormatter(JsonLogFormatter())
+    else:
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)-5s [%(name)s] %(message)s'))
+    handler.addFilter(LogSampler(LOG_SAMPLE_EVERY))
+
+    logger.addHandler(handler)
+    logger.setLevel(LOG_LEVEL)
+    logger.propagate = False
+    return logger
+
+
+configure_logging()
+web_logger = logging.getLogger('runpool.web')
+auth_logger = logging.getLogger('runpool.auth')
+db_logger = logging.getLogger('runpool.db')
+ingest_logger = logging.getLogger('runpool.ingest')
+scorecard_logger = logging.getLogger('runpool.scorecard')
+jobs_logger = logging.getLogger('runpool.jobs')
+
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
 login_manager = LoginManager(app)
@@ -118,26 +279,236 @@ def not_found_error(error):
     return render_template('404.html'), 404
 
 
+def page_etag(*parts):
+    """Build a strong ETag from the data a page depends on, the viewer and the deployed release."""
+    viewer = (current_user.id, current_user.name) if current_user.is_authenticated else 'anonymous'
+    payload = '|'.join(str(part) for part in (os.getenv('RENDER_GIT_COMMIT', ''), viewer) + parts)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def conditional_render(etag, last_modified, render):
+    """
+    Answer 304 Not Modified when the client already holds ``etag``; otherwise call ``render``.
+
+    Pages carrying flashed messages are one-off, so they are never tagged or served as 304.
+    """
+    if session.get('_flashes'):
+        return render()
+
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = make_response(render())
+
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+## QUERY STATS SECTION
+# Opt-in (QUERY_STATS=1; on by default in development) counting of the SQL statements each
+# request or job phase runs, through SQLAlchemy engine events. Requests get Server-Timing and
+# X-Query-Count headers; slow statements and repeated statement shapes (N+1 loads) are logged.
+
+QUERY_STATS_ENABLED = os.getenv('QUERY_STATS', '1' if os.getenv('FLASK_ENV') == 'development' else '0') == '1'
+SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', '100'))
+N_PLUS_ONE_THRESHOLD = int(os.getenv('N_PLUS_ONE_THRESHOLD', '10'))
+
+# Collapses expanded IN lists and literals so one statement shape matches however it is bound
+STATEMENT_LITERALS = re.compile(r"\(\s*(?:\?|%\(\w+\)s|'[^']*'|\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|'[^']*'|\d+))*\s*\)")
+
+_query_scopes = threading.local()
+
+
+class QueryStats:
+    """The SQL statements run within one request or job phase."""
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement, seconds):
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold):
+        """Return (shape, count) for every statement shape run more than ``threshold`` times."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+
+def statement_shape(statement):
+    return STATEMENT_LITERALS.sub('(?)', ' '.join(statement.split()))
+
+
+def current_query_stats():
+    stack = getattr(_query_scopes, 'stack', None)
+    return stack[-1] if stack else None
+
+
+def push_query_scope(name):
+    stats = QueryStats(name)
+    _query_scopes.__dict__.setdefault('stack', []).append(stats)
+    return stats
+
+
+def pop_query_scope():
+    stack = getattr(_query_scopes, 'stack', None)
+    return stack.pop() if stack else None
+
+
+@contextmanager
+def query_scope(name):
+    """
+    Count the statements run in the block; yields its QueryStats.
+
+    The scope is pushed either way, but only the engine listeners installed when QUERY_STATS
+    is on record statements into it; otherwise its counts stay at zero.
+    """
+    stats = push_query_scope(name)
+    try:
+        yield stats
+    finally:
+        pop_query_scope()
+
+
+def report_repeated_queries(stats):
+    for shape, count in stats.repeated_shapes(N_PLUS_ONE_THRESHOLD):
+        db_logger.warning("Possible N+1 in %s: %d x %s", stats.name, count, shape[:300])
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info['query_started_at'] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info.pop('query_started_at', time.perf_counter())
+    stats = current_query_stats()
+    if stats is not None:
+        stats.record(statement, seconds)
+    if seconds * 1000 >= SLOW_QUERY_MS:
+        db_logger.warning(
+            "Slow query (%.1f ms) in %s: %s",
+            seconds * 1000, stats.name if stats else 'unknown', ' '.join(statement.split())[:500]
+        )
+
+
+if QUERY_STATS_ENABLED:
+    event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+@app.before_request
+def start_request_query_stats():
+    if QUERY_STATS_ENABLED:
+        g.request_started_at = time.perf_counter()
+        g.query_stats = push_query_scope(request.endpoint or request.path)
+
+
+@app.after_request
+def add_query_stats_headers(response):
+    stats = g.get('query_stats')
+    if stats is not None:
+        app_ms = (time.perf_counter() - g.request_started_at) * 1000
+        response.headers['X-Query-Count'] = str(stats.count)
+        response.headers['Server-Timing'] = (
+            f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries", app;dur={app_ms:.1f}'
+        )
+        report_repeated_queries(stats)
+    return response
+
+
+@app.teardown_request
+def end_request_query_stats(exception=None):
+    if g.pop('query_stats', None) is not None:
+        pop_query_scope()
+
+
+# Pools shown per section of the dashboard before "Show more"
+DASHBOARD_PAGE_SIZE = int(os.getenv('DASHBOARD_PAGE_SIZE', '24'))
+
+
+def dashboard_page(status_filter, before_game_id):
+    """
+    Load one keyset page of the current user's pools, newest first, with everything the card shows.
+
+    Args:
+        status_filter: SQL filter on Game.status for this section
+        before_game_id: Only pools with a lower Game.id (the previous page's cursor), or None
+
+    Returns:
+        (list of the user's Player rows with game and winner eagerly loaded, next cursor or None)
+    """
+    query = Player.query.join(Player.game).options(
+        joinedload(Player.game).joinedload(Game.winner_player).joinedload(Player.user),
+        joinedload(Player.game).joinedload(Game.winner_player).joinedload(Player.non_registered_player)
+    ).filter(Player.user_id == current_user.id, status_filter)
+    if before_game_id is not None:
+        query = query.filter(Game.id < before_game_id)
+
+    # One extra row tells us whether there is a next page
+    players = query.order_by(Game.id.desc()).limit(DASHBOARD_PAGE_SIZE + 1).all()
+    if len(players) > DASHBOARD_PAGE_SIZE:
+        players = players[:DASHBOARD_PAGE_SIZE]
+        return players, players[-1].game_id
+    return players, None
+
+
 @app.route('/dashboard')
 @login_required
 def dashboard():
     from datetime import datetime
-    now = datetime.now()
-    
-    # Get user's games with enhanced information
-    try:
-        user_players = current_user.players if hasattr(current_user, 'players') else []
+
+    active_before = request.args.get('active_before', type=int)
+    completed_before = request.args.get('completed_before', type=int)
+
+    # Tag the page with the version of every game the user plays in (one small query)
+    user_games = db.session.query(Game.id, Game.status, Game.data_version, Game.data_updated_at).join(
+        Player, Player.game_id == Game.id
+    ).filter(Player.user_id == current_user.id).order_by(Game.id).all()
+    last_modified = max((updated for _, _, _, updated in user_games if updated), default=None)
+    etag = page_etag(
+        'dashboard', current_user.team_id, active_before, completed_before,
+        [(game_id, version) for game_id, _, version, _ in user_games]
+    )
+
+    def render():
+        now = datetime.now()
+
+        # The stats cards count every pool, from the rows already loaded for the ETag
+        counts = {
+            'total': len(user_games),
+            'active': sum(1 for _, status, _, _ in user_games if status == "active"),
+            'completed': sum(1 for _, status, _, _ in user_games if status == "completed")
+        }
         
-        # Enhance player data with game status and winner information
-        enhanced_games = []
-        for player in user_players:
-            game = player.game
-            if game:
+        # Get one page of the user's active and of their finished games
+        try:
+            active_players, active_next = dashboard_page(Game.status == "active", active_before)
+            completed_players, completed_next = dashboard_page(Game.status != "active", completed_before)
+
+            # Player counts for every game on the page, in one grouped query
+            page_game_ids = [player.game_id for player in active_players + completed_players]
+            player_counts = dict(
+                db.session.query(Player.game_id, db.func.count(Player.id)).filter(
+                    Player.game_id.in_(page_game_ids)
+                ).group_by(Player.game_id).all()
+            ) if page_game_ids else {}
+
+            # Enhance player data with game status and winner information
+            def enhance(player):
+                game = player.game
+
                 # Get winner information if game is completed
                 winner_info = None
                 if game.status == "completed" and game.winner_team_id:
-                    winner_team = Team.query.get(game.winner_team_id)
-                    winner_player = Player.query.get(game.winner_player_id) if game.winner_player_id else None
+                    winner_team = team_registry.get(game.winner_team_id)
+                    winner_player = game.winner_player
                     
                     winner_info = {
                         'team_name': winner_team.name if winner_team else 'Unknown',
@@ -148,20 +519,33 @@ def dashboard():
                 # Get progress information (unique run totals achieved)
                 progress_info = {
                     'unique_runs': player.score if player.score is not None else 0,
-                    'max_possible': 14  # 0-13 inclusive
+                    'max_possible': len(RUN_TOTALS)  # 0-13 inclusive
                 }
                 
-                enhanced_games.append({
+                return {
                     'player': player,
                     'game': game,
+                    'player_count': player_counts.get(game.id, 0),
                     'winner_info': winner_info,
                     'progress_info': progress_info
-                })
-    except Exception as e:
-        print(f"Error loading dashboard data: {e}")
-        enhanced_games = []
-    
-    return render_template('dashboard.html', now=now, enhanced_games=enhanced_games)
+                }
+
+            active_games = [enhance(player) for player in active_players]
+            completed_games = [enhance(player) for player in completed_players]
+        except Exception as e:
+            web_logger.error("Error loading dashboard data: %s", e)
+            active_games, completed_games = [], []
+            active_next = completed_next = None
+        
+        return render_template(
+            'dashboard.html', now=now, counts=counts,
+            active_games=active_games, completed_games=completed_games,
+            active_next=active_next, completed_next=completed_next,
+            active_before=active_before, completed_before=completed_before,
+            user_team=team_registry.get(current_user.team_id)
+        )
+
+    return conditional_render(etag, last_modified, render)
 
 
 class User(db.Model, UserMixin):
@@ -187,21 +571,37 @@ class Team(db.Model):
     scores = db.relationship('Score', backref='team', lazy=True)
     run_totals = db.relationship('RunTotal', secondary='team_run_totals', back_populates='teams')
 
-    def games_played(self, game_id):
-        if game_id is None:
-            return 0
 
-        # Get the start_date of the game
-        game_start_date = Game.query.get(game_id).start_date
+def games_played_by_team(game, team_ids):
+    """Return a dict of team_id -> MLB games played in the game's window, for the given teams."""
+    if not team_ids:
+        return {}
+
+    rows = db.session.query(
+        MLBGameResult.team_id, db.func.count(db.distinct(MLBGameResult.api_game_id))
+    ).filter(
+        MLBGameResult.team_id.in_(team_ids),
+        MLBGameResult.in_pool_window(game.start_date, game.end_date)
+    ).group_by(MLBGameResult.team_id).all()
+
+    return dict(rows)
+
 
-        # Count all unique GameScore instances for this team and this game since the start of the game
-        games_played = db.session.query(GameScore.api_game_id).filter(
-            GameScore.team_id == self.id,
-            GameScore.game_id == game_id,
-            GameScore.date >= game_start_date
-        ).distinct().count()
+def games_played_by_game_team(game_ids, team_ids):
+    """Return a dict of (game_id, team_id) -> MLB games played in that game's window, in one grouped query."""
+    if not game_ids or not team_ids:
+        return {}
 
-        return games_played
+    rows = db.session.query(
+        Game.id, MLBGameResult.team_id, db.func.count(db.distinct(MLBGameResult.api_game_id))
+    ).select_from(MLBGameResult).join(
+        Game, MLBGameResult.in_pool_window(Game.start_date, Game.end_date)
+    ).filter(
+        Game.id.in_(game_ids),
+        MLBGameResult.team_id.in_(team_ids)
+    ).group_by(Game.id, MLBGameResult.team_id).all()
+
+    return {(game_id, team_id): count for game_id, team_id, count in rows}
 
 
 class Game(db.Model):
@@ -214,17 +614,49 @@ class Game(db.Model):
     winner_team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=True)
     tiebreaker_notes = db.Column(db.Text, nullable=True)  # store JSON string
     token = db.Column(db.String(32), nullable=False, unique=True)
+    data_version = db.Column(db.Integer, nullable=False, default=0)  # bumped whenever the game's scorecard data changes
+    data_updated_at = db.Column(db.DateTime, nullable=True)  # UTC time of the last data_version bump
     players = db.relationship('Player', backref='game', lazy=True, foreign_keys='Player.game_id')
     scores = db.relationship('GameScore', backref='game', lazy=True)
     winner_player = db.relationship('Player', foreign_keys=[winner_player_id], backref='won_games')
     winner_team = db.relationship('Team', foreign_keys=[winner_team_id], backref='won_games')
 
+    __table_args__ = (db.Index('ix_game_status_start_date', 'status', 'start_date'),)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.token = secrets.token_hex(16)  # Generate a random token when creating a game
         if not hasattr(self, 'status') or self.status is None:
             self.status = "active"
 
+def bump_data_version(game_ids=None, results=None):
+    """
+    Mark games' scorecard data as changed, invalidating cached views.
+
+    Staged on the session; the caller commits.
+
+    Args:
+        game_ids: The games whose data changed
+        results: Instead bump every game whose window covers one of these new
+            mlb_game_result rows (dicts with date and game_datetime)
+    """
+    if results is not None:
+        # Started before the newest result, and not completed before the oldest one's MLB date
+        games = Game.query.filter(
+            Game.start_date < max(result['game_datetime'] for result in results),
+            db.or_(Game.end_date.is_(None), Game.end_date >= min(result['date'] for result in results))
+        )
+    else:
+        game_ids = [game_id for game_id in game_ids or [] if game_id is not None]
+        if not game_ids:
+            return
+        games = Game.query.filter(Game.id.in_(game_ids))
+
+    games.update(
+        {Game.data_version: Game.data_version + 1, Game.data_updated_at: datetime.utcnow()},
+        synchronize_session=False
+    )
+
 class Player(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)  # Change nullable to True
@@ -236,7 +668,10 @@ class Player(db.Model):
     team = db.relationship('Team', backref='players')
     score = db.Column(db.Integer, nullable=True, default=0)  # Add the default value here
 
-    __table_args__ = (db.UniqueConstraint('user_id', 'non_registered_player_id', 'game_id', name='unique_player'),)
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'non_registered_player_id', 'game_id', name='unique_player'),
+        db.Index('ix_player_game_team', 'game_id', 'team_id'),
+    )
 
 
 class GameScore(db.Model): # stores the scores achieved in a 13 Run Pool game
@@ -248,6 +683,44 @@ class GameScore(db.Model): # stores the scores achieved in a 13 Run Pool game
     date = db.Column(db.Date, nullable=False)
     final = db.Column(db.Boolean, nullable=False, default=False)  # Add this line
 
+    __table_args__ = (db.UniqueConstraint('game_id', 'api_game_id', 'team_id', name='unique_game_score'),)
+
+class MLBGameResult(db.Model): # Stores each real-life MLB result once, shared by every 13 Run Pool game
+    __tablename__ = 'mlb_game_result'
+    id = db.Column(db.Integer, primary_key=True)
+    api_game_id = db.Column(db.Integer, nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False)
+    score = db.Column(db.Integer, nullable=False)
+    date = db.Column(db.Date, nullable=False)  # MLB schedule date
+    game_datetime = db.Column(db.DateTime, nullable=False)  # first pitch (UTC)
+    final = db.Column(db.Boolean, nullable=False, default=True)
+
+    team = db.relationship('Team', backref=db.backref('mlb_game_results', lazy=True))
+
+    __table_args__ = (
+        db.UniqueConstraint('api_game_id', 'team_id', name='unique_mlb_game_result'),
+        # Covers the games-played counts, which also filter on final
+        db.Index('ix_mlb_game_result_team_datetime', 'team_id', 'game_datetime', 'api_game_id', 'score', 'final'),
+        db.Index('ix_mlb_game_result_date', 'date'),
+    )
+
+    @staticmethod
+    def in_pool_window(start_date, end_date=None):
+        """
+        Filter for the results a pool counts: final, after ``start_date`` and, once the
+        pool has completed, on or before its ``end_date``. Both take a value or the Game column.
+        """
+        # Provisional scores of games still in progress never count
+        window = [MLBGameResult.final.is_(True), MLBGameResult.game_datetime > start_date]
+        # A completed pool keeps the whole MLB date it was won on, and nothing after
+        if isinstance(end_date, datetime):
+            window.append(MLBGameResult.date <= end_date.date())
+        elif isinstance(end_date, date):
+            window.append(MLBGameResult.date <= end_date)
+        elif end_date is not None:
+            window.append(db.or_(end_date.is_(None), MLBGameResult.date <= end_date))
+        return db.and_(*window)
+
 class NonRegisteredPlayer(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -265,32 +738,345 @@ team_run_totals = db.Table('team_run_totals',
     db.Column('run_total_id', db.Integer, db.ForeignKey('run_total.id'), primary_key=True)
 )
 
-class TeamGameRunTotal(db.Model):
+class TeamGameRunTotal(db.Model): # Each 0-13 run total a team has reached in a 13 Run Pool game, and when
     __tablename__ = 'team_game_run_totals'
     id = db.Column(db.Integer, primary_key=True)
     team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False)
     game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False)
     run_total = db.Column(db.Integer, nullable=False)
+    first_date = db.Column(db.Date, nullable=True)  # MLB date the team first reached this run total in the pool
 
     team = db.relationship('Team', backref=db.backref('team_game_run_totals', lazy=True))
     game = db.relationship('Game', backref=db.backref('team_game_run_totals', lazy=True))
 
+    __table_args__ = (
+        db.UniqueConstraint('team_id', 'game_id', 'run_total', name='unique_team_game_run_total'),
+        db.Index('ix_team_game_run_totals_game_team', 'game_id', 'team_id', 'run_total'),
+    )
 
 
-@app.before_request
-def create_tables():
-    db.create_all()
-    if not Team.query.first():
-        teams = ['ARI', 'ATL', 'BAL', 'BOS', 'CHC', 'CWS', 'CIN', 'CLE', 'COL', 'DET', 'HOU', 'KC', 'LAA', 'LAD', 'MIA', 'MIL', 'MIN', 'NYM', 'NYY', 'OAK', 'PHI', 'PIT', 'SD', 'SF', 'SEA', 'STL', 'TB', 'TEX', 'TOR', 'WAS']
-        for name in teams:
+
+class TeamCoverage(db.Model): # Compact record of the 0-13 run totals a team has reached in a 13 Run Pool game
+    __tablename__ = 'team_coverage'
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False)
+    run_mask = db.Column(db.Integer, nullable=False, default=0)  # bit n set once the team has scored n runs
+
+    __table_args__ = (
+        db.UniqueConstraint('game_id', 'team_id', name='unique_team_coverage'),
+        # Finds the complete teams of pools still waiting for a winner
+        db.Index('ix_team_coverage_run_mask', 'run_mask'),
+    )
+
+    @property
+    def is_complete(self):
+        return self.run_mask == FULL_COVERAGE_MASK
+
+    @property
+    def runs_reached(self):
+        return (self.run_mask or 0).bit_count()
+
+    def run_totals(self):
+        """Return the run totals reached, in ascending order."""
+        return [run for run in RUN_TOTALS if self.run_mask & (1 << run)]
+
+
+class BackfillJob(db.Model): # Tracks the background fetch of historical MLB scores for a new game
+    __tablename__ = 'backfill_job'
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False, unique=True)
+    status = db.Column(db.String(20), nullable=False, default="pending")  # pending, running, completed, failed
+    total_days = db.Column(db.Integer, nullable=False, default=0)
+    completed_days = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, nullable=True)
+
+    game = db.relationship('Game', backref=db.backref('backfill_job', uselist=False, lazy=True))
+
+    @property
+    def in_progress(self):
+        return self.status in ("pending", "running")
+
+
+class IngestRun(db.Model): # One run of the nightly job, with its per-phase metrics
+    __tablename__ = 'ingest_run'
+    id = db.Column(db.Integer, primary_key=True)
+    job = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="running")  # running, success, failed
+    started_at = db.Column(db.DateTime, nullable=False)  # UTC
+    finished_at = db.Column(db.DateTime, nullable=True)  # UTC
+    run_date = db.Column(db.Date, nullable=True)  # The MLB date the run ingested
+    summary = db.Column(db.Text, nullable=True)  # JSON: phases, upstream calls, cache hits
+
+    __table_args__ = (db.Index('ix_ingest_run_job_started_at', 'job', 'started_at'),)
+
+
+class IngestWatermark(db.Model): # Tracks the last MLBGameResult.id each incremental step has processed
+    __tablename__ = 'ingest_watermark'
+    name = db.Column(db.String(50), primary_key=True)
+    last_id = db.Column(db.Integer, nullable=False, default=0)
+    pending_ids = db.Column(db.Text, nullable=True)  # JSON: ids below last_id that had not committed yet
+    updated_at = db.Column(db.DateTime, nullable=True)
+
+    @staticmethod
+    def get_last_id(name):
+        watermark = IngestWatermark.query.get(name)
+        return watermark.last_id if watermark else 0
+
+    @staticmethod
+    def get_pending_ids(name):
+        watermark = IngestWatermark.query.get(name)
+        return json.loads(watermark.pending_ids) if watermark and watermark.pending_ids else []
+
+    @staticmethod
+    def advance(name, last_id, pending_ids=None):
+        """Move the watermark forward (never back), replace its pending ids if given, and stage it on the session."""
+        watermark = IngestWatermark.query.get(name)
+        if watermark is None:
+            watermark = IngestWatermark(name=name, last_id=0)
+            db.session.add(watermark)
+        watermark.last_id = max(watermark.last_id or 0, last_id)
+        if pending_ids is not None:
+            watermark.pending_ids = json.dumps(sorted(pending_ids))
+        watermark.updated_at = datetime.now()
+
+
+class SchedulerLease(db.Model): # Names the one process allowed to run the scheduled jobs, until expires_at
+    __tablename__ = 'scheduler_lease'
+    name = db.Column(db.String(50), primary_key=True)
+    holder = db.Column(db.String(255), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    heartbeat_at = db.Column(db.DateTime, nullable=False)
+
+    @staticmethod
+    def acquire(name, holder, ttl):
+        """
+        Take or renew a lease and commit.
+
+        The lease is granted when it doesn't exist yet, when ``holder`` already holds
+        it, or when the previous holder stopped heartbeating and it expired. A single
+        conditional UPDATE decides, so two processes can never both win.
+
+        Args:
+            name: The lease name
+            holder: Unique id of the calling process
+            ttl: Seconds the lease stays valid without another heartbeat
+
+        Returns:
+            bool True if ``holder`` holds the lease
+        """
+        now = datetime.utcnow()
+        values = {'holder': holder, 'expires_at': now + timedelta(seconds=ttl), 'heartbeat_at': now}
+        table = SchedulerLease.__table__
+        try:
+            db.session.execute(insert_ignoring_conflicts(table).values(name=name, **values))
+            acquired = db.session.execute(
+                table.update().where(
+                    table.c.name == name,
+                    db.or_(table.c.holder == holder, table.c.expires_at < now)
+                ).values(**values)
+            ).rowcount == 1
+            db.session.commit()
+            return acquired
+        except Exception as e:
+            jobs_logger.warning("Could not acquire scheduler lease %s: %s", name, e)
+            db.session.rollback()
+            return False
+
+    @staticmethod
+    def release(name, holder):
+        """Expire a lease held by ``holder`` so another process can take over at once."""
+        try:
+            SchedulerLease.query.filter_by(name=name, holder=holder).update(
+                {'expires_at': datetime.utcnow()}, synchronize_session=False
+            )
+            db.session.commit()
+        except Exception as e:
+            jobs_logger.warning("Could not release scheduler lease %s: %s", name, e)
+            db.session.rollback()
+
+
+
+MLB_TEAMS = ['ARI', 'ATL', 'BAL', 'BOS', 'CHC', 'CWS', 'CIN', 'CLE', 'COL', 'DET', 'HOU', 'KC', 'LAA', 'LAD', 'MIA', 'MIL', 'MIN', 'NYM', 'NYY', 'OAK', 'PHI', 'PIT', 'SD', 'SF', 'SEA', 'STL', 'TB', 'TEX', 'TOR', 'WAS']
+
+# The last revision whose schema db.create_all() produced before migrations ran at startup
+PRE_MIGRATION_REVISION = '625fba49f227'
+
+
+# How long the worker waits for the web service's init-db to migrate the schema
+MIGRATION_WAIT_SECONDS = int(os.getenv('MIGRATION_WAIT_SECONDS', '600'))
+MIGRATION_POLL_SECONDS = 5
+
+
+def alembic_config():
+    from alembic.config import Config
+
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    config = Config(os.path.join(app_dir, 'alembic.ini'))
+    # alembic.ini's script_location is relative to the working directory; pin it to the app's
+    config.set_main_option('script_location', os.path.join(app_dir, 'alembic'))
+    config.set_main_option('sqlalchemy.url', app.config['SQLALCHEMY_DATABASE_URI'])
+    return config
+
+
+def migrate_database():
+    """Bring the schema to the latest Alembic revision."""
+    from alembic import command
+
+    config = alembic_config()
+    table_names = db.inspect(db.engine).get_table_names()
+    if 'game' not in table_names:
+        # Fresh database: create the current schema directly and mark it as up to date
+        db.create_all()
+        command.stamp(config, 'head')
+        return
+
+    if 'alembic_version' not in table_names:
+        # Tables created by the old per-request db.create_all(), never stamped
+        command.stamp(config, PRE_MIGRATION_REVISION)
+
+    command.upgrade(config, 'head')
+
+
+def seed_database():
+    """Insert any missing MLB teams and run totals."""
+    existing_teams = set(name for (name,) in db.session.query(Team.name).all())
+    for name in MLB_TEAMS:
+        if name not in existing_teams:
             db.session.add(Team(name=name))
 
     # Ensure all possible run totals exist
-    for i in range(0, 13):
-        if not RunTotal.query.get(i):
-            db.session.add(RunTotal(value=i))
+    existing_runs = set(value for (value,) in db.session.query(RunTotal.value).all())
+    for value in RUN_TOTALS:
+        if value not in existing_runs:
+            db.session.add(RunTotal(value=value))
 
     db.session.commit()
+
+
+def bootstrap_database():
+    """Migrate the schema and seed reference data. Idempotent; run once at deploy or startup, never per request."""
+    migrate_database()
+    seed_database()
+    team_registry.load()
+
+
+def wait_for_migrations(timeout=None):
+    """
+    Wait until another process has brought the schema to the latest Alembic revision.
+
+    Only one service migrates a shared database (the web service's init-db); the worker
+    calls this instead, so the two never run migrations against it at the same time.
+
+    Args:
+        timeout: Seconds to wait before giving up (default MIGRATION_WAIT_SECONDS)
+
+    Raises:
+        RuntimeError: If the schema is still behind when the timeout runs out
+    """
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    head = ScriptDirectory.from_config(alembic_config()).get_current_head()
+    deadline = time.monotonic() + (MIGRATION_WAIT_SECONDS if timeout is None else timeout)
+    while True:
+        with db.engine.connect() as connection:
+            revision = MigrationContext.configure(connection).get_current_revision()
+        if revision == head:
+            return
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"Schema is at revision {revision or 'none'}, not {head}; run `flask --app app init-db`")
+        db_logger.info("Waiting for migrations: schema at revision %s, head is %s", revision or 'none', head)
+        time.sleep(MIGRATION_POLL_SECONDS)
+
+
+TeamInfo = namedtuple('TeamInfo', ['id', 'name', 'full_name', 'mlb_id'])
+
+
+class TeamRegistry:
+    """
+    Process-wide lookup of the 30 MLB teams, loaded from the database once.
+
+    Resolves a full MLB name, an abbreviation or an MLB Stats API team id to
+    the Team.id without a query. The teams never change after seeding.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_id = None
+        self._by_abbreviation = {}
+        self._by_full_name = {}
+        self._by_mlb_id = {}
+
+    def load(self):
+        """(Re)load the teams from the database. Needs an app context."""
+        # The first name listed for an abbreviation is its canonical full name; later ones are aliases
+        full_names = {}
+        for full_name, abbreviation in TEAM_NAME_MAPPING.items():
+            full_names.setdefault(abbreviation, full_name)
+        teams = [
+            TeamInfo(team.id, team.name, full_names.get(team.name), MLB_TEAM_IDS.get(team.name))
+            for team in Team.query.order_by(Team.id).all()
+        ]
+
+        with self._lock:
+            # An unseeded database yields nothing worth keeping; try again on the next lookup
+            self._by_id = {team.id: team for team in teams} if teams else None
+            self._by_abbreviation = {team.name: team for team in teams}
+            self._by_full_name = {
+                full_name: self._by_abbreviation[abbreviation]
+                for full_name, abbreviation in TEAM_NAME_MAPPING.items()
+                if abbreviation in self._by_abbreviation
+            }
+            self._by_mlb_id = {team.mlb_id: team for team in teams if team.mlb_id}
+
+    def _ensure_loaded(self):
+        if self._by_id is None:
+            self.load()
+
+    def all(self):
+        self._ensure_loaded()
+        return list((self._by_id or {}).values())
+
+    def get(self, team_id):
+        self._ensure_loaded()
+        try:
+            return (self._by_id or {}).get(int(team_id))
+        except (TypeError, ValueError):
+            return None
+
+    def id_for_full_name(self, full_name):
+        self._ensure_loaded()
+        team = self._by_full_name.get(full_name)
+        return team.id if team else None
+
+    def id_for_abbreviation(self, abbreviation):
+        self._ensure_loaded()
+        team = self._by_abbreviation.get(abbreviation)
+        return team.id if team else None
+
+    def id_for_mlb_id(self, mlb_id):
+        self._ensure_loaded()
+        team = self._by_mlb_id.get(mlb_id)
+        return team.id if team else None
+
+    def names(self):
+        """Return a dict of Team.id -> abbreviation."""
+        return {team.id: team.name for team in self.all()}
+
+
+team_registry = TeamRegistry()
+
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create or migrate the database schema and seed teams and run totals."""
+    bootstrap_database()
+    print("Database is up to date.")
+
+
 @login_manager.user_loader
 def load_user(user_id):
     return User.query.get(int(user_id))
@@ -330,11 +1116,11 @@ def register():
 
         try:
             db.session.commit()
-            print("Successfully committed changes to user registration.")
+            web_logger.info("Registered user %s", user.id)
             flash('Registration successful! Please log in.', 'success')
             return redirect(url_for('login'))
         except Exception as e:
-            print(f"Failed to commit changes to user registration: {e}")
+            web_logger.error("Failed to commit changes to user registration: %s", e)
             db.session.rollback()  # Rollback the session to a clean state
             flash('Registration failed. Please try again.', 'error')
             return render_template('register_email.html')
@@ -383,16 +1169,13 @@ def create_game():
         pool_name = request.form['pool_name']
         start_date = datetime.strptime(request.form['start_date'], '%Y-%m-%d')
         game = Game(pool_name=pool_name, start_date=start_date)
-        print(f"Game before commit: {game.__dict__}")
         db.session.add(game)
         db.session.commit()
-        print(f"Inserted game with ID: {game.id}")
-        print(f"Game after commit: {game.__dict__}")
+        web_logger.debug("Inserted game with ID: %s", game.id)
 
         # Add current user as first player
         current_user_team_id = request.form['team_id']
         current_user_player = Player(user_id=current_user.id, team_id=current_user_team_id, game_id=game.id)
-        print(f"Current user player's game_id: {current_user_player.game_id}")
         db.session.add(current_user_player)
 
         # Retrieve player names and team IDs from the form
@@ -414,66 +1197,42 @@ def create_game():
                     team_id=team_id, 
                     game_id=game.id
                 )
-                print(f"Additional player: {name}, team_id: {team_id}, game_id: {game.id}")
+                web_logger.debug("Additional player: %s, team_id: %s, game_id: %s", name, team_id, game.id)
                 db.session.add(additional_player)
 
         # Attempt to commit all changes to the database
         try:
             db.session.commit()
-            print(f"Successfully created game {game.id} with {len(player_names) + 1} players")
+            web_logger.info("Created game %s with %d players", game.id, len(player_names) + 1)
             
-            # Immediately fetch any existing MLB scores for this game's start date and update scorecard
+            # Results already stored for the pool's window (earlier backfills, today's live
+            # ingest) sit below the scorecard watermark, so the nightly run would never fold them in
             try:
-                from datetime import datetime
-                game_start_date = game.start_date
-                current_date = datetime.now().date()
-                
-                # Only fetch scores if the game started before today
-                if game_start_date.date() < current_date:
-                    print(f"Fetching existing MLB scores for game {game.id} from {game_start_date.date()} to {current_date}")
-                    
-                    # Fetch scores for each day from game start to yesterday
-                    from datetime import timedelta
-                    start_date = game_start_date.date()
-                    end_date = current_date - timedelta(days=1)  # Yesterday
-                    
-                    current_check_date = start_date
-                    while current_check_date <= end_date:
-                        date_str = current_check_date.strftime('%m/%d/%Y')
-                        print(f"Checking for scores on {date_str}")
-                        
-                        # Fetch scores for this date
-                        scores = get_final_scores(date_str, game.id)
-                        if scores:
-                            print(f"Found {len(scores)} scores for {date_str}")
-                        
-                        current_check_date += timedelta(days=1)
-                    
-                    # Update the scorecard with any new scores
-                    update_scorecard()
-                    print(f"Scorecard updated for newly created game {game.id}")
+                score_stored_results(game)
+            except Exception as score_error:
+                web_logger.warning("Could not score stored results for new game %s: %s", game.id, score_error)
+
+            # Fetch any existing MLB scores from the game's start date to yesterday in the background
+            try:
+                if game.start_date.date() < datetime.now().date():
+                    start_backfill(game)
                 else:
-                    print(f"Game {game.id} starts today, no historical scores to fetch")
+                    web_logger.debug("Game %s starts today, no historical scores to fetch", game.id)
                     
             except Exception as score_error:
-                print(f"Warning: Could not fetch historical scores for new game: {score_error}")
+                web_logger.warning("Could not start the historical score backfill for new game: %s", score_error)
                 # Don't fail the game creation if score fetching fails
             
             flash(f'Game created successfully! Game ID: {game.id}', 'success')
             # Redirect to the scorecard page with the new game token
             return redirect(url_for('view_scorecard', game_token=game.token))
         except Exception as e:
-            print(f"Failed to commit changes to game creation: {e}")
+            web_logger.error("Failed to commit changes to game creation: %s", e)
             db.session.rollback()
             flash('Failed to create game. Please try again.', 'error')
-            return render_template('create_game_new.html', teams=teams)
-
-    # Add the following lines to print all game tokens in the database
-    all_games = Game.query.all()
-    for g in all_games:
-        print(f"Game ID: {g.id}, Game token: {g.token}")
+            return render_template('create_game_new.html', teams=team_registry.all())
 
-    teams = Team.query.all()
+    teams = team_registry.all()
     return render_template('create_game_new.html', teams=teams)
 
 
@@ -482,49 +1241,108 @@ def create_game():
 @login_required
 def view_game(game_id):
     game = Game.query.get_or_404(game_id)
-    teams = Team.query.all()
-    players = Player.query.filter_by(game_id=game_id).all()
 
-    for player in players:
-        if player.user_id is None and player.non_registered_player_id is not None:
-            player.score = player.non_registered_player.score
+    def render():
+        teams = team_registry.all()
+        players = Player.query.options(
+            joinedload(Player.user),
+            joinedload(Player.non_registered_player)
+        ).filter_by(game_id=game_id).all()
+
+        for player in players:
+            if player.user_id is None and player.non_registered_player_id is not None:
+                player.score = player.non_registered_player.score
 
-    scorecard_token = request.args.get('scorecard_token', '')
-    for team in teams:
-        print(f'Team {team.name} games played: {team.games_played(game_id)}')
-    return render_template('game.html', game=game, teams=teams, players=players, scorecard_token=scorecard_token)
+        scorecard_token = request.args.get('scorecard_token', '')
+        return render_template('game.html', game=game, teams=teams, team_names=team_registry.names(), players=players, scorecard_token=scorecard_token)
 
+    etag = page_etag('game', game.id, game.data_version)
+    return conditional_render(etag, game.data_updated_at, render)
 
-@app.route('/game/<string:game_token>/scorecard')
-def view_scorecard(game_token):
-    game = Game.query.filter_by(token=game_token).first_or_404()
-    teams = Team.query.all()  # Fetch all teams from the database
-    players = Player.query.filter_by(game_id=game.id).all()
-    team_run_totals = {}  # Create a new dictionary to store the run totals for each team
 
-    # Fetch only the players that are part of the current game
-    players = Player.query.filter_by(game_id=game.id).all()
+class ScorecardCache:
+    """Process-local LRU cache of scorecard view-models, keyed by game token and data version."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # token -> (data_version, view)
+        self._lock = threading.Lock()
+
+    def get(self, token, data_version):
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None or entry[0] != data_version:
+                return None
+            self._entries.move_to_end(token)
+            return entry[1]
+
+    def set(self, token, data_version, view):
+        with self._lock:
+            self._entries[token] = (data_version, view)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
 
-    for player in players:
-        if player.user_id is None and player.non_registered_player_id is not None:
-            player.score = player.non_registered_player.score
 
-    # Print the player scores
+scorecard_cache = ScorecardCache(max_entries=int(os.getenv('SCORECARD_CACHE_SIZE', '256')))
+
+
+def build_scorecard_view(game):
+    """Build the scorecard rows for a game as plain data that can be cached."""
+    # Fetch only the players that are part of the current game, with their user or name
+    players = Player.query.options(
+        joinedload(Player.user),
+        joinedload(Player.non_registered_player)
+    ).filter_by(game_id=game.id).order_by(Player.id).all()
+    team_names = team_registry.names()
+
+    # Read every team's run coverage for this game in one query
+    team_run_totals = {
+        coverage.team_id: coverage.run_totals()
+        for coverage in TeamCoverage.query.filter_by(game_id=game.id).all()
+    }
+
+    # Count games played for the pool's teams in one grouped query
+    games_played = games_played_by_team(game, set(player.team_id for player in players))
+
+    rows = []
     for player in players:
-        print(f"Player {player.id}: score = {player.score}")
+        if player.user:
+            name = player.user.name
+        elif player.non_registered_player:
+            name = player.non_registered_player.name
+        else:
+            name = ''
 
-    team_run_totals = {}  # Create a new dictionary to store the run totals for each team
+        run_totals = team_run_totals.get(player.team_id, [])
+        rows.append({
+            'player_id': player.id,
+            'name': name,
+            'team_name': team_names.get(player.team_id, 'N/A'),
+            'games_played': games_played.get(player.team_id, 0),
+            'run_totals': frozenset(run_totals),
+            'matches': len(run_totals)
+        })
 
-    for team in teams:
-        run_totals = db.session.query(TeamGameRunTotal.run_total).filter_by(
-            team_id=team.id, 
-            game_id=game.id
-        ).all()
-        run_totals = [total[0] for total in run_totals]  # Convert list of tuples to list of integers
-        team_run_totals[team.id] = run_totals  # Store the run totals in the dictionary
-        print(f'Team {team.name} run_totals: {run_totals}')
+    return {'rows': rows}
 
-    return render_template('scorecard.html', game=game, teams=teams, players=players, team_run_totals=team_run_totals)
+
+@app.route('/game/<string:game_token>/scorecard')
+def view_scorecard(game_token):
+    game = Game.query.filter_by(token=game_token).first_or_404()
+
+    def render():
+        # Reuse the view-model until ingest or a player change bumps the game's data version
+        view = scorecard_cache.get(game.token, game.data_version)
+        if view is None:
+            view = build_scorecard_view(game)
+            scorecard_cache.set(game.token, game.data_version, view)
+
+        backfill = BackfillJob.query.filter_by(game_id=game.id).first()
+        return render_template('scorecard.html', game=game, rows=view['rows'], backfill=backfill)
+
+    etag = page_etag('scorecard', game.token, game.data_version)
+    return conditional_render(etag, game.data_updated_at, render)
 
 
 
@@ -541,7 +1359,6 @@ def add_player(game_id):
     user = User.query.filter_by(name=player_name).first()
     if user:
         player = Player(user_id=user.id, team_id=team_id, game_id=game.id)  # Add score=0 here
-        print(f"Player's game_id: {player.game_id}")
     else:
         non_registered_player = NonRegisteredPlayer(name=player_name, team_id=team_id)
         db.session.add(non_registered_player)
@@ -549,6 +1366,7 @@ def add_player(game_id):
         player = Player(non_registered_player_id=non_registered_player.id, team_id=team_id, game_id=game.id)  # Add score=0 here
 
     db.session.add(player)
+    bump_data_version([game.id])
     db.session.commit()
 
     return redirect(url_for('view_game', game_id=game.id))
@@ -564,20 +1382,23 @@ def home():
 def user_profile():
     if request.method == 'POST':
         # Update basic profile information
+        if request.form['name'] != current_user.name:
+            # Scorecards and game pages show the name; invalidate the user's games
+            bump_data_version([game_id for (game_id,) in db.session.query(Player.game_id).filter_by(user_id=current_user.id)])
         current_user.name = request.form['name']
         current_user.email = request.form['email']
         
         # Handle team selection
         team_id = request.form.get('team_id')
         if team_id and team_id != '0':
-            team = Team.query.get(team_id)
+            team = team_registry.get(team_id)
             if team:
-                current_user.team = team
+                current_user.team_id = team.id
             else:
                 flash('Invalid team selected', 'error')
                 return redirect(url_for('user_profile'))
         elif team_id == '0':
-            current_user.team = None
+            current_user.team_id = None
 
         # Check if current password and new password are provided
         current_password = request.form.get('current_password')
@@ -606,8 +1427,8 @@ def user_profile():
         return redirect(url_for('user_profile'))
 
     # Get all teams for selection
-    teams = Team.query.all()
-    return render_template('profile.html', user=current_user, teams=teams)
+    teams = team_registry.all()
+    return render_template('profile.html', user=current_user, teams=teams, user_team=team_registry.get(current_user.team_id))
 
 
 @app.route('/reset_password', methods=['GET', 'POST'])
@@ -676,12 +1497,11 @@ def google_auth():
         )
         
         session['state'] = state
-        print(f"Google OAuth redirect URI: {flow.redirect_uri}")
-        print(f"Authorization URL: {authorization_url}")
+        auth_logger.debug("Google OAuth redirect URI: %s", flow.redirect_uri)
         return redirect(authorization_url)
         
     except Exception as e:
-        print(f"Error in Google OAuth: {e}")
+        auth_logger.error("Error in Google OAuth: %s", e)
         flash('Failed to initialize Google OAuth. Please try again.', 'error')
         return redirect(url_for('login'))
 
@@ -689,7 +1509,7 @@ def google_auth():
 @app.route('/auth/google/callback')
 def google_callback():
     try:
-        print("=== Google OAuth Callback Started ===")
+        auth_logger.debug("Google OAuth callback started")
         
         # Check if required environment variables are set
         client_id = os.getenv('GOOGLE_CLIENT_ID')
@@ -697,12 +1517,10 @@ def google_callback():
         redirect_uri = os.getenv('GOOGLE_REDIRECT_URI')
         
         if not all([client_id, client_secret, redirect_uri]):
-            print("Missing environment variables")
+            auth_logger.error("Google OAuth environment variables are missing")
             flash('Google OAuth configuration is incomplete. Please check your environment variables.', 'error')
             return redirect(url_for('login'))
         
-        print(f"Environment variables loaded successfully")
-        
         flow = Flow.from_client_config(
             {
                 "web": {
@@ -719,79 +1537,52 @@ def google_callback():
         # Set the redirect URI explicitly
         flow.redirect_uri = redirect_uri
         
-        print(f"Callback redirect URI: {flow.redirect_uri}")
-        print(f"Request URL: {request.url}")
+        auth_logger.debug("Callback redirect URI: %s", flow.redirect_uri)
         
-        print("Fetching token from authorization response...")
         flow.fetch_token(authorization_response=request.url)
-        print("Token fetched successfully")
         
         # Get user info from Google
-        print("Verifying OAuth token...")
         id_info = id_token.verify_oauth2_token(
             flow.credentials.id_token, 
             requests.Request(), 
             client_id
         )
-        print(f"Token verified. User info: {id_info}")
         
         email = id_info['email']
         name = id_info.get('name', email.split('@')[0])
         
-        print(f"Processing user: {name} ({email})")
-        
         # Check if user already exists
-        print("Checking if user exists in database...")
         user = User.query.filter_by(email=email).first()
         
         if user:
-            print(f"User exists: {user.name} (ID: {user.id})")
             # User exists, log them in
             login_user(user)
-            print("User logged in successfully")
+            auth_logger.info("Google login for user %s", user.id)
             flash(f'Welcome, {user.name}!', 'success')
         else:
-            print("User does not exist, creating new user...")
             # Create new user
             try:
-                print("Creating User object...")
                 user = User(
                     name=name,
                     email=email,
                     password=bcrypt.generate_password_hash(secrets.token_urlsafe(32)).decode('utf-8')
                 )
-                print(f"User object created: {user}")
-                print(f"User attributes - name: {user.name}, email: {user.email}, password length: {len(user.password)}")
-                
-                print("Adding user to database session...")
                 db.session.add(user)
-                print("User added to session")
-                
-                print("Committing to database...")
                 db.session.commit()
-                print(f"User committed to database. New user ID: {user.id}")
                 
-                print("Logging in user...")
                 login_user(user)
-                print("New user logged in successfully")
+                auth_logger.info("Created and logged in Google user %s", user.id)
                 flash(f'Welcome, {user.name}!', 'success')
                 
             except Exception as user_creation_error:
-                print(f"Error creating user: {user_creation_error}")
-                print(f"Error type: {type(user_creation_error).__name__}")
-                import traceback
-                print(f"User creation traceback: {traceback.format_exc()}")
+                auth_logger.exception("Error creating user: %s", user_creation_error)
                 db.session.rollback()
                 raise user_creation_error
         
-        print("Redirecting to dashboard...")
         return redirect(url_for('dashboard'))
         
     except Exception as e:
-        print(f"=== Google OAuth callback error: {e} ===")
-        print(f"Error type: {type(e).__name__}")
-        import traceback
-        print(f"Full traceback: {traceback.format_exc()}")
+        auth_logger.exception("Google OAuth callback error: %s", e)
         flash('Google authentication failed. Please try again.', 'error')
         return redirect(url_for('login'))
 
@@ -802,6 +1593,7 @@ def delete_player(game_id, player_id):
     player = Player.query.get_or_404(player_id)
     if player.game_id == game_id:
         db.session.delete(player)
+        bump_data_version([game_id])
         db.session.commit()
     return redirect(url_for('view_game', game_id=game_id))
 
@@ -816,6 +1608,8 @@ def delete_game(game_id):
 
     # Delete all TeamGameRunTotal instances associated with the game
     TeamGameRunTotal.query.filter_by(game_id=game.id).delete()
+    TeamCoverage.query.filter_by(game_id=game.id).delete()
+    BackfillJob.query.filter_by(game_id=game.id).delete()
 
     db.session.delete(game)
     db.session.commit()
@@ -854,10 +1648,10 @@ def manual_update_scorecard(game_id):
         if not game:
             return f"Game {game_id} not found", 404
         
-        print(f"Manually updating scorecard for game {game_id} ({game.pool_name})")
+        scorecard_logger.info("Manually updating scorecard for game %s (%s)", game_id, game.pool_name)
         
         # Update the scorecard
-        update_scorecard()
+        update_scorecard([game_id])
         
         # Get the updated run totals
         run_totals = TeamGameRunTotal.query.filter_by(game_id=game_id).all()
@@ -883,10 +1677,10 @@ def manual_update_scorecard(game_id):
 def manual_update_all_scorecards():
     """Manually trigger scorecard update for all games"""
     try:
-        print("Manually updating scorecards for all games")
+        scorecard_logger.info("Manually updating scorecards for all games")
         
-        # Update all scorecards
-        update_scorecard()
+        # Rebuild all scorecards from every stored result
+        update_scorecard(full=True)
         
         # Get count of all run totals
         total_run_totals = TeamGameRunTotal.query.count()
@@ -908,10 +1702,14 @@ def test_gamescores(game_id, date):
     # Convert the date string to a datetime.date object
     date = datetime.strptime(date, '%Y-%m-%d').date()
 
-    # Fetch all GameScore instances for the given game_id and date
-    gamescores = GameScore.query.filter_by(game_id=game_id, date=date).all()
+    # Fetch the MLB results the given game counts on this date
+    game = Game.query.get_or_404(game_id)
+    gamescores = MLBGameResult.query.filter(
+        MLBGameResult.in_pool_window(game.start_date, game.end_date),
+        MLBGameResult.date == date
+    ).all()
 
-    # Create a string representation of each GameScore
+    # Create a string representation of each result
     gamescore_strings = [f'Team ID: {gamescore.team_id}, Score: {gamescore.score}, Date: {gamescore.date}' for gamescore in gamescores]
 
     # Join all the strings with newline characters and return the result
@@ -922,10 +1720,15 @@ def test_gamescored(game_id, team_id, date):
     # Convert the date string to a datetime.date object
     date = datetime.strptime(date, '%Y-%m-%d').date()
 
-    # Fetch all GameScore instances for the given game_id, team_id and date
-    gamescores = GameScore.query.filter_by(game_id=game_id, team_id=team_id, date=date).all()
+    # Fetch the MLB results the given game counts for this team on this date
+    game = Game.query.get_or_404(game_id)
+    gamescores = MLBGameResult.query.filter(
+        MLBGameResult.in_pool_window(game.start_date, game.end_date),
+        MLBGameResult.team_id == team_id,
+        MLBGameResult.date == date
+    ).all()
 
-    # Create a string representation of each GameScore
+    # Create a string representation of each result
     gamescore_strings = [f'Team ID: {gamescore.team_id}, Score: {gamescore.score}, Date: {gamescore.date}' for gamescore in gamescores]
 
     # Join all the strings with newline characters and return the result
@@ -937,10 +1740,10 @@ def test_team_gamescores(team_id, date):
     # Convert the date string to a datetime.date object
     date = datetime.strptime(date, '%Y-%m-%d').date()
 
-    # Fetch all GameScore instances for the given team_id and date
-    gamescores = GameScore.query.filter_by(team_id=team_id, date=date).all()
+    # Fetch all MLB results for the given team_id and date
+    gamescores = MLBGameResult.query.filter_by(team_id=team_id, date=date).all()
 
-    # Create a string representation of each GameScore
+    # Create a string representation of each result
     gamescore_strings = [f'Team ID: {gamescore.team_id}, Score: {gamescore.score}, Date: {gamescore.date}' for gamescore in gamescores]
 
     # Join all the strings with newline characters and return the result
@@ -948,11 +1751,15 @@ def test_team_gamescores(team_id, date):
 
 @app.route('/test_gamescore_count/<int:game_id>/<int:team_id>')
 def test_gamescore_count(game_id, team_id):
-    # Count all GameScore instances for the given game_id and team_id
-    gamescore_count = GameScore.query.filter_by(game_id=game_id, team_id=team_id).count()
+    # Count all MLB results the given game counts for this team
+    game = Game.query.get_or_404(game_id)
+    gamescore_count = MLBGameResult.query.filter(
+        MLBGameResult.in_pool_window(game.start_date, game.end_date),
+        MLBGameResult.team_id == team_id
+    ).count()
 
     # Return the count
-    return f'Number of GameScore instances for game ID {game_id} and team ID {team_id}: {gamescore_count}'
+    return f'Number of MLB results for game ID {game_id} and team ID {team_id}: {gamescore_count}'
 
 
 @app.route('/test_oauth_config')
@@ -1028,8 +1835,8 @@ def test_mlb_api():
 def test_mlb_api_date(date):
     """Test MLB API with a specific date (format: MM/DD/YYYY)"""
     try:
-        # Test the statsapi.schedule function with the specified date
-        mlb_schedule = statsapi.schedule(date=date, sportId=1)
+        # Test the statsapi.schedule function with the specified date, through the schedule cache
+        mlb_schedule = get_schedule(date)
         
         if mlb_schedule:
             # Get some sample game data
@@ -1065,6 +1872,12 @@ def test_mlb_api_date(date):
         }
 
 
+@app.route('/test_schedule_cache')
+def test_schedule_cache():
+    """Report the on-disk schedule cache hit/miss counters and size"""
+    return schedule_cache.stats()
+
+
 @app.route('/test_get_final_scores/<date>/<int:game_id>')
 def test_get_final_scores(date, game_id):
     """Test the get_final_scores function with a specific date and game ID"""
@@ -1081,7 +1894,7 @@ def test_get_final_scores(date, game_id):
             'scores': [
                 {
                     'team_id': score.team_id,
-                    'game_id': score.game_id,
+                    'game_id': game_id,
                     'api_game_id': score.api_game_id,
                     'score': score.score,
                     'date': score.date.isoformat() if score.date else None,
@@ -1129,306 +1942,944 @@ app.jinja_env.filters['display_score'] = display_score
 ## UPDATE PLAYER SCORE SECTION
 # This function should be called after fetching and processing MLB game scores.
 
-def update_player_scores():
-    print("Updating player scores")
-    
-    try:
-        # Get all players
-        players = Player.query.all()
+def update_player_scores(game_ids=None):
+    """
+    Recount the score of every player in an active pool, or in the given games.
 
-        # Loop through each player
-        for player in players:
-            try:
-                # Print the player's score before the update
-                print(f"Before update: Player {player.id}: score = {player.score}")
-                
-                # Get the player's team and game
-                team = player.team
-                game = player.game
+    A player's score is the number of distinct 0-13 run totals their team has
+    reached since the pool started, i.e. the popcount of its TeamCoverage mask.
+    All masks come from one query and the changed scores are written back with
+    one bulk UPDATE per table. Run update_scorecard() first.
 
-                # Get all unique final scores of the player's team since the start of the game
-                gamescores = GameScore.query.filter(
-                    GameScore.team_id == team.id, 
-                    GameScore.game_id == game.id, 
-                    GameScore.date >= game.start_date
-                ).all()
-                unique_scores = set(gamescore.score for gamescore in gamescores)
-
-                # Calculate the player's score
-                new_score = len(unique_scores)
-
-                # If the player is a registered user, update the score in the Player model
-                if player.user_id is not None:
-                    player.score = new_score
-                # If the player is a non-registered user, update the score in the NonRegisteredPlayer model
-                elif player.non_registered_player_id is not None:
-                    non_registered_player = NonRegisteredPlayer.query.get(player.non_registered_player_id)
-                    if non_registered_player:
-                        non_registered_player.score = new_score
-
-                # Print the player's score after the update
-                print(f"After update: Player {player.id}: score = {new_score}")
+    Database errors are rolled back and re-raised, so the nightly job records the run as failed.
 
-            except Exception as e:
-                print(f"Error updating player {player.id}: {e}")
-                continue
+    Returns:
+        int number of player scores that changed
+    """
+    scorecard_logger.debug("Updating player scores")
+
+    try:
+        rows = db.session.query(
+            Player.game_id,
+            Player.id,
+            Player.user_id,
+            Player.non_registered_player_id,
+            Player.score,
+            NonRegisteredPlayer.score,
+            TeamCoverage.run_mask
+        ).join(
+            Game, Game.id == Player.game_id
+        ).outerjoin(
+            NonRegisteredPlayer, NonRegisteredPlayer.id == Player.non_registered_player_id
+        ).outerjoin(
+            TeamCoverage, db.and_(
+                TeamCoverage.game_id == Player.game_id,
+                TeamCoverage.team_id == Player.team_id
+            )
+        ).filter(
+            Game.status == "active" if game_ids is None else Game.id.in_(game_ids)
+        ).all()
+
+        player_updates = []
+        non_registered_updates = []
+        changed_games = set()
+        for game_id, player_id, user_id, non_registered_player_id, player_score, non_registered_score, run_mask in rows:
+            # The score is the popcount of the team's run coverage mask
+            new_score = (run_mask or 0).bit_count()
+
+            # If the player is a registered user, update the score in the Player model
+            if user_id is not None:
+                if player_score != new_score:
+                    player_updates.append({'id': player_id, 'score': new_score})
+                    changed_games.add(game_id)
+            # If the player is a non-registered user, update the score in the NonRegisteredPlayer model
+            elif non_registered_player_id is not None:
+                if non_registered_score != new_score:
+                    non_registered_updates.append({'id': non_registered_player_id, 'score': new_score})
+                    changed_games.add(game_id)
+
+        if player_updates:
+            db.session.bulk_update_mappings(Player, player_updates)
+        if non_registered_updates:
+            db.session.bulk_update_mappings(NonRegisteredPlayer, non_registered_updates)
+        bump_data_version(changed_games)
 
         # Commit all changes at once
         db.session.commit()
-        print("Successfully committed all player score changes to database.")
+        scorecard_logger.info("Updated %d of %d player scores", len(player_updates) + len(non_registered_updates), len(rows))
+        return len(player_updates) + len(non_registered_updates)
         
     except Exception as e:
-        print(f"Failed to update player scores: {e}")
+        scorecard_logger.error("Failed to update player scores: %s", e)
         db.session.rollback()
+        raise
 
 
-def update_scorecard():
-    print("Updating scorecard")
+def dialect_insert(table):
+    """Build an INSERT for ``table`` that supports ON CONFLICT clauses (SQLite and PostgreSQL)."""
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        return postgresql.insert(table)
+    if dialect == 'sqlite':
+        return sqlite.insert(table)
+    raise NotImplementedError(f"Unsupported database dialect: {dialect}")
 
-    # Get all games
-    games = Game.query.all()
 
-    # Loop through each game
-    for game in games:
-        try:
-            # Get existing GameScore records for this game that haven't been processed yet
-            # We'll process all GameScores that don't have corresponding TeamGameRunTotal records
-            existing_gamescores = GameScore.query.filter_by(game_id=game.id).all()
-            
-            if existing_gamescores:
-                print(f"Processing {len(existing_gamescores)} existing GameScores for game {game.id}")
-
-                # Loop through each existing score
-                for gamescore in existing_gamescores:
-                    print(f"Processing GameScore: {gamescore}, team_id: {gamescore.team_id}, score: {gamescore.score}")
-
-                    # Check if the score is not already in the game's run_totals
-                    existing_score = TeamGameRunTotal.query.filter_by(
-                        team_id=gamescore.team_id, 
-                        game_id=game.id, 
-                        run_total=gamescore.score
-                    ).first()
-                    
-                    if existing_score is None:
-                        # Create new TeamGameRunTotal record
-                        team_game_run_total = TeamGameRunTotal(
-                            team_id=gamescore.team_id, 
-                            game_id=game.id, 
-                            run_total=gamescore.score
-                        )
-                        print(f"Adding new run total {gamescore.score} for team_id {gamescore.team_id} in game {game.id}")
-                        db.session.add(team_game_run_total)
-                    else:
-                        print(f"Run total {gamescore.score} for team_id {gamescore.team_id} in game {game.id} already exists")
-            else:
-                print(f"No GameScores found for game {game.id}")
+def insert_ignoring_conflicts(table):
+    """Build an INSERT for ``table`` that skips rows violating a unique constraint (SQLite and PostgreSQL)."""
+    return dialect_insert(table).on_conflict_do_nothing()
 
-        except Exception as e:
-            print(f"Error processing game {game.id}: {e}")
-            continue
 
-    # Commit all changes at once
-    try:
-        db.session.commit()
-        print("Successfully committed changes to database for updating scorecard.")
-    except Exception as e:
-        print(f"Failed to update scorecard changes to database: {e}")
-        db.session.rollback()
+# How far (in result ids) below the scorecard watermark a missing id is still waited for. A
+# transaction that took an id commits within seconds; ids that never appear (rollbacks, replaced
+# provisional rows) are dropped once this far behind
+SCORECARD_LATE_COMMIT_IDS = int(os.getenv('SCORECARD_LATE_COMMIT_IDS', '500'))
 
 
-def validate_gamescore_data(team_id, game_id, score, date):
-    
-    # Check if team_id is not None and is an integer
+def update_scorecard(game_ids=None, full=False):
+    """
+    Record every 0-13 run total each team has reached in each pool.
 
-    if not isinstance(team_id, int):
-        return False, "Invalid team_id"
+    Three set-based statements, however many pools are active: one query
+    finds the pools the new results change, then two upserts write them.
+    team_game_run_totals keeps the earliest date each run total was reached
+    (the tiebreakers need it), and team_coverage ORs the run totals into each
+    team's mask.
 
-    # Check if game_id is not None and is an integer
+    By default only MLB results ingested since the last run (tracked by the
+    'scorecard' IngestWatermark) are folded into the active pools, along with
+    any ids below the watermark that committed late. Passing game_ids or
+    full=True re-examines every stored result instead.
 
-    if not isinstance(game_id, int):
-        return False, "Invalid game_id"
+    Database errors are rolled back and re-raised; the watermark only moves on success.
 
-    # Check if score is not None and is an integer
+    Args:
+        game_ids: Limit the update to these games, rebuilding them in full
+        full: Re-examine every stored result for every active Game (repair)
 
-    if not isinstance(score, int):
-        return False, "Invalid score"
+    Returns:
+        set of game ids whose run coverage changed
+    """
+    scorecard_logger.debug("Updating scorecard")
+
+    # Pin the upper bound so results ingested while we run are picked up next time. Only
+    # final rows move it: provisional rows are replaced on promotion, and SQLite may reuse
+    # their ids for the final rows when they were the newest
+    high_water = db.session.query(db.func.max(MLBGameResult.id)).filter(
+        MLBGameResult.final.is_(True)
+    ).scalar() or 0
+    incremental = game_ids is None and not full
+
+    pool_results = [MLBGameResult.id <= high_water]
+    if game_ids is None:
+        pool_results.append(Game.status == "active")
+    else:
+        pool_results.append(Game.id.in_(game_ids))
+
+    if incremental:
+        # Ids are taken at insert, not at commit: on PostgreSQL a backfill can commit id N after
+        # the nightly run committed N+1 and moved the watermark past it. Ids missing below the
+        # watermark stay pending, and are looked for again, until SCORECARD_LATE_COMMIT_IDS old
+        last_id = IngestWatermark.get_last_id('scorecard')
+        horizon = high_water - SCORECARD_LATE_COMMIT_IDS
+        pending_ids = set(pending_id for pending_id in IngestWatermark.get_pending_ids('scorecard') if pending_id > horizon)
+        new_from = max(last_id, horizon)
+        present = set(result_id for (result_id,) in db.session.query(MLBGameResult.id).filter(
+            db.or_(MLBGameResult.id.between(new_from + 1, high_water), MLBGameResult.id.in_(pending_ids))
+        ))
+        late_ids = pending_ids & present
+        pending_ids = (pending_ids | set(range(new_from + 1, high_water + 1))) - present
+
+        if last_id >= high_water and not late_ids:
+            scorecard_logger.info("No new MLB results since the last scorecard update")
+            return set()
+        pool_results.append(db.or_(MLBGameResult.id > last_id, MLBGameResult.id.in_(late_ids)))
+
+    # The earliest date each pool/team reached each 0-13 run total in this batch
+    batch = db.select(
+        Game.id.label('game_id'),
+        MLBGameResult.team_id.label('team_id'),
+        MLBGameResult.score.label('run_total'),
+        db.func.min(MLBGameResult.date).label('first_date')
+    ).join_from(
+        MLBGameResult, Game, MLBGameResult.in_pool_window(Game.start_date, Game.end_date)
+    ).where(
+        *pool_results,
+        MLBGameResult.score.between(RUN_TOTALS.start, RUN_TOTALS.stop - 1)
+    ).group_by(
+        Game.id, MLBGameResult.team_id, MLBGameResult.score
+    ).subquery('batch')
+
+    run_totals = TeamGameRunTotal.__table__
+    coverage = TeamCoverage.__table__
+
+    # Pools where the batch reaches a run total for the first time, or earlier than recorded
+    changed_games = db.select(batch.c.game_id).outerjoin(
+        run_totals, db.and_(
+            run_totals.c.game_id == batch.c.game_id,
+            run_totals.c.team_id == batch.c.team_id,
+            run_totals.c.run_total == batch.c.run_total
+        )
+    ).where(
+        db.or_(
+            run_totals.c.id.is_(None),
+            run_totals.c.first_date.is_(None),
+            batch.c.first_date < run_totals.c.first_date
+        )
+    ).distinct()
+
+    # The WHERE keeps SQLite from reading ON CONFLICT as a join constraint
+    record_run_totals = dialect_insert(run_totals).from_select(
+        ['game_id', 'team_id', 'run_total', 'first_date'],
+        db.select(batch.c.game_id, batch.c.team_id, batch.c.run_total, batch.c.first_date).where(db.true())
+    )
+    record_run_totals = record_run_totals.on_conflict_do_update(
+        index_elements=['team_id', 'game_id', 'run_total'],
+        set_={'first_date': record_run_totals.excluded.first_date},
+        where=db.or_(
+            run_totals.c.first_date.is_(None),
+            record_run_totals.excluded.first_date < run_totals.c.first_date
+        )
+    )
+
+    # Run totals are distinct within a pool/team, so summing their bits ORs them
+    fold_coverage = dialect_insert(coverage).from_select(
+        ['game_id', 'team_id', 'run_mask'],
+        db.select(
+            batch.c.game_id, batch.c.team_id, db.func.sum(db.literal(1).op('<<')(batch.c.run_total))
+        ).group_by(batch.c.game_id, batch.c.team_id)
+    )
+    merged_mask = coverage.c.run_mask.op('|')(fold_coverage.excluded.run_mask)
+    fold_coverage = fold_coverage.on_conflict_do_update(
+        index_elements=['game_id', 'team_id'],
+        set_={'run_mask': merged_mask},
+        where=merged_mask != coverage.c.run_mask
+    )
 
-    # Check if date is not None and is a datetime.date instance
+    try:
+        changed = set(db.session.execute(changed_games).scalars())
+        recorded = db.session.execute(record_run_totals).rowcount
+        db.session.execute(fold_coverage)
+        bump_data_version(changed)
+        if incremental:
+            IngestWatermark.advance('scorecard', high_water, pending_ids)
+        elif game_ids is None:
+            IngestWatermark.advance('scorecard', high_water)
+        db.session.commit()
+        scorecard_logger.info("Recorded %d run totals; coverage changed in %d games", recorded, len(changed))
+        return changed
+    except Exception as e:
+        scorecard_logger.error("Failed to update scorecard changes to database: %s", e)
+        db.session.rollback()
+        raise
 
-    if not isinstance(date, datetime):
-        return False, "Invalid date"
 
-    return True, "Valid data"
+@app.cli.command('rebuild-scorecard')
+def rebuild_scorecard_command():
+    """Re-examine every stored MLB result for every active pool."""
+    changed = update_scorecard(full=True)
+    print(f"Scorecard rebuilt: run coverage changed for {len(changed)} games.")
 
 
 import statsapi
 import schedule
 import time
+import sqlite3
+import zlib
 from datetime import datetime, timedelta
 
 
+## SCHEDULE CACHE SECTION
+# statsapi.schedule responses are cached on disk by date. A date whose games have
+# all finished never changes again, so it is served from disk from then on.
+
+# statsapi detailed states, matched on the prefix so variants like "Completed Early: Rain" count
+FINAL_GAME_STATUSES = {'Final', 'Game Over', 'Completed Early'}
+PREGAME_STATUSES = {'Scheduled', 'Pre-Game', 'Warmup', 'Delayed Start'}
+OFF_GAME_STATUSES = {'Postponed', 'Cancelled', 'Suspended'}
+
+# Game statuses after which a schedule entry no longer changes
+SETTLED_GAME_STATUSES = FINAL_GAME_STATUSES | OFF_GAME_STATUSES
+
+
+class ScheduleCache:
+    """
+    Date-keyed SQLite store of zlib-compressed statsapi.schedule responses.
+
+    Dates whose games are all settled are kept until evicted; dates that still
+    have live or upcoming games are refetched once they are older than ttl seconds.
+    """
+
+    def __init__(self, path, ttl=300, max_entries=1000):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS schedule_response ('
+                'date TEXT PRIMARY KEY, payload BLOB NOT NULL, settled INTEGER NOT NULL, '
+                'fetched_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that commits (or rolls back) and closes when the block exits."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(date):
+        return datetime.strptime(date, '%m/%d/%Y').date().isoformat()
+
+    @staticmethod
+    def is_settled(date, mlb_schedule):
+        """A date is settled once every game on it has finished, or it is past and had no games."""
+        if not mlb_schedule:
+            return datetime.strptime(date, '%m/%d/%Y').date() < datetime.now().date()
+        return all(
+            (mlb_game.get('status') or '').split(':')[0].strip() in SETTLED_GAME_STATUSES
+            for mlb_game in mlb_schedule
+        )
+
+    def get(self, date, max_age=None):
+        """
+        Return the cached schedule for a date (MM/DD/YYYY), or None if it is missing or stale.
+
+        Args:
+            date: The MLB schedule date, formatted MM/DD/YYYY
+            max_age: Seconds an unsettled date stays fresh, instead of the cache ttl
+        """
+        key = self._key(date)
+        now = time.time()
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                'SELECT payload, settled, fetched_at FROM schedule_response WHERE date = ?', (key,)
+            ).fetchone()
+            if row is None or (not row[1] and now - row[2] > max_age):
+                self.misses += 1
+                return None
+
+            conn.execute('UPDATE schedule_response SET accessed_at = ? WHERE date = ?', (now, key))
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def set(self, date, mlb_schedule):
+        """Store a date's schedule, evicting the least recently used dates beyond max_entries."""
+        payload = zlib.compress(json.dumps(mlb_schedule).encode('utf-8'))
+        settled = self.is_settled(date, mlb_schedule)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO schedule_response (date, payload, settled, fetched_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (self._key(date), payload, int(settled), now, now)
+            )
+            conn.execute(
+                'DELETE FROM schedule_response WHERE date NOT IN '
+                '(SELECT date FROM schedule_response ORDER BY accessed_at DESC LIMIT ?)',
+                (self.max_entries,)
+            )
+
+    def stats(self):
+        with self._lock, self._connect() as conn:
+            entries, settled, size = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(settled), 0), COALESCE(SUM(LENGTH(payload)), 0) '
+                'FROM schedule_response'
+            ).fetchone()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': entries,
+            'settled_entries': settled,
+            'payload_bytes': size,
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl
+        }
+
+
+schedule_cache = ScheduleCache(
+    os.getenv('SCHEDULE_CACHE_PATH', os.path.join(app.instance_path, 'schedule_cache.db')),
+    ttl=int(os.getenv('SCHEDULE_CACHE_TTL', '300')),
+    max_entries=int(os.getenv('SCHEDULE_CACHE_SIZE', '1000'))
+)
+
+
+def get_schedule(date, max_age=None):
+    """Return statsapi.schedule for a date (MM/DD/YYYY), from the on-disk cache when it is fresh."""
+    mlb_schedule = schedule_cache.get(date, max_age=max_age)
+    if mlb_schedule is None:
+        mlb_schedule = statsapi.schedule(date=date, sportId=1)
+        schedule_cache.set(date, mlb_schedule)
+    return mlb_schedule
+
+
+@app.cli.command('prime-schedule-cache')
+@click.argument('start_date')
+@click.argument('end_date')
+def prime_schedule_cache_command(start_date, end_date):
+    """Cache every schedule date from START_DATE to END_DATE (MM/DD/YYYY) with one API call."""
+    mlb_schedule = statsapi.schedule(start_date=start_date, end_date=end_date, sportId=1)
+
+    games_by_date = {}
+    for mlb_game in mlb_schedule:
+        game_date = datetime.strptime(mlb_game['game_date'], '%Y-%m-%d').strftime('%m/%d/%Y')
+        games_by_date.setdefault(game_date, []).append(mlb_game)
+
+    # Days without games are cached too, so backfills skip them
+    day = datetime.strptime(start_date, '%m/%d/%Y').date()
+    last_day = datetime.strptime(end_date, '%m/%d/%Y').date()
+    primed = 0
+    while day <= last_day:
+        schedule_date = day.strftime('%m/%d/%Y')
+        schedule_cache.set(schedule_date, games_by_date.get(schedule_date, []))
+        primed += 1
+        day += timedelta(days=1)
+
+    print(f"Primed schedule cache with {primed} dates ({len(mlb_schedule)} games).")
+
+
+# One team's score in one regular-season MLB game
+TeamScore = namedtuple('TeamScore', ['api_game_id', 'game_datetime', 'team_id', 'score'])
+
+REGULAR_SEASON_GAME_TYPE = 'R'
+
+
+def game_state(status):
+    """Classify a statsapi game status as 'final', 'pregame', 'off' or 'live'."""
+    status = (status or '').split(':')[0].strip()
+    if status in FINAL_GAME_STATUSES:
+        return 'final'
+    if status in PREGAME_STATUSES:
+        return 'pregame'
+    if status in OFF_GAME_STATUSES:
+        return 'off'
+    return 'live'  # In Progress, Manager challenge, Delayed, Review, ...
+
+
+def is_final_status(status):
+    return game_state(status) == 'final'
+
+
+def parse_game_scores(mlb_schedule, state):
+    """
+    Parse a statsapi schedule into one score record per team per regular-season MLB game.
+
+    Reads the structured id, score, status and game type fields rather than the summary
+    string, so doubleheaders, postponements and renamed teams need no special handling.
+
+    Args:
+        mlb_schedule: The list returned by statsapi.schedule()
+        state: Only parse games in this game_state(), 'final' or 'live'
+
+    Returns:
+        list of TeamScore records
+    """
+    parsed = []
+
+    for mlb_game in mlb_schedule:
+        # Spring training, exhibition and postseason games don't count
+        if mlb_game.get('game_type') != REGULAR_SEASON_GAME_TYPE or game_state(mlb_game.get('status')) != state:
+            continue
+
+        try:
+            api_game_id = int(mlb_game['game_id'])
+            game_datetime = datetime.strptime(mlb_game['game_datetime'], '%Y-%m-%dT%H:%M:%SZ')
+            away_score = int(mlb_game['away_score'])
+            home_score = int(mlb_game['home_score'])
+        except (KeyError, TypeError, ValueError) as e:
+            ingest_logger.warning("Could not parse MLB game %s: %s", mlb_game.get('game_id'), e, extra={'sample_key': 'unparsed_game'})
+            continue
+
+        # Resolve the Team ids by MLB team id, falling back to the full name
+        away_id = team_registry.id_for_mlb_id(mlb_game.get('away_id')) or team_registry.id_for_full_name(mlb_game.get('away_name'))
+        home_id = team_registry.id_for_mlb_id(mlb_game.get('home_id')) or team_registry.id_for_full_name(mlb_game.get('home_name'))
+
+        if away_id is None or home_id is None:
+            ingest_logger.warning(
+                "Could not find team(s) in database: %s, %s", mlb_game.get('away_name'), mlb_game.get('home_name'),
+                extra={'sample_key': 'unknown_team'}
+            )
+            continue
+
+        parsed.append(TeamScore(api_game_id, game_datetime, away_id, away_score))
+        parsed.append(TeamScore(api_game_id, game_datetime, home_id, home_score))
+
+    return parsed
+
+
+def parse_final_scores(mlb_schedule):
+    """Parse the final regular-season games of a statsapi schedule into TeamScore records."""
+    return parse_game_scores(mlb_schedule, 'final')
+
+
+def fetch_final_scores(date):
+    """
+    Fetch the MLB schedule for a date (MM/DD/YYYY) once and parse its final scores.
+
+    Upstream errors are logged and re-raised: an empty list always means the date
+    really has no final scores, so callers never record a failed fetch as done.
+    """
+    try:
+        mlb_schedule = get_schedule(date)
+    except Exception as e:
+        ingest_logger.error("Error fetching MLB schedule for %s: %s", date, e)
+        raise
+
+    # Check if there are any games scheduled for the specified date
+    if not mlb_schedule:
+        ingest_logger.info("No games scheduled for %s", date)
+        return []
+
+    return parse_final_scores(mlb_schedule)
+
+
+def ingest_final_scores(date, parsed_scores=None):
+    """
+    Fetch a date's MLB results once and store them in the shared result table.
+
+    Pools read these rows through their start-date window, so the nightly write
+    set is one row per team per MLB game however many pools are active.
+
+    Args:
+        date: The MLB schedule date, formatted MM/DD/YYYY
+        parsed_scores: The date's fetch_final_scores() records, if already fetched
+
+    Re-running a date that is already stored costs one read and no writes.
+
+    Provisional rows stored by the live poller are replaced by new final rows rather
+    than updated in place, so their ids are past the 'scorecard' watermark.
+
+    A failed write is rolled back and re-raised, so callers never count the date as stored.
+
+    Returns:
+        list of dicts for the new mlb_game_result rows written
+    """
+    if parsed_scores is None:
+        parsed_scores = fetch_final_scores(date)
+    if not parsed_scores:
+        return []
+
+    date_obj = datetime.strptime(date, '%m/%d/%Y').date()
+
+    # Load the keys already stored for the date's MLB games in one query and dedupe in memory
+    api_game_ids = set(parsed.api_game_id for parsed in parsed_scores)
+    existing = set()
+    provisional = set()
+    for api_game_id, team_id, final in db.session.query(
+        MLBGameResult.api_game_id, MLBGameResult.team_id, MLBGameResult.final
+    ).filter(MLBGameResult.api_game_id.in_(api_game_ids)).all():
+        (existing if final else provisional).add((api_game_id, team_id))
+
+    results = []
+    for parsed in parsed_scores:
+        key = (parsed.api_game_id, parsed.team_id)
+        if key in existing:
+            continue
+
+        existing.add(key)
+        results.append({
+            'api_game_id': parsed.api_game_id,
+            'team_id': parsed.team_id,
+            'score': parsed.score,
+            'date': date_obj,
+            'game_datetime': parsed.game_datetime,
+            'final': True
+        })
+
+    # Write every new result in a single bulk insert; rows a concurrent ingest
+    # stored since the read above are skipped by the unique constraint
+    if results:
+        try:
+            if provisional:
+                # Promote live scores to final by replacing their provisional rows
+                db.session.query(MLBGameResult).filter(
+                    MLBGameResult.final.is_(False),
+                    MLBGameResult.api_game_id.in_(set(api_game_id for api_game_id, team_id in provisional))
+                ).delete(synchronize_session=False)
+            db.session.execute(insert_ignoring_conflicts(MLBGameResult.__table__), results)
+            # Games played changes for every pool whose window covers the new results
+            bump_data_version(results=results)
+            db.session.commit()
+            ingest_logger.info("Stored %d new MLB results for %s", len(results), date)
+        except Exception as e:
+            ingest_logger.error("Failed to commit MLB result changes: %s", e)
+            db.session.rollback()
+            raise
+
+    return results
+
+
 def get_final_scores(date, game_id):
-    print(f"get_final_scores called with date={date} and game_id={game_id}")
-    print(f"Fetching scores for {date}")
-    
+    ingest_logger.debug("get_final_scores called with date=%s and game_id=%s", date, game_id)
+
     if game_id is None:
-        print("Error: game_id is None")
+        ingest_logger.error("get_final_scores called without a game_id")
         return []
 
-    # Get the game ID and start_date of the 13 Run Pool game
     game = Game.query.get(game_id)
     if not game:
-        print(f"Error: Game with ID {game_id} not found")
+        ingest_logger.error("Game with ID %s not found", game_id)
         return []
-        
-    game_start_date = game.start_date
-    print(f"Game ID: {game_id}")
-    print(f"Game start date: {game_start_date}")
 
-    # Get the schedule for the specified date
+    ingest_final_scores(date)
+
+    # Return the results for this date that count towards the game
+    date_obj = datetime.strptime(date, '%m/%d/%Y').date()
+    return MLBGameResult.query.filter(
+        MLBGameResult.in_pool_window(game.start_date, game.end_date),
+        MLBGameResult.date == date_obj
+    ).all()
+
+
+## LIVE SCORES SECTION
+# While MLB games are in progress their scores are polled and stored as provisional
+# (final=False) results. Once a game is final its results are promoted and folded into
+# the pools. Upstream calls scale with live games: with nothing in progress the poller
+# sleeps until the next first pitch, or until tomorrow.
+
+LIVE_POLL_SECONDS = int(os.getenv('LIVE_POLL_SECONDS', '60'))
+
+live_poll_state = {'next_poll_at': None}  # UTC; None polls on the next tick
+
+
+def ingest_live_scores(date, mlb_schedule):
+    """
+    Store the current scores of a date's in-progress games as provisional results.
+
+    Provisional rows of games that were postponed, suspended or cancelled after
+    going live are deleted, since those games never go final on this date.
+
+    Args:
+        date: The MLB schedule date, formatted MM/DD/YYYY
+        mlb_schedule: The list returned by statsapi.schedule() for that date
+
+    Returns:
+        int number of provisional rows written
+    """
+    live_scores = parse_game_scores(mlb_schedule, 'live')
+    off_game_ids = set()
+    for mlb_game in mlb_schedule:
+        if game_state(mlb_game.get('status')) == 'off':
+            try:
+                off_game_ids.add(int(mlb_game['game_id']))
+            except (KeyError, TypeError, ValueError):
+                continue
+    if not live_scores and not off_game_ids:
+        return 0
+
+    date_obj = datetime.strptime(date, '%m/%d/%Y').date()
+    rows = [{
+        'api_game_id': live.api_game_id,
+        'team_id': live.team_id,
+        'score': live.score,
+        'date': date_obj,
+        'game_datetime': live.game_datetime,
+        'final': False
+    } for live in live_scores]
+
     try:
-        mlb_schedule = statsapi.schedule(date=date, sportId=1)
+        # Replace the previous provisional scores; a final row is never overwritten
+        db.session.query(MLBGameResult).filter(
+            MLBGameResult.final.is_(False),
+            MLBGameResult.api_game_id.in_(set(row['api_game_id'] for row in rows) | off_game_ids)
+        ).delete(synchronize_session=False)
+        if rows:
+            db.session.execute(insert_ignoring_conflicts(MLBGameResult.__table__), rows)
+        db.session.commit()
+        return len(rows)
     except Exception as e:
-        print(f"Error fetching MLB schedule: {e}")
-        return []
+        ingest_logger.error("Failed to store live MLB scores for %s: %s", date, e)
+        db.session.rollback()
+        return 0
 
-    # Check if there are any games scheduled for the specified date
-    if not mlb_schedule:
-        print(f"No games scheduled for {date}.")
+
+def next_live_poll_at(schedules, now):
+    """
+    Decide when the live poller next needs to call the MLB API.
+
+    Args:
+        schedules: The schedules just polled
+        now: The current UTC time
+
+    Returns:
+        UTC datetime of the next poll
+    """
+    first_pitches = []
+    for mlb_schedule in schedules:
+        for mlb_game in mlb_schedule:
+            state = game_state(mlb_game.get('status'))
+            if state == 'live':
+                return now + timedelta(seconds=LIVE_POLL_SECONDS)
+            if state == 'pregame':
+                try:
+                    first_pitches.append(datetime.strptime(mlb_game['game_datetime'], '%Y-%m-%dT%H:%M:%SZ'))
+                except (KeyError, TypeError, ValueError):
+                    first_pitches.append(now)
+
+    if first_pitches:
+        return max(min(first_pitches), now + timedelta(seconds=LIVE_POLL_SECONDS))
+
+    # Nothing left today: look at tomorrow's schedule just after local midnight
+    local_midnight = datetime.combine(datetime.now().date() + timedelta(days=1), datetime.min.time())
+    return now + (local_midnight - datetime.now())
+
+
+def poll_live_scores():
+    """
+    Poll today's (and a still-open yesterday's) MLB schedule when a game could be live.
+
+    Returns:
+        list of dicts for the results promoted to final, or None if no poll was due
+    """
+    now = datetime.utcnow()
+    next_poll_at = live_poll_state['next_poll_at']
+    if next_poll_at is not None and now < next_poll_at:
+        return None
+
+    today = datetime.now().date()
+    schedules = []
+    promoted = []
+    try:
+        for day in (today - timedelta(days=1), today):
+            schedule_date = day.strftime('%m/%d/%Y')
+            # A settled date is served from the cache without a call
+            mlb_schedule = get_schedule(schedule_date, max_age=LIVE_POLL_SECONDS / 2)
+            schedules.append(mlb_schedule)
+            ingest_live_scores(schedule_date, mlb_schedule)
+            promoted.extend(ingest_final_scores(schedule_date))
+        live_poll_state['next_poll_at'] = next_live_poll_at(schedules, now)
+    except Exception as e:
+        ingest_logger.warning("Live score poll failed: %s", e)
+        db.session.rollback()
+        live_poll_state['next_poll_at'] = now + timedelta(seconds=LIVE_POLL_SECONDS)
         return []
-    
-    # Create a list to store the scores
-    scores = []
-    date_obj = datetime.strptime(date, '%m/%d/%Y')
 
-    # Loop through each game in the schedule
-    for mlb_game in mlb_schedule:
+    if promoted:
+        # Only final results reach the pools. They are stored, so a failure here is picked up
+        # by the next poll or the nightly job: update_scorecard resumes from its watermark,
+        # player scores are recounted and pools with a complete team are evaluated again
         try:
-            # Get the unique game ID from the API
-            api_game_id = mlb_game['game_id']
-            print(f"API Game ID: {api_game_id}")
-            
-            # Check if the game was completed after the creation of the 13 Run Pool game
-            game_datetime = datetime.strptime(mlb_game['game_datetime'], '%Y-%m-%dT%H:%M:%SZ')
-            if game_start_date is not None and game_datetime <= game_start_date:
-                print(f"Skipping game {api_game_id} - completed before pool game start")
-                continue
+            changed = update_scorecard()
+            update_player_scores()
+            complete_finished_games(changed)
+        except Exception as e:
+            ingest_logger.warning("Could not score promoted live results: %s", e)
+            db.session.rollback()
 
-            # Parse the summary string to get the team names and scores
-            summary = mlb_game['summary']
-            print(f"Game summary: {summary}")
+    return promoted
 
-            # Skip games that are "Scheduled"
-            if 'Scheduled' in summary:
-                print(f"Skipping scheduled game {api_game_id}")
-                continue
-            
-            parts = summary.split(' - ')
-            if len(parts) < 2:
-                print(f"Could not parse summary: {summary}")
-                continue
-                
-            team1_info, team2_info = parts[1].split(' @ ')
-            
-            # Check if the team info strings contain a score
-            if ' (' not in team1_info or ' (' not in team2_info:
-                print(f"Could not parse scores from summary: {summary}")
-                continue
 
-            team1_name, team1_score = team1_info.split(' (')
-            team2_name, team2_score = team2_info.split(' (', 1)
+def live_job():
+    """Scheduler entry point for the live poller; shares the nightly job's lock."""
+    if not job_lock.acquire(blocking=False):
+        return
 
-            team1_name = team1_name.strip()
-            team2_name = team2_name.strip()
-            team1_score = team1_score.rstrip(')')
-            team2_score = team2_score.rstrip(') (Final)')
+    try:
+        with app.app_context():
+            promoted = poll_live_scores()
+            if promoted:
+                ingest_logger.info("Live poll promoted %d MLB results to final", len(promoted))
+    finally:
+        job_lock.release()
 
-            print(f"Team 1: {team1_name}, Score: {team1_score}")
-            print(f"Team 2: {team2_name}, Score: {team2_score}")
 
-            # Get the Team instances for the two teams
-            team1 = Team.query.filter_by(name=TEAM_NAME_MAPPING.get(team1_name)).first()
-            team2 = Team.query.filter_by(name=TEAM_NAME_MAPPING.get(team2_name)).first()
+## HISTORICAL BACKFILL SECTION
+# Games created with a past start date fetch their missing days in the background. A
+# backfill whose process died (a web worker restart or deploy) stops touching updated_at;
+# the scheduler leader picks it up again from its last completed day.
 
-            if team1 is None or team2 is None:
-                print(f"Could not find team(s) in database: {team1_name}, {team2_name}")
-                continue
+# Bounds how many backfills (and so upstream schedule calls) run at once per process
+backfill_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('BACKFILL_WORKERS', '2')),
+    thread_name_prefix='backfill'
+)
 
-            # Check if GameScore instances already exist for the same team, game, date, and score
-            existing_gamescore1 = GameScore.query.filter_by(
-                team_id=team1.id, 
-                game_id=game_id, 
-                date=date_obj, 
-                api_game_id=api_game_id, 
-                score=int(team1_score)
-            ).first()
-            
-            existing_gamescore2 = GameScore.query.filter_by(
-                team_id=team2.id, 
-                game_id=game_id, 
-                date=date_obj, 
-                api_game_id=api_game_id, 
-                score=int(team2_score)
-            ).first()
-
-            # Create new GameScore instances only if they don't exist
-            if existing_gamescore1 is None:
-                try:
-                    valid, message = validate_gamescore_data(team1.id, game_id, int(team1_score), date_obj)
-                    if not valid:
-                        print(f"Validation failed for team1: {message}")
-                        continue
-
-                    gamescore1 = GameScore(
-                        team_id=team1.id, 
-                        game_id=game_id, 
-                        api_game_id=api_game_id, 
-                        score=int(team1_score), 
-                        date=date_obj
-                    )
-                    print(f"Adding GameScore to database: {gamescore1}")
-                    db.session.add(gamescore1)
-                    scores.append(gamescore1)
-                except Exception as e:
-                    print(f"Error creating GameScore for team1: {e}")
-                    continue
-
-            if existing_gamescore2 is None:
-                try:
-                    valid, message = validate_gamescore_data(team2.id, game_id, int(team2_score), date_obj)
-                    if not valid:
-                        print(f"Validation failed for team2: {message}")
-                        continue
-
-                    gamescore2 = GameScore(
-                        team_id=team2.id, 
-                        game_id=game_id, 
-                        api_game_id=api_game_id, 
-                        score=int(team2_score), 
-                        date=date_obj
-                    )
-                    print(f"Adding GameScore to database: {gamescore2}")
-                    db.session.add(gamescore2)
-                    scores.append(gamescore2)
-                except Exception as e:
-                    print(f"Error creating GameScore for team2: {e}")
-                    continue
+# A pending or running backfill not updated for this long has lost its process
+BACKFILL_STALE_SECONDS = int(os.getenv('BACKFILL_STALE_SECONDS', '600'))
+# Attempts per day before the backfill is marked failed, and the base delay between them
+BACKFILL_DAY_ATTEMPTS = int(os.getenv('BACKFILL_DAY_ATTEMPTS', '3'))
+BACKFILL_RETRY_SECONDS = float(os.getenv('BACKFILL_RETRY_SECONDS', '5'))
 
-        except Exception as e:
-            print(f"Error processing MLB game: {e}")
-            continue
 
-    # Commit all changes at once
-    if scores:
+def start_backfill(game):
+    """Record a BackfillJob covering the game's start date to yesterday and queue it."""
+    start_date = game.start_date.date()
+    end_date = datetime.now().date() - timedelta(days=1)  # Yesterday
+    total_days = (end_date - start_date).days + 1
+    if total_days <= 0:
+        return None
+
+    job = BackfillJob(
+        game_id=game.id,
+        status="pending",
+        total_days=total_days,
+        completed_days=0,
+        created_at=datetime.now(),
+        updated_at=datetime.now()
+    )
+    db.session.add(job)
+    db.session.commit()
+
+    ingest_logger.info("Queued backfill of %d days for game %s", total_days, game.id)
+    backfill_executor.submit(run_backfill, job.id)
+    return job
+
+
+def score_stored_results(game):
+    """
+    Build a new game's scorecard from the MLB results already stored for its window.
+
+    Returns:
+        bool whether any stored results fell inside the window
+    """
+    stored = db.session.query(MLBGameResult.id).filter(MLBGameResult.in_pool_window(game.start_date, game.end_date)).first()
+    if stored is None:
+        return False
+
+    update_scorecard([game.id])
+    update_player_scores([game.id])
+    return True
+
+
+def run_backfill(job_id):
+    """Fetch every day of a BackfillJob, then build the scorecard for its game only."""
+    with app.app_context():
+        job = BackfillJob.query.get(job_id)
+        if job is None or job.status == "completed":
+            return
+
+        game = job.game
+        start_date = game.start_date.date()
+
         try:
+            job.status = "running"
+            job.updated_at = datetime.now()
+            db.session.commit()
+
+            for day in range(job.completed_days, job.total_days):
+                backfill_day((start_date + timedelta(days=day)).strftime('%m/%d/%Y'))
+
+                # Progress is shown on the scorecard, so it invalidates the cached page too
+                job.completed_days = day + 1
+                job.updated_at = datetime.now()
+                bump_data_version([game.id])
+                db.session.commit()
+
+            update_scorecard([game.id])
+            update_player_scores([game.id])
+
+            job.status = "completed"
+            job.updated_at = datetime.now()
+            bump_data_version([game.id])
             db.session.commit()
-            print(f"Successfully committed {len(scores)} new GameScore instances")
+            ingest_logger.info("Backfill finished for game %s: %d days", game.id, job.total_days)
+
+            # The backfilled days may already hold a winner
+            complete_finished_games([game.id])
+
+        except Exception as e:
+            ingest_logger.exception("Backfill failed for game %s: %s", game.id, e)
+            db.session.rollback()
+            try:
+                job.status = "failed"
+                job.error = str(e)
+                job.updated_at = datetime.now()
+                bump_data_version([game.id])
+                db.session.commit()
+            except Exception as status_error:
+                ingest_logger.error("Could not record backfill failure for game %s: %s", game.id, status_error)
+                db.session.rollback()
+
+        finally:
+            db.session.remove()
+
+
+def backfill_day(date):
+    """
+    Fetch and store one day of a backfill, retrying failures with a growing delay.
+
+    Raises the last error once BACKFILL_DAY_ATTEMPTS are used up, so the day is never
+    counted as done without its scores.
+    """
+    for attempt in range(1, BACKFILL_DAY_ATTEMPTS + 1):
+        try:
+            return ingest_final_scores(date)
+        except Exception as e:
+            db.session.rollback()
+            if attempt == BACKFILL_DAY_ATTEMPTS:
+                raise
+            ingest_logger.warning("Backfill of %s failed (attempt %d of %d): %s", date, attempt, BACKFILL_DAY_ATTEMPTS, e)
+            time.sleep(BACKFILL_RETRY_SECONDS * attempt)
+
+
+def resume_stale_backfills():
+    """
+    Requeue the pending or running backfills that stopped making progress. Needs an app context.
+
+    Each job is claimed with a conditional UPDATE on its updated_at, so when several
+    processes look at once only one of them resumes it.
+
+    Returns:
+        list of the BackfillJob ids queued
+    """
+    cutoff = datetime.now() - timedelta(seconds=BACKFILL_STALE_SECONDS)
+    stale = [
+        BackfillJob.status.in_(("pending", "running")),
+        db.or_(BackfillJob.updated_at.is_(None), BackfillJob.updated_at < cutoff)
+    ]
+
+    resumed = []
+    for (job_id,) in db.session.query(BackfillJob.id).filter(*stale).all():
+        claimed = BackfillJob.query.filter(BackfillJob.id == job_id, *stale).update(
+            {'status': "pending", 'updated_at': datetime.now()}, synchronize_session=False
+        )
+        db.session.commit()
+        if claimed:
+            backfill_executor.submit(run_backfill, job_id)
+            resumed.append(job_id)
+
+    if resumed:
+        ingest_logger.info("Resumed %d stale backfills", len(resumed))
+    return resumed
+
+
+def resume_backfills_job():
+    """Scheduler entry point for resume_stale_backfills()."""
+    with app.app_context():
+        try:
+            resume_stale_backfills()
         except Exception as e:
-            print(f"Failed to commit GameScore changes: {e}")
+            ingest_logger.error("Could not resume stale backfills: %s", e)
             db.session.rollback()
-            return []
 
-    return scores
+
+@app.route('/game/<string:game_token>/backfill_status')
+def backfill_status(game_token):
+    """Report the progress of a game's historical score backfill."""
+    game = Game.query.filter_by(token=game_token).first_or_404()
+    job = BackfillJob.query.filter_by(game_id=game.id).first()
+    if job is None:
+        return {'status': 'none', 'completed_days': 0, 'total_days': 0}
+
+    return {
+        'status': job.status,
+        'completed_days': job.completed_days,
+        'total_days': job.total_days,
+        'error': job.error
+    }
+
 
 import threading
 
@@ -1445,76 +2896,106 @@ def evaluate_game_winner(game_id: int) -> dict | None:
     Returns:
         dict with winner information or None if no winner yet
     """
-    # Load Game and ensure status == "active"
-    game = Game.query.get(game_id)
-    if not game or game.status != "active":
-        return None
-    
-    # Get all teams participating in this game
-    players = Player.query.filter_by(game_id=game_id).all()
-    if not players:
-        return None
-    
-    # Get unique teams from players
-    teams = list(set([player.team_id for player in players]))
-    
-    # Track teams that have completed all 0-13 runs
-    completed_teams = []
-    
-    for team_id in teams:
-        # Get run totals achieved by this team in this game
-        run_totals = db.session.query(TeamGameRunTotal.run_total).filter(
-            TeamGameRunTotal.team_id == team_id,
-            TeamGameRunTotal.game_id == game_id
+    return evaluate_game_winners([game_id]).get(game_id)
+
+
+def evaluate_game_winners(game_ids=None) -> dict:
+    """
+    Evaluate the winners of many active games with a fixed number of queries.
+
+    The complete teams, their first-achieved dates and their games played are loaded
+    for every game at once; the tiebreak rules are then applied in memory.
+
+    Args:
+        game_ids: Only evaluate these games (e.g. those whose coverage just changed);
+            None evaluates every active game
+
+    Returns:
+        dict of game_id -> winner information, for the games that have a winner
+    """
+    # Load the active games
+    games = Game.query.filter(Game.status == "active")
+    if game_ids is not None:
+        if not game_ids:
+            return {}
+        games = games.filter(Game.id.in_(game_ids))
+    game_ids = [game.id for game in games.all()]
+    if not game_ids:
+        return {}
+
+    # The first player on each team in each game
+    team_players = {}
+    for player_id, game_id, team_id in db.session.query(
+        Player.id, Player.game_id, Player.team_id
+    ).filter(Player.game_id.in_(game_ids)).order_by(Player.id):
+        team_players.setdefault((game_id, team_id), player_id)
+
+    # Teams that have completed all 0-13 runs (a full coverage mask), for teams in play
+    completed_teams = [
+        coverage for coverage in TeamCoverage.query.filter(
+            TeamCoverage.game_id.in_(game_ids),
+            TeamCoverage.run_mask == FULL_COVERAGE_MASK
         ).all()
-        
-        # Convert to set of run totals
-        achieved_runs = set([rt.run_total for rt in run_totals])
-        
-        # Check if team has all runs from 0 to 13
-        if achieved_runs.issuperset(set(range(14))):  # 0 to 13 inclusive
-            completed_teams.append(team_id)
-    
-    # If no team has completed all runs, return None
+        if (coverage.game_id, coverage.team_id) in team_players
+    ]
     if not completed_teams:
-        return None
-    
-    # Build candidate list of teams that have all 0-13
-    candidates = []
-    
-    for team_id in completed_teams:
-        # Get first achieved date for each run (0-13)
-        first_achieved_dates = {}
-        
-        for run in range(14):
-            # Find earliest GameScore date for this run
-            earliest_score = db.session.query(GameScore.date).filter(
-                GameScore.team_id == team_id,
-                GameScore.game_id == game_id,
-                GameScore.score == run
-            ).order_by(GameScore.date.asc()).first()
-            
-            if earliest_score:
-                first_achieved_dates[run] = earliest_score.date
-        
-        # Get games played count
-        team = Team.query.get(team_id)
-        games_played = team.games_played(game_id) if team else 0
-        
+        return {}
+
+    completed_game_ids = set(coverage.game_id for coverage in completed_teams)
+    completed_team_ids = set(coverage.team_id for coverage in completed_teams)
+    games_played = games_played_by_game_team(completed_game_ids, completed_team_ids)
+
+    # The date each completed team first reached each run total
+    first_dates = {}
+    for game_id, team_id, run_total, first_date in db.session.query(
+        TeamGameRunTotal.game_id, TeamGameRunTotal.team_id, TeamGameRunTotal.run_total, TeamGameRunTotal.first_date
+    ).filter(
+        TeamGameRunTotal.game_id.in_(completed_game_ids),
+        TeamGameRunTotal.team_id.in_(completed_team_ids),
+        TeamGameRunTotal.run_total.between(RUN_TOTALS.start, RUN_TOTALS.stop - 1)
+    ):
+        if first_date is not None:
+            first_dates.setdefault((game_id, team_id), {})[run_total] = first_date
+
+    # Build candidate lists of teams that have all 0-13, per game
+    candidates_by_game = {}
+    for coverage in completed_teams:
+        first_achieved_dates = first_dates.get((coverage.game_id, coverage.team_id), {})
+
         # Determine winner_date (latest of first_achieved_date[0-13])
         winner_date = max(first_achieved_dates.values()) if first_achieved_dates else None
-        
+
         if winner_date:
-            candidates.append({
-                'team_id': team_id,
+            candidates_by_game.setdefault(coverage.game_id, []).append({
+                'team_id': coverage.team_id,
                 'winner_date': winner_date,
-                'games_played': games_played,
+                'games_played': games_played.get((coverage.game_id, coverage.team_id), 0),
                 'first_achieved_dates': first_achieved_dates
             })
-    
-    if not candidates:
-        return None
-    
+
+    results = {}
+    for game_id, candidates in candidates_by_game.items():
+        winner, tiebreaker_notes = pick_winner(candidates)
+        results[game_id] = {
+            "winner_team_id": winner['team_id'],
+            "winner_player_id": team_players.get((game_id, winner['team_id'])),
+            "end_date": winner['winner_date'],
+            "tiebreaker_notes": tiebreaker_notes
+        }
+
+    return results
+
+
+def pick_winner(candidates):
+    """
+    Apply the tiebreaker rules to the teams of one game that have all 0-13 runs.
+
+    Args:
+        candidates: list of dicts with team_id, winner_date, games_played and first_achieved_dates
+
+    Returns:
+        (winning candidate, tiebreaker notes dict)
+    """
     # Sort candidates by winner_date (earliest first)
     candidates.sort(key=lambda x: x['winner_date'])
     
@@ -1551,12 +3032,6 @@ def evaluate_game_winner(game_id: int) -> dict | None:
                     elif len(earliest_run_candidates) < len(fewest_games_candidates):
                         fewest_games_candidates = earliest_run_candidates
     
-    # Find the player with the winning team
-    winner_player = Player.query.filter_by(
-        game_id=game_id, 
-        team_id=winner['team_id']
-    ).first()
-    
     # Build tiebreaker notes
     tiebreaker_notes = {
         'winner_date': winner['winner_date'].isoformat() if winner['winner_date'] else None,
@@ -1566,84 +3041,402 @@ def evaluate_game_winner(game_id: int) -> dict | None:
         'fewest_games_candidates': len([c for c in candidates if c['games_played'] == winner['games_played']])
     }
     
-    return {
-        "winner_team_id": winner['team_id'],
-        "winner_player_id": winner_player.id if winner_player else None,
-        "end_date": winner['winner_date'],
-        "tiebreaker_notes": tiebreaker_notes
-    }
+    return winner, tiebreaker_notes
+
+
+## JOB METRICS SECTION
+# Each nightly run records its per-phase durations and row counts in ingest_run. The
+# worker process writes them and the web process serves them from /metrics.
+
+# Phases reported on /metrics, in pipeline order
+JOB_PHASES = ['fetch_schedule', 'store_results', 'update_scorecard', 'update_player_scores', 'complete_games']
+
+# Who may scrape /metrics: a client address on the allowlist, or any client sending the token.
+# Behind a proxy every request comes from the proxy's address, so set METRICS_TOKEN there.
+METRICS_ALLOWED_IPS = {ip.strip() for ip in os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',') if ip.strip()}
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+
+class JobRunRecorder:
+    """Times the phases of one job run and stores the summary in an IngestRun row."""
+
+    def __init__(self, job_name, run_date=None):
+        self.run = IngestRun(job=job_name, status="running", started_at=datetime.utcnow(), run_date=run_date)
+        self.phases = {}
+        self._started = time.perf_counter()
+        self._cache_hits = schedule_cache.hits
+        self._cache_misses = schedule_cache.misses
+
+        # Record the start, so a run that never finishes shows up as stalled
+        db.session.add(self.run)
+        db.session.commit()
+
+    @contextmanager
+    def phase(self, name):
+        """Time a phase; the block may set phase['rows'] to the number of rows it touched."""
+        # Never start a phase once another process may have taken over the job
+        check_scheduler_lease()
+        phase = {'rows': 0}
+        started = time.perf_counter()
+        try:
+            with query_scope(f"{self.run.job}:{name}") as stats:
+                yield phase
+        finally:
+            phase['seconds'] = round(time.perf_counter() - started, 4)
+            if QUERY_STATS_ENABLED:
+                phase['queries'] = stats.count
+                phase['db_seconds'] = round(stats.seconds, 4)
+                report_repeated_queries(stats)
+            self.phases[name] = phase
+
+    def finish(self, status, error=None):
+        """Store the run's status and JSON summary."""
+        # Every schedule cache miss is one call to the MLB API
+        hits = schedule_cache.hits - self._cache_hits
+        misses = schedule_cache.misses - self._cache_misses
+        summary = {
+            'seconds': round(time.perf_counter() - self._started, 4),
+            'phases': self.phases,
+            'upstream_calls': misses,
+            'schedule_cache_hits': hits,
+            'schedule_cache_hit_rate': round(hits / (hits + misses), 4) if hits + misses else None
+        }
+        if error:
+            summary['error'] = error
+
+        self.run.status = status
+        self.run.finished_at = datetime.utcnow()
+        self.run.summary = json.dumps(summary)
+        try:
+            db.session.commit()
+        except Exception as e:
+            jobs_logger.error("Could not record %s run metrics: %s", self.run.job, e)
+            db.session.rollback()
+        jobs_logger.info(
+            "%s run %s in %.2fs", self.run.job, status, summary['seconds'],
+            extra={'job': self.run.job, 'status': status, 'summary': summary}
+        )
 
-def job():
-    global job_lock
 
+def prometheus_line(name, value, labels=None):
+    if labels:
+        label_text = ','.join(f'{key}="{label}"' for key, label in labels.items())
+        return f"{name}{{{label_text}}} {value}"
+    return f"{name} {value}"
+
+
+def render_job_metrics():
+    """Render the latest job runs as Prometheus text exposition format."""
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(prometheus_line(name, value, labels) for labels, value in samples)
+
+    run_counts = db.session.query(IngestRun.job, IngestRun.status, db.func.count(IngestRun.id)).group_by(
+        IngestRun.job, IngestRun.status
+    ).all()
+    metric('runpool_job_runs', 'gauge', 'Recorded job runs by status.',
+           [({'job': job_name, 'status': status}, count) for job_name, status, count in run_counts])
+
+    last_started = {}
+    last_success = {}
+    latest_summaries = {}
+    for job_name in sorted(set(job_name for job_name, _, _ in run_counts)):
+        latest = IngestRun.query.filter_by(job=job_name).order_by(IngestRun.started_at.desc()).first()
+        last_started[job_name] = latest
+        success = latest if latest.status == "success" else IngestRun.query.filter_by(
+            job=job_name, status="success"
+        ).order_by(IngestRun.started_at.desc()).first()
+        if success:
+            last_success[job_name] = success
+            latest_summaries[job_name] = json.loads(success.summary or '{}')
+
+    metric('runpool_job_last_start_timestamp_seconds', 'gauge', 'Start time of the latest run.',
+           [({'job': job_name}, run.started_at.replace(tzinfo=timezone.utc).timestamp())
+            for job_name, run in last_started.items()])
+    metric('runpool_job_running', 'gauge', '1 while the latest run has not finished.',
+           [({'job': job_name}, int(run.status == "running")) for job_name, run in last_started.items()])
+    metric('runpool_job_last_success_timestamp_seconds', 'gauge', 'Finish time of the latest successful run.',
+           [({'job': job_name}, run.finished_at.replace(tzinfo=timezone.utc).timestamp())
+            for job_name, run in last_success.items()])
+    metric('runpool_job_duration_seconds', 'gauge', 'Duration of the latest successful run.',
+           [({'job': job_name}, summary.get('seconds', 0)) for job_name, summary in latest_summaries.items()])
+    metric('runpool_job_phase_duration_seconds', 'gauge', 'Phase durations of the latest successful run.',
+           [({'job': job_name, 'phase': phase}, summary['phases'][phase]['seconds'])
+            for job_name, summary in latest_summaries.items()
+            for phase in JOB_PHASES if phase in summary.get('phases', {})])
+    metric('runpool_job_phase_rows', 'gauge', 'Rows each phase of the latest successful run touched.',
+           [({'job': job_name, 'phase': phase}, summary['phases'][phase]['rows'])
+            for job_name, summary in latest_summaries.items()
+            for phase in JOB_PHASES if phase in summary.get('phases', {})])
+    metric('runpool_job_phase_queries', 'gauge', 'SQL statements each phase of the latest successful run executed.',
+           [({'job': job_name, 'phase': phase}, summary['phases'][phase]['queries'])
+            for job_name, summary in latest_summaries.items()
+            for phase in JOB_PHASES if 'queries' in summary.get('phases', {}).get(phase, {})])
+    metric('runpool_job_upstream_calls', 'gauge', 'MLB API calls made by the latest successful run.',
+           [({'job': job_name}, summary.get('upstream_calls', 0)) for job_name, summary in latest_summaries.items()])
+    metric('runpool_job_schedule_cache_hit_ratio', 'gauge', 'Schedule cache hit rate of the latest successful run.',
+           [({'job': job_name}, summary['schedule_cache_hit_rate'])
+            for job_name, summary in latest_summaries.items() if summary.get('schedule_cache_hit_rate') is not None])
+
+    # This process's own schedule cache counters
+    metric('runpool_schedule_cache_hits_total', 'counter', 'Schedule cache hits in this process.',
+           [(None, schedule_cache.hits)])
+    metric('runpool_schedule_cache_misses_total', 'counter', 'Schedule cache misses in this process.',
+           [(None, schedule_cache.misses)])
+
+    return '\n'.join(lines) + '\n'
+
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics for the nightly job. Only served to allowed addresses or with the bearer token."""
+    authorization = request.headers.get('Authorization', '')
+    has_token = bool(METRICS_TOKEN) and secrets.compare_digest(
+        authorization.encode(), f"Bearer {METRICS_TOKEN}".encode()
+    )
+    if not has_token and request.remote_addr not in METRICS_ALLOWED_IPS:
+        return "Not found", 404
+
+    response = make_response(render_job_metrics())
+    response.headers['Content-Type'] = 'text/plain; version=0.0.4; charset=utf-8'
+    return response
+
+
+def job():
     # Check if the lock is locked, i.e., the job is already running
     if job_lock.locked():
-        print(f"Job is already running.")
+        jobs_logger.warning("Job is already running")
         return
 
     # Lock the lock
     job_lock.acquire()
 
     try:
-        print(f"Running job at {datetime.now()}")
         # Get the current date and format it as "MM/DD/YYYY"
-        current_date = (datetime.now() - timedelta(days=1)).strftime('%m/%d/%Y')
+        run_date = datetime.now().date() - timedelta(days=1)
+        current_date = run_date.strftime('%m/%d/%Y')
 
         with app.app_context():
-            # Get all games
-            games = Game.query.all()
-            for game in games:
-                get_final_scores(current_date, game.id)
-            update_scorecard()  # Move this line outside of the loop
-            update_player_scores()  # Update player scores after fetching the MLB scores
-            
-            # Auto-complete games that have winners
-            print("Checking for game completion...")
-            active_games = Game.query.filter_by(status="active").all()
-            completed_count = 0
-            
-            for game in active_games:
-                # Skip if already completed
-                if game.status != "active":
-                    continue
-                    
-                result = evaluate_game_winner(game.id)
-                if result:
-                    print(f"Game {game.id} ({game.pool_name}) completed! Winner: Team {result['winner_team_id']}")
-                    
-                    # Update game status and winner information
-                    game.status = "completed"
-                    game.end_date = result["end_date"]
-                    game.winner_team_id = result["winner_team_id"]
-                    game.winner_player_id = result["winner_player_id"]
-                    game.tiebreaker_notes = json.dumps(result["tiebreaker_notes"])
-                    
-                    completed_count += 1
-            
-            # Commit all changes at once
-            if completed_count > 0:
-                db.session.commit()
-                print(f"Successfully completed {completed_count} games")
-            else:
-                print("No games completed in this run")
-                
+            # A process that takes over the lease after 21:09 finds the job overdue; don't replay a finished night
+            if IngestRun.query.filter_by(job='nightly', run_date=run_date, status="success").first():
+                jobs_logger.info("Nightly job for %s already ran", current_date)
+                return
+
+            jobs_logger.info("Running nightly job")
+            run = JobRunRecorder('nightly', run_date)
+            try:
+                # Fetch the date's MLB results once; every pool reads them through its start-date window
+                with run.phase('fetch_schedule') as phase:
+                    parsed_scores = fetch_final_scores(current_date)
+                    phase['rows'] = len(parsed_scores)
+                with run.phase('store_results') as phase:
+                    phase['rows'] = len(ingest_final_scores(current_date, parsed_scores))
+                with run.phase('update_scorecard') as phase:
+                    changed = update_scorecard()
+                    phase['rows'] = len(changed)
+                with run.phase('update_player_scores') as phase:
+                    phase['rows'] = update_player_scores()  # Update player scores after fetching the MLB scores
+                with run.phase('complete_games') as phase:
+                    # Pools whose coverage changed, and any a failed run left with a complete team
+                    phase['rows'] = complete_finished_games(changed)
+                run.finish("success")
+            except Exception as e:
+                jobs_logger.exception("Job failed: %s", e)
+                db.session.rollback()
+                run.finish("failed", error=str(e))
+
     finally:
         # Release the lock
         job_lock.release()
 
+
+def games_awaiting_winner():
+    """Ids of the active games where a team in play has all 0-13 runs. Needs an app context."""
+    return set(game_id for (game_id,) in db.session.query(TeamCoverage.game_id).join(
+        Game, Game.id == TeamCoverage.game_id
+    ).join(
+        Player, db.and_(Player.game_id == TeamCoverage.game_id, Player.team_id == TeamCoverage.team_id)
+    ).filter(
+        TeamCoverage.run_mask == FULL_COVERAGE_MASK,
+        Game.status == "active"
+    ).distinct())
+
+
+def complete_finished_games(game_ids=None):
+    """
+    Auto-complete the active games that have winners, in one commit. Needs an app context.
+
+    Args:
+        game_ids: Evaluate these games, plus every active game that already has a
+            complete team in play; None evaluates every active game
+
+    Returns:
+        int number of games completed
+    """
+    jobs_logger.debug("Checking for game completion")
+    if game_ids is not None:
+        # update_scorecard commits before completion runs, so a run that failed in between
+        # would never evaluate the pools it changed again
+        game_ids = set(game_ids) | games_awaiting_winner()
+    results = evaluate_game_winners(game_ids)
+    
+    for game_id, result in results.items():
+        game = Game.query.get(game_id)  # Already loaded by the evaluator
+        jobs_logger.info("Game %s (%s) completed, winner: team %s", game.id, game.pool_name, result['winner_team_id'])
+        
+        # Update game status and winner information
+        game.status = "completed"
+        game.end_date = result["end_date"]
+        game.winner_team_id = result["winner_team_id"]
+        game.winner_player_id = result["winner_player_id"]
+        game.tiebreaker_notes = json.dumps(result["tiebreaker_notes"])
+        game.data_version = (game.data_version or 0) + 1
+        game.data_updated_at = datetime.utcnow()
+    
+    # Commit all changes at once
+    if results:
+        db.session.commit()
+        jobs_logger.info("Completed %d games", len(results))
+    else:
+        jobs_logger.debug("No games completed in this run")
+
+    return len(results)
+
+
+# Every process that runs start_scheduler competes for this lease; only the holder runs jobs
+SCHEDULER_LEASE_NAME = 'scheduler'
+SCHEDULER_LEASE_TTL = int(os.getenv('SCHEDULER_LEASE_TTL', '90'))
+SCHEDULER_HEARTBEAT_SECONDS = SCHEDULER_LEASE_TTL // 3
+
+
+class SchedulerLeaseLost(Exception):
+    """Raised in a job when this process can no longer be sure it holds the scheduler lease."""
+
+
+class SchedulerHeartbeat:
+    """
+    Renews the scheduler lease from its own thread.
+
+    Jobs run synchronously inside schedule.run_pending(), so a heartbeat in the
+    scheduler loop would stop while a job runs and let a long run outlive its lease.
+    """
+
+    def __init__(self, holder):
+        self.holder = holder
+        self._leader = False
+        self._valid_until = 0  # time.monotonic() after which the last renewal no longer counts
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='scheduler-heartbeat', daemon=True)
+
+    @property
+    def is_leader(self):
+        return self._leader and time.monotonic() < self._valid_until
+
+    def renew(self):
+        """Take or renew the lease; a failed renewal gives up leadership at once."""
+        renewed_at = time.monotonic()
+        with app.app_context():
+            leader = SchedulerLease.acquire(SCHEDULER_LEASE_NAME, self.holder, SCHEDULER_LEASE_TTL)
+        if leader != self._leader:
+            jobs_logger.info("Scheduler %s %s the leader", self.holder, 'is now' if leader else 'is no longer')
+        # Stop trusting a renewal a heartbeat before the lease expires, so a stalled heartbeat
+        # aborts the job before a standby can take over
+        self._valid_until = renewed_at + SCHEDULER_LEASE_TTL - SCHEDULER_HEARTBEAT_SECONDS
+        self._leader = leader
+        return leader
+
+    def start(self):
+        self.renew()
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(SCHEDULER_HEARTBEAT_SECONDS):
+            self.renew()
+
+    def stop(self):
+        """Stop renewing and hand the lease over if this process held it."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        if self._leader:
+            with app.app_context():
+                SchedulerLease.release(SCHEDULER_LEASE_NAME, self.holder)
+            self._leader = False
+
+
+# The heartbeat of the scheduler running in this process, if any
+scheduler_heartbeat = None
+
+
+def check_scheduler_lease():
+    """Raise SchedulerLeaseLost if this process runs the scheduler but no longer holds its lease."""
+    if scheduler_heartbeat is not None and not scheduler_heartbeat.is_leader:
+        raise SchedulerLeaseLost(f"Scheduler lease no longer held by {scheduler_heartbeat.holder}")
+
+
 def start_scheduler():
+    """
+    Run the scheduled jobs for as long as this process holds the scheduler lease.
+
+    Any number of processes may call this; the others stand by, retrying the lease
+    every heartbeat, and take over within SCHEDULER_LEASE_TTL seconds if the leader dies.
+    The lease is renewed from a heartbeat thread, and a job that finds it lost stops
+    before its next phase.
+    """
+    global scheduler_heartbeat
+
     # Check if the job is already scheduled
     if not schedule.get_jobs():
         # Schedule the job to run every day at a specific time (e.g., 8:00 AM)
         schedule.every().day.at("21:09:10").do(job)
 
-    # Keep the script running and execute the scheduled job
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+        # Pick up backfills orphaned by a restarted web worker
+        schedule.every(max(BACKFILL_STALE_SECONDS // 2, 60)).seconds.do(resume_backfills_job)
+
+        # Live mode: the tick is free, the poller only calls the MLB API when a game could be live
+        if os.getenv('LIVE_SCORES') == '1':
+            schedule.every(15).seconds.do(live_job)
+
+    holder = f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}"
+    scheduler_heartbeat = SchedulerHeartbeat(holder)
+    scheduler_heartbeat.start()
+
+    try:
+        # Keep the script running and execute the scheduled job
+        while True:
+            if scheduler_heartbeat.is_leader:
+                schedule.run_pending()
+            time.sleep(1)
+    finally:
+        scheduler_heartbeat.stop()
+
+
+@app.cli.command('worker')
+def worker_command():
+    """Run the nightly job (and live mode) in a dedicated process, under the scheduler lease."""
+    # The web service migrates and seeds the shared database; never race it
+    with app.app_context():
+        try:
+            wait_for_migrations()
+        except RuntimeError as e:
+            raise click.ClickException(str(e))
+        team_registry.load()
+
+    # Stop cleanly on SIGTERM too, so the lease is released rather than left to expire
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        start_scheduler()
+    except (KeyboardInterrupt, SystemExit):
+        print("Worker stopped.")
 
 
 if __name__ == '__main__':
+    with app.app_context():
+        bootstrap_database()
+
     # Only run scheduler and debug mode in development
     if os.getenv('FLASK_ENV') == 'development':
         # Start the scheduler in a separate thread
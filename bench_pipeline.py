@@ -0,0 +1,256 @@
+"""
+Benchmark the nightly score pipeline against a synthetic season.
+
+Fills a fresh SQLite database with N pools of M players each, stubs
+statsapi.schedule with a deterministic 162-game season, then replays the
+nightly job day by day, timing each phase separately:
+
+    ingest_final_scores -> update_scorecard -> update_player_scores -> complete_finished_games
+
+For every scale it reports wall time, SQL statement count and peak Python
+memory (tracemalloc) per phase, and writes the results as JSON so runs can be
+compared between commits.
+
+Usage:
+    python bench_pipeline.py --pools 100,1000,10000 --days 14 --output bench.json
+    python bench_pipeline.py --pools 100 --days 162 --no-memory
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+SEASON_START = datetime(2025, 3, 27)
+SEASON_DAYS = 162  # every team plays every day, so 162 games each
+
+# MLB Stats API ids and names of the 30 teams, in the order they are paired up
+MLB_TEAMS = [
+    (109, 'Arizona Diamondbacks'), (144, 'Atlanta Braves'), (110, 'Baltimore Orioles'),
+    (111, 'Boston Red Sox'), (145, 'Chicago White Sox'), (112, 'Chicago Cubs'),
+    (113, 'Cincinnati Reds'), (114, 'Cleveland Guardians'), (115, 'Colorado Rockies'),
+    (116, 'Detroit Tigers'), (117, 'Houston Astros'), (118, 'Kansas City Royals'),
+    (108, 'Los Angeles Angels'), (119, 'Los Angeles Dodgers'), (146, 'Miami Marlins'),
+    (158, 'Milwaukee Brewers'), (142, 'Minnesota Twins'), (147, 'New York Yankees'),
+    (121, 'New York Mets'), (133, 'Athletics'), (143, 'Philadelphia Phillies'),
+    (134, 'Pittsburgh Pirates'), (135, 'San Diego Padres'), (137, 'San Francisco Giants'),
+    (136, 'Seattle Mariners'), (138, 'St. Louis Cardinals'), (139, 'Tampa Bay Rays'),
+    (140, 'Texas Rangers'), (141, 'Toronto Blue Jays'), (120, 'Washington Nationals')
+]
+
+PHASES = ['ingest_final_scores', 'update_scorecard', 'update_player_scores', 'complete_finished_games']
+
+
+def synthetic_schedule(date=None, sportId=1, **kwargs):
+    """Deterministic stand-in for statsapi.schedule: 15 final regular-season games a day."""
+    day = datetime.strptime(date, '%m/%d/%Y')
+    if not SEASON_START <= day < SEASON_START + timedelta(days=SEASON_DAYS):
+        return []
+
+    rng = random.Random(day.toordinal())
+    teams = MLB_TEAMS[:]
+    rng.shuffle(teams)
+
+    schedule = []
+    for number in range(len(teams) // 2):
+        (away_id, away_name), (home_id, home_name) = teams[2 * number], teams[2 * number + 1]
+        # Roughly MLB-shaped run totals: mostly 0-9, occasionally into the teens
+        away_score = min(int(rng.expovariate(1 / 4.5)), 20)
+        home_score = min(int(rng.expovariate(1 / 4.5)), 20)
+        schedule.append({
+            'game_id': day.toordinal() * 100 + number,
+            'game_datetime': day.strftime('%Y-%m-%dT23:05:00Z'),
+            'game_date': day.strftime('%Y-%m-%d'),
+            'game_type': 'R',
+            'status': 'Final',
+            'away_id': away_id,
+            'away_name': away_name,
+            'home_id': home_id,
+            'home_name': home_name,
+            'away_score': away_score,
+            'home_score': home_score,
+            'doubleheader': 'N',
+            'game_num': 1,
+            'summary': f"{day:%Y-%m-%d} - {away_name} ({away_score}) @ {home_name} ({home_score}) (Final)"
+        })
+    return schedule
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+class QueryCounter:
+    """Counts the SQL statements an engine executes."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self.count = 0
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+
+    def _before_cursor_execute(self, *args):
+        self.count += 1
+
+    def remove(self, engine):
+        from sqlalchemy import event
+        event.remove(engine, 'before_cursor_execute', self._before_cursor_execute)
+
+
+def populate(app_module, pools, players_per_pool):
+    """Create the pools and players, with start dates spread over the first two weeks."""
+    db = app_module.db
+    rng = random.Random(pools)
+    team_ids = [team.id for team in app_module.team_registry.all()]
+
+    user = app_module.User(name='bench', email='bench@example.com', password='x')
+    db.session.add(user)
+    db.session.flush()
+
+    for pool in range(pools):
+        game = app_module.Game(
+            pool_name=f'Bench pool {pool}',
+            start_date=SEASON_START + timedelta(days=pool % 14) - timedelta(hours=1)
+        )
+        db.session.add(game)
+        db.session.flush()
+
+        for team_id in rng.sample(team_ids, min(players_per_pool, len(team_ids))):
+            if team_id == team_ids[0]:
+                db.session.add(app_module.Player(user_id=user.id, team_id=team_id, game_id=game.id))
+            else:
+                non_registered = app_module.NonRegisteredPlayer(name=f'Player {pool}-{team_id}', team_id=team_id)
+                db.session.add(non_registered)
+                db.session.flush()
+                db.session.add(app_module.Player(
+                    non_registered_player_id=non_registered.id, team_id=team_id, game_id=game.id
+                ))
+
+        if pool % 500 == 499:
+            db.session.commit()
+    db.session.commit()
+
+
+def run_phase(app_module, counter, totals, name, func, measure_memory):
+    """Run one pipeline phase, adding its wall time, query count and peak memory to totals."""
+    if measure_memory:
+        tracemalloc.start()
+    queries = counter.count
+    started = time.perf_counter()
+    try:
+        return func()
+    finally:
+        phase = totals[name]
+        phase['seconds'] += time.perf_counter() - started
+        phase['queries'] += counter.count - queries
+        if measure_memory:
+            phase['peak_kib'] = max(phase['peak_kib'], tracemalloc.get_traced_memory()[1] // 1024)
+            tracemalloc.stop()
+        app_module.db.session.remove()
+
+
+def run_scale(app_module, pools, players_per_pool, days, measure_memory):
+    """Replay ``days`` nights of the season against a fresh database with ``pools`` pools."""
+    app = app_module.app
+    db = app_module.db
+
+    # Every scale starts with a cold schedule cache
+    cache_path = f"{os.environ['SCHEDULE_CACHE_PATH']}.{pools}"
+    app_module.schedule_cache = app_module.ScheduleCache(cache_path)
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        app_module.seed_database()
+        app_module.team_registry.load()
+
+        started = time.perf_counter()
+        populate(app_module, pools, players_per_pool)
+        setup_seconds = time.perf_counter() - started
+
+        counter = QueryCounter(db.engine)
+        totals = {name: {'seconds': 0.0, 'queries': 0, 'peak_kib': 0} for name in PHASES}
+
+        try:
+            for day in range(days):
+                schedule_date = (SEASON_START + timedelta(days=day)).strftime('%m/%d/%Y')
+                run_phase(app_module, counter, totals, 'ingest_final_scores',
+                          lambda: app_module.ingest_final_scores(schedule_date), measure_memory)
+                changed = run_phase(app_module, counter, totals, 'update_scorecard',
+                                    app_module.update_scorecard, measure_memory)
+                run_phase(app_module, counter, totals, 'update_player_scores',
+                          app_module.update_player_scores, measure_memory)
+                run_phase(app_module, counter, totals, 'complete_finished_games',
+                          lambda: app_module.complete_finished_games(changed), measure_memory)
+        finally:
+            counter.remove(db.engine)
+
+        completed = app_module.Game.query.filter_by(status='completed').count()
+
+    for phase in totals.values():
+        phase['seconds'] = round(phase['seconds'], 4)
+
+    return {
+        'pools': pools,
+        'players_per_pool': players_per_pool,
+        'days': days,
+        'setup_seconds': round(setup_seconds, 3),
+        'total_seconds': round(sum(phase['seconds'] for phase in totals.values()), 4),
+        'pools_completed': completed,
+        'phases': totals
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pools', default='100,1000,10000', help='Comma-separated pool counts to run')
+    parser.add_argument('--players', type=int, default=10, help='Players (distinct teams) per pool')
+    parser.add_argument('--days', type=int, default=14,
+                        help=f'Nights of the season to replay (up to {SEASON_DAYS}); large scales take a while per night')
+    parser.add_argument('--no-memory', action='store_true', help='Skip tracemalloc, which slows every phase')
+    parser.add_argument('--output', help='Write the JSON results here as well as to stdout')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='runpool-bench-')
+    os.environ['DATABASE_URI'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ['SCHEDULE_CACHE_PATH'] = os.path.join(workdir, 'schedule_cache.db')
+    os.environ.setdefault('SECRET_KEY', 'bench')
+    os.environ.pop('FLASK_ENV', None)  # SQL echo would swamp the timings
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')  # keep the pipeline's INFO summaries out of the timings
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app as app_module
+    app_module.statsapi.schedule = synthetic_schedule
+
+    results = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'database': 'sqlite',
+        'run_at': datetime.utcnow().isoformat(timespec='seconds'),
+        'scales': []
+    }
+
+    for pools in (int(value) for value in args.pools.split(',')):
+        print(f"Benchmarking {pools} pools x {args.players} players over {args.days} days...", file=sys.stderr)
+        results['scales'].append(run_scale(app_module, pools, args.players, args.days, not args.no_memory))
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
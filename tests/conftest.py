@@ -0,0 +1,154 @@
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+
+# app.py configures itself from the environment at import time
+WORKDIR = tempfile.mkdtemp(prefix='runpool-tests-')
+os.environ['DATABASE_URI'] = f"sqlite:///{os.path.join(WORKDIR, 'test.db')}"
+os.environ['SCHEDULE_CACHE_PATH'] = os.path.join(WORKDIR, 'schedule_cache.db')
+os.environ['SECRET_KEY'] = 'test'
+os.environ['LOG_LEVEL'] = 'WARNING'
+os.environ['QUERY_STATS'] = '0'
+os.environ.pop('FLASK_ENV', None)
+os.environ.pop('LIVE_SCORES', None)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+def reset_database(runpool):
+    """Recreate and seed the schema. Needs an app context."""
+    runpool.db.session.remove()
+    runpool.db.drop_all()
+    runpool.db.create_all()
+    runpool.seed_database()
+    runpool.team_registry.load()
+
+
+@pytest.fixture
+def runpool(tmp_path, monkeypatch):
+    """The app module with a freshly created and seeded database, inside an app context."""
+    monkeypatch.setattr(app_module, 'schedule_cache', app_module.ScheduleCache(str(tmp_path / 'schedule_cache.db')))
+    with app_module.app.app_context():
+        reset_database(app_module)
+        yield app_module
+        app_module.db.session.remove()
+
+
+@pytest.fixture
+def mlb_schedules(runpool, monkeypatch):
+    """
+    Serve statsapi.schedule from a dict the test fills in: 'MM/DD/YYYY' -> list of games,
+    or an exception to raise. Every requested date is appended to the dict's 'calls' list.
+    """
+    schedules = {'calls': []}
+
+    def schedule(date=None, sportId=1, **kwargs):
+        schedules['calls'].append(date)
+        result = schedules.get(date, [])
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(runpool.statsapi, 'schedule', schedule)
+    return schedules
+
+
+def schedule_game(game_id, day, away, home, away_score, home_score, status='Final', game_type='R', **fields):
+    """One statsapi.schedule entry; ``away`` and ``home`` are full MLB team names."""
+    game = {
+        'game_id': game_id,
+        'game_datetime': day.strftime('%Y-%m-%dT23:05:00Z'),
+        'game_date': day.isoformat(),
+        'game_type': game_type,
+        'status': status,
+        'away_id': app_module.MLB_TEAM_IDS.get(app_module.TEAM_NAME_MAPPING.get(away)),
+        'away_name': away,
+        'home_id': app_module.MLB_TEAM_IDS.get(app_module.TEAM_NAME_MAPPING.get(home)),
+        'home_name': home,
+        'away_score': away_score,
+        'home_score': home_score,
+        'doubleheader': 'N',
+        'game_num': 1,
+        'summary': f"{day.isoformat()} - {away} ({away_score}) @ {home} ({home_score}) ({status})"
+    }
+    game.update(fields)
+    return game
+
+
+@pytest.fixture
+def client(runpool):
+    return runpool.app.test_client()
+
+
+@contextmanager
+def count_queries(engine):
+    """Count the SQL statements ``engine`` executes inside the block; yields a list holding the count."""
+    from sqlalchemy import event
+
+    count = [0]
+
+    def before_cursor_execute(*args):
+        count[0] += 1
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield count
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def add_pool(runpool, players, start_date=datetime(2024, 4, 1), pool_name='Test pool'):
+    """Create a pool with one player per team for the first ``players`` teams; the first is a registered user."""
+    db = runpool.db
+    game = runpool.Game(pool_name=pool_name, start_date=start_date)
+    db.session.add(game)
+    db.session.flush()
+
+    for number, team in enumerate(runpool.team_registry.all()[:players]):
+        if number == 0:
+            user = runpool.User(name=f'User {game.id}', email=f'user{game.id}@example.com', password='x')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(runpool.Player(user_id=user.id, team_id=team.id, game_id=game.id))
+        else:
+            non_registered = runpool.NonRegisteredPlayer(name=f'Player {team.name}', team_id=team.id)
+            db.session.add(non_registered)
+            db.session.flush()
+            db.session.add(runpool.Player(
+                non_registered_player_id=non_registered.id, team_id=team.id, game_id=game.id
+            ))
+        db.session.flush()
+    db.session.commit()
+    return game
+
+
+def add_results(runpool, day, scores, api_game_id=None):
+    """Store final MLB results for ``day``: ``scores`` maps Team.id -> runs."""
+    db = runpool.db
+    for offset, (team_id, score) in enumerate(scores.items()):
+        db.session.add(runpool.MLBGameResult(
+            api_game_id=api_game_id or day.toordinal() * 100 + offset,
+            team_id=team_id,
+            score=score,
+            date=day,
+            game_datetime=datetime.combine(day, datetime.min.time()).replace(hour=23),
+            final=True
+        ))
+    db.session.commit()
+
+
+def login(runpool, client, game):
+    """Make the pool's registered player a user with a known password and log them in."""
+    user = runpool.Player.query.filter(
+        runpool.Player.game_id == game.id, runpool.Player.user_id.isnot(None)
+    ).one().user
+    user.password = runpool.bcrypt.generate_password_hash('secret').decode('utf-8')
+    runpool.db.session.commit()
+    client.post('/login', data={'email': user.email, 'password': 'secret'}, follow_redirects=True)
+    return user
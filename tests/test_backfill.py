@@ -0,0 +1,73 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import add_pool, schedule_game
+
+START = date(2024, 4, 1)
+
+
+class InlineExecutor:
+    """Runs submitted backfills straight away, in the calling thread."""
+
+    def submit(self, func, *args):
+        func(*args)
+
+
+@pytest.fixture
+def backfill_game(runpool, mlb_schedules, monkeypatch):
+    monkeypatch.setattr(runpool, 'BACKFILL_RETRY_SECONDS', 0)
+    monkeypatch.setattr(runpool, 'backfill_executor', InlineExecutor())
+
+    for day in range(3):
+        mlb_day = START + timedelta(days=day)
+        mlb_schedules[mlb_day.strftime('%m/%d/%Y')] = [
+            schedule_game(1000 + day, mlb_day, 'Atlanta Braves', 'Boston Red Sox', day, day + 3)
+        ]
+    return add_pool(runpool, players=2, start_date=datetime(2024, 4, 1))
+
+
+def add_backfill_job(runpool, game, **fields):
+    job = runpool.BackfillJob(game_id=game.id, total_days=3, completed_days=0, status="pending",
+                              created_at=datetime.now(), updated_at=datetime.now())
+    for name, value in fields.items():
+        setattr(job, name, value)
+    runpool.db.session.add(job)
+    runpool.db.session.commit()
+    return job.id
+
+
+def test_failed_day_fails_the_backfill_after_retries(runpool, mlb_schedules, backfill_game):
+    mlb_schedules['04/02/2024'] = ConnectionError('MLB API unavailable')
+    job_id = add_backfill_job(runpool, backfill_game)
+
+    runpool.run_backfill(job_id)
+
+    runpool.db.session.expire_all()
+    job = runpool.BackfillJob.query.get(job_id)
+    assert job.status == "failed"
+    assert 'MLB API unavailable' in job.error
+    # The failed day is not counted as done
+    assert job.completed_days == 1
+    assert mlb_schedules['calls'].count('04/02/2024') == runpool.BACKFILL_DAY_ATTEMPTS
+
+
+def test_stale_backfill_is_resumed_from_its_last_day(runpool, mlb_schedules, backfill_game):
+    stale = datetime.now() - timedelta(seconds=runpool.BACKFILL_STALE_SECONDS + 60)
+    job_id = add_backfill_job(runpool, backfill_game, status="running", completed_days=1, updated_at=stale)
+
+    assert runpool.resume_stale_backfills() == [job_id]
+
+    runpool.db.session.expire_all()
+    job = runpool.BackfillJob.query.get(job_id)
+    assert job.status == "completed"
+    assert job.completed_days == 3
+    assert '04/01/2024' not in mlb_schedules['calls']
+    coverage = runpool.TeamCoverage.query.filter_by(game_id=backfill_game.id).count()
+    assert coverage == 2
+
+
+def test_backfill_still_making_progress_is_left_alone(runpool, backfill_game):
+    add_backfill_job(runpool, backfill_game, status="running", completed_days=1)
+
+    assert runpool.resume_stale_backfills() == []
@@ -0,0 +1,47 @@
+from conftest import add_pool
+
+
+def test_matching_etag_gets_not_modified(runpool, client):
+    game = add_pool(runpool, players=2)
+    url = f'/game/{game.token}/scorecard'
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert first.cache_control.private and first.cache_control.no_cache
+
+    response = client.get(url, headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+
+
+def test_data_version_bump_changes_the_etag(runpool, client):
+    game = add_pool(runpool, players=2)
+    url = f'/game/{game.token}/scorecard'
+    etag = client.get(url).headers['ETag']
+
+    runpool.bump_data_version([game.id])
+    runpool.db.session.commit()
+
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert client.get(url, headers={'If-None-Match': response.headers['ETag']}).status_code == 304
+
+
+def test_page_with_pending_flashes_is_never_tagged(runpool, client):
+    game = add_pool(runpool, players=2)
+    url = f'/game/{game.token}/scorecard'
+    etag = client.get(url).headers['ETag']
+
+    with client.session_transaction() as session:
+        session['_flashes'] = [('success', 'Scores refreshed')]
+    response = client.get(url, headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert b'Scores refreshed' in response.data
+    assert 'ETag' not in response.headers
+    # Once the flash has been shown the page is cacheable again
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
@@ -0,0 +1,34 @@
+from datetime import date, datetime
+
+from conftest import add_pool, add_results, login
+
+
+def create_game(runpool, client, start_date, team_ids):
+    client.post('/create_game', data={
+        'pool_name': 'Late pool',
+        'start_date': start_date.strftime('%Y-%m-%d'),
+        'team_id': team_ids[0],
+        'player_names[]': [f'Friend {team_id}' for team_id in team_ids[1:]],
+        'team_id[]': team_ids[1:],
+    }, follow_redirects=True)
+    return runpool.Game.query.filter_by(pool_name='Late pool').one()
+
+
+def test_pool_started_today_counts_results_already_scored(runpool, client):
+    today = date.today()
+    earlier_pool = add_pool(runpool, players=2, start_date=datetime.combine(today, datetime.min.time()))
+    teams = [team.id for team in runpool.team_registry.all()[:2]]
+    add_results(runpool, today, {teams[0]: 4, teams[1]: 13})
+    # Today's results are folded into the existing pool, moving the watermark past them
+    runpool.update_scorecard()
+    login(runpool, client, earlier_pool)
+
+    game = create_game(runpool, client, today, teams)
+
+    assert runpool.BackfillJob.query.filter_by(game_id=game.id).count() == 0
+    masks = dict(runpool.db.session.query(runpool.TeamCoverage.team_id, runpool.TeamCoverage.run_mask)
+                 .filter_by(game_id=game.id))
+    assert masks == {teams[0]: 1 << 4, teams[1]: 1 << 13}
+    scores = {player.team_id: player.score or player.non_registered_player.score
+              for player in runpool.Player.query.filter_by(game_id=game.id)}
+    assert scores == {teams[0]: 1, teams[1]: 1}
@@ -0,0 +1,64 @@
+import re
+from datetime import datetime
+from urllib.parse import parse_qs, urlparse
+
+from conftest import add_pool, login
+
+POOL_NAME = re.compile(r'fa-trophy mr-2"></i>\s*(Pool \d+)')
+SHOW_MORE = re.compile(r'href="([^"]*)" class="btn btn-outline-secondary btn-sm">\s*<i[^>]*></i>Show more (\w+) games')
+
+
+def join_pools(runpool, user, count, first_number, status="active"):
+    """Add ``user`` to ``count`` new pools named "Pool <n>"; returns their ids, oldest first."""
+    team_id = runpool.team_registry.all()[0].id
+    game_ids = []
+    for number in range(first_number, first_number + count):
+        game = runpool.Game(pool_name=f'Pool {number:02d}', start_date=datetime(2024, 4, 1), status=status)
+        runpool.db.session.add(game)
+        runpool.db.session.flush()
+        runpool.db.session.add(runpool.Player(user_id=user.id, team_id=team_id, game_id=game.id))
+        game_ids.append(game.id)
+    runpool.db.session.commit()
+    return game_ids
+
+
+def show_more_links(html):
+    return {section: link.replace('&amp;', '&') for link, section in SHOW_MORE.findall(html)}
+
+
+def test_active_pools_page_by_cursor_without_gaps_or_duplicates(runpool, client, monkeypatch):
+    monkeypatch.setattr(runpool, 'DASHBOARD_PAGE_SIZE', 3)
+    user = login(runpool, client, add_pool(runpool, players=2, pool_name='Pool 00'))
+    active_ids = [runpool.Game.query.filter_by(pool_name='Pool 00').one().id]
+    active_ids += join_pools(runpool, user, 6, first_number=1)
+    join_pools(runpool, user, 2, first_number=7, status="completed")
+
+    pages, cursors = [], []
+    url = '/dashboard'
+    while url:
+        html = client.get(url).get_data(as_text=True)
+        pages.append(POOL_NAME.findall(html))
+        url = show_more_links(html).get('active')
+        if url:
+            cursors.append(int(parse_qs(urlparse(url).query)['active_before'][0]))
+
+    # Newest first, three a page; completed pools show on every page of active ones
+    completed = ['Pool 08', 'Pool 07']
+    assert pages == [
+        ['Pool 06', 'Pool 05', 'Pool 04'] + completed,
+        ['Pool 03', 'Pool 02', 'Pool 01'] + completed,
+        ['Pool 00'] + completed,
+    ]
+    # Each cursor is the id of the last pool on the page before it
+    assert cursors == [active_ids[4], active_ids[1]]
+
+
+def test_page_filling_exactly_has_no_next_link(runpool, client, monkeypatch):
+    monkeypatch.setattr(runpool, 'DASHBOARD_PAGE_SIZE', 3)
+    user = login(runpool, client, add_pool(runpool, players=2, pool_name='Pool 00'))
+    join_pools(runpool, user, 2, first_number=1)
+
+    html = client.get('/dashboard').get_data(as_text=True)
+
+    assert POOL_NAME.findall(html) == ['Pool 02', 'Pool 01', 'Pool 00']
+    assert show_more_links(html) == {}
@@ -0,0 +1,141 @@
+import json
+from datetime import date, datetime, timedelta
+
+from conftest import add_pool, add_results
+
+OPENING_DAY = date(2024, 4, 2)
+
+
+def play(runpool, team_id, scores, first_day=OPENING_DAY):
+    """Store one final result a day for ``team_id``, starting at ``first_day``."""
+    for offset, score in enumerate(scores):
+        day = first_day + timedelta(days=offset)
+        add_results(runpool, day, {team_id: score}, api_game_id=day.toordinal() * 100 + team_id)
+
+
+def score(runpool):
+    runpool.update_scorecard()
+    runpool.update_player_scores()
+
+
+def first_player(runpool, game, team_id):
+    return runpool.Player.query.filter_by(game_id=game.id, team_id=team_id).first().id
+
+
+def test_single_complete_team_wins(runpool):
+    game = add_pool(runpool, players=3)
+    first, second, _ = [team.id for team in runpool.team_registry.all()[:3]]
+    play(runpool, first, range(14))
+    play(runpool, second, range(13))
+    score(runpool)
+
+    result = runpool.evaluate_game_winner(game.id)
+
+    assert result['winner_team_id'] == first
+    assert result['winner_player_id'] == first_player(runpool, game, first)
+    assert result['end_date'] == OPENING_DAY + timedelta(days=13)
+    assert result['tiebreaker_notes']['total_candidates'] == 1
+
+
+def test_earliest_completion_date_wins(runpool):
+    game = add_pool(runpool, players=2)
+    first, second = [team.id for team in runpool.team_registry.all()[:2]]
+    play(runpool, first, range(14), first_day=OPENING_DAY + timedelta(days=1))
+    # More games played, but done a day earlier: the date decides
+    play(runpool, second, range(14))
+    add_results(runpool, OPENING_DAY, {second: 20}, api_game_id=1)
+    score(runpool)
+
+    result = runpool.evaluate_game_winner(game.id)
+
+    assert result['winner_team_id'] == second
+    assert result['end_date'] == OPENING_DAY + timedelta(days=13)
+    assert result['tiebreaker_notes']['total_candidates'] == 2
+    assert result['tiebreaker_notes']['earliest_date_candidates'] == 1
+
+
+def test_same_date_fewest_games_played_wins(runpool):
+    game = add_pool(runpool, players=2)
+    first, second = [team.id for team in runpool.team_registry.all()[:2]]
+    play(runpool, first, range(14))
+    play(runpool, second, range(14))
+    # A doubleheader game that reaches no new run total still counts as played
+    add_results(runpool, OPENING_DAY, {first: 20}, api_game_id=1)
+    score(runpool)
+
+    result = runpool.evaluate_game_winner(game.id)
+
+    assert result['winner_team_id'] == second
+    assert result['end_date'] == OPENING_DAY + timedelta(days=13)
+    assert result['tiebreaker_notes']['earliest_date_candidates'] == 2
+    assert result['tiebreaker_notes']['games_played'] == 14
+
+
+def test_same_date_and_games_played_compares_run_totals_from_13_down(runpool):
+    game = add_pool(runpool, players=2)
+    first, second = [team.id for team in runpool.team_registry.all()[:2]]
+    # Both finish on day 14 with 14 games; the second reached 13 runs first
+    play(runpool, first, [12, 13] + list(range(12)))
+    play(runpool, second, [13, 12] + list(range(12)))
+    score(runpool)
+
+    result = runpool.evaluate_game_winner(game.id)
+
+    assert result['winner_team_id'] == second
+    assert result['tiebreaker_notes']['fewest_games_candidates'] == 2
+
+
+def test_batch_evaluation_matches_each_pool_alone(runpool):
+    early = add_pool(runpool, players=2, pool_name='Early')
+    # The late pool misses both teams' first day, so the first team only completes with its second 0
+    late = add_pool(runpool, players=2, start_date=datetime(2024, 4, 3), pool_name='Late')
+    empty = add_pool(runpool, players=2, start_date=datetime(2024, 6, 1), pool_name='Empty')
+    first, second = [team.id for team in runpool.team_registry.all()[:2]]
+    play(runpool, first, list(range(14)) + [5, 0])
+    play(runpool, second, [20] + list(range(14)))
+    score(runpool)
+
+    batch = runpool.evaluate_game_winners([early.id, late.id, empty.id])
+
+    assert batch == {game_id: runpool.evaluate_game_winner(game_id) for game_id in (early.id, late.id)}
+    assert batch[early.id]['winner_team_id'] == first
+    assert batch[late.id]['winner_team_id'] == second
+    assert runpool.evaluate_game_winners() == batch
+
+
+def test_pool_left_complete_by_a_failed_run_is_completed_later(runpool):
+    game = add_pool(runpool, players=2)
+    first = runpool.team_registry.all()[0].id
+    play(runpool, first, range(14))
+    # The run that completed the team failed before complete_games
+    score(runpool)
+
+    # The next run's scorecard changes nothing, but the pool is still due
+    assert runpool.complete_finished_games(set()) == 1
+
+    runpool.db.session.expire_all()
+    game = runpool.Game.query.get(game.id)
+    assert game.status == "completed"
+    assert game.winner_team_id == first
+    assert json.loads(game.tiebreaker_notes)['total_candidates'] == 1
+    assert runpool.games_awaiting_winner() == set()
+
+
+def test_games_played_stop_counting_when_the_pool_completes(runpool):
+    game = add_pool(runpool, players=2)
+    first, second = [team.id for team in runpool.team_registry.all()[:2]]
+    play(runpool, first, range(14))
+    play(runpool, second, range(14), first_day=OPENING_DAY + timedelta(days=1))
+    score(runpool)
+    runpool.complete_finished_games([game.id])
+    winning_day = OPENING_DAY + timedelta(days=13)
+
+    # The second game of a doubleheader on the winning day still counts; later days don't
+    add_results(runpool, winning_day, {first: 20}, api_game_id=2)
+    play(runpool, first, [3, 4], first_day=winning_day + timedelta(days=1))
+
+    runpool.db.session.expire_all()
+    game = runpool.Game.query.get(game.id)
+    assert game.status == "completed"
+    assert runpool.games_played_by_team(game, [first, second]) == {first: 15, second: 13}
+    assert runpool.games_played_by_game_team([game.id], [first, second]) == {(game.id, first): 15, (game.id, second): 13}
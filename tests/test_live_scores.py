@@ -0,0 +1,110 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import add_pool, schedule_game
+
+AWAY, HOME = 'Atlanta Braves', 'Boston Red Sox'
+
+
+@pytest.fixture
+def live(runpool, mlb_schedules, monkeypatch):
+    """Poll on every call, never serving an unsettled date from the schedule cache."""
+    monkeypatch.setattr(runpool, 'LIVE_POLL_SECONDS', 0)
+    monkeypatch.setitem(runpool.live_poll_state, 'next_poll_at', None)
+
+    def poll(*games):
+        mlb_schedules[date.today().strftime('%m/%d/%Y')] = list(games)
+        runpool.live_poll_state['next_poll_at'] = None
+        promoted = runpool.poll_live_scores()
+        runpool.db.session.expire_all()
+        return promoted
+
+    return poll
+
+
+def stored(runpool):
+    return sorted((row.final, row.score) for row in runpool.MLBGameResult.query)
+
+
+def test_live_game_is_promoted_to_final(runpool, live):
+    today = date.today()
+    game = add_pool(runpool, players=2, start_date=datetime.combine(today, datetime.min.time()))
+    away, home = runpool.team_registry.id_for_full_name(AWAY), runpool.team_registry.id_for_full_name(HOME)
+
+    assert live(schedule_game(1, today, AWAY, HOME, 0, 0, status='Scheduled')) == []
+    assert stored(runpool) == []
+
+    assert live(schedule_game(1, today, AWAY, HOME, 2, 1, status='In Progress')) == []
+    assert stored(runpool) == [(False, 1), (False, 2)]
+    # Provisional scores never reach the pools
+    assert runpool.IngestWatermark.get_last_id('scorecard') == 0
+    assert runpool.TeamCoverage.query.filter_by(game_id=game.id).count() == 0
+
+    promoted = live(schedule_game(1, today, AWAY, HOME, 3, 1, status='Final'))
+
+    assert sorted((row['team_id'], row['score']) for row in promoted) == sorted([(away, 3), (home, 1)])
+    assert stored(runpool) == [(True, 1), (True, 3)]
+    final_ids = [row.id for row in runpool.MLBGameResult.query]
+    assert runpool.IngestWatermark.get_last_id('scorecard') == max(final_ids)
+    masks = dict(runpool.db.session.query(runpool.TeamCoverage.team_id, runpool.TeamCoverage.run_mask)
+                 .filter_by(game_id=game.id))
+    assert masks == {away: 1 << 3, home: 1 << 1}
+
+    # Polling the final game again stores and scores nothing new
+    assert live(schedule_game(1, today, AWAY, HOME, 3, 1, status='Final')) == []
+
+
+@pytest.mark.parametrize('status', ['Postponed', 'Suspended: Rain', 'Cancelled'])
+def test_provisional_scores_of_a_game_called_off_are_removed(runpool, live, mlb_schedules, status):
+    today = date.today()
+    live(schedule_game(1, today, AWAY, HOME, 2, 1, status='In Progress'))
+    assert stored(runpool) == [(False, 1), (False, 2)]
+
+    live(schedule_game(1, today, AWAY, HOME, 2, 1, status=status))
+
+    assert stored(runpool) == []
+    # Called off is settled: the date is no longer fetched on every poll
+    calls = len(mlb_schedules['calls'])
+    runpool.live_poll_state['next_poll_at'] = None
+    runpool.poll_live_scores()
+    assert len(mlb_schedules['calls']) == calls
+
+
+def test_date_with_a_suspended_game_is_settled(runpool):
+    day = date.today() - timedelta(days=1)
+    yesterday = day.strftime('%m/%d/%Y')
+    assert runpool.ScheduleCache.is_settled(yesterday, [
+        schedule_game(1, day, AWAY, HOME, 2, 1, status='Suspended: Rain'),
+        schedule_game(2, day, HOME, AWAY, 4, 0, status='Game Over'),
+    ])
+    assert not runpool.ScheduleCache.is_settled(yesterday, [
+        schedule_game(1, day, AWAY, HOME, 2, 1, status='Delayed: Rain'),
+    ])
+
+
+NOW = datetime(2024, 7, 13, 20, 0)
+
+
+def next_poll(runpool, *statuses, day=date(2024, 7, 13)):
+    schedule = [schedule_game(game_id, day, AWAY, HOME, 0, 0, status=status) for game_id, status in enumerate(statuses)]
+    return runpool.next_live_poll_at([schedule], NOW)
+
+
+def test_live_game_polls_again_after_the_interval(runpool):
+    assert next_poll(runpool, 'Final', 'In Progress', 'Scheduled') == NOW + timedelta(seconds=runpool.LIVE_POLL_SECONDS)
+
+
+def test_poller_waits_for_the_next_first_pitch(runpool):
+    # schedule_game starts every game at 23:05 UTC
+    assert next_poll(runpool, 'Final', 'Scheduled') == datetime(2024, 7, 13, 23, 5)
+
+
+def test_first_pitch_already_past_polls_after_the_interval(runpool):
+    assert next_poll(runpool, 'Delayed Start: Rain', day=date(2024, 7, 12)) == NOW + timedelta(seconds=runpool.LIVE_POLL_SECONDS)
+
+
+def test_nothing_left_sleeps_until_local_midnight(runpool):
+    next_poll_at = next_poll(runpool, 'Final', 'Postponed', 'Suspended: Rain')
+    local_midnight = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+    assert abs((next_poll_at - NOW) - (local_midnight - datetime.now())) < timedelta(seconds=5)
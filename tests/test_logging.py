@@ -0,0 +1,88 @@
+import io
+import json
+import logging
+import sys
+
+
+def make_record(message='Scored %s', args=('pool',), **extra):
+    record = logging.LogRecord('runpool.scorecard', logging.DEBUG, __file__, 1, message, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_sampler_passes_one_in_every_records_per_key(runpool):
+    sampler = runpool.LogSampler(every=3)
+
+    passed = [sampler.filter(make_record(sample_key='pool')) for _ in range(7)]
+
+    assert passed == [True, False, False, True, False, False, True]
+    # Each key is counted on its own
+    assert sampler.filter(make_record(sample_key='other'))
+
+
+def test_sampler_passes_records_without_a_key(runpool):
+    sampler = runpool.LogSampler(every=100)
+
+    assert all(sampler.filter(make_record()) for _ in range(5))
+
+
+def test_sampled_record_carries_its_count(runpool):
+    sampler = runpool.LogSampler(every=2)
+    records = [make_record(sample_key='pool') for _ in range(3)]
+    for record in records:
+        sampler.filter(record)
+
+    assert [record.sample_count for record in records] == [1, 2, 3]
+
+
+def test_json_formatter_writes_standard_and_extra_fields(runpool):
+    record = make_record(game_id=7, job='nightly')
+
+    entry = json.loads(runpool.JsonLogFormatter().format(record))
+
+    assert entry.pop('time').endswith('Z')
+    assert entry == {
+        'level': 'DEBUG',
+        'logger': 'runpool.scorecard',
+        'message': 'Scored pool',
+        'game_id': 7,
+        'job': 'nightly'
+    }
+
+
+def test_json_formatter_includes_the_exception(runpool):
+    try:
+        raise ValueError('bad score')
+    except ValueError:
+        record = logging.LogRecord('runpool.jobs', logging.ERROR, __file__, 1, 'Failed', (), sys.exc_info())
+
+    entry = json.loads(runpool.JsonLogFormatter().format(record))
+
+    assert entry['level'] == 'ERROR'
+    assert 'ValueError: bad score' in entry['exception']
+
+
+def test_json_formatter_stringifies_values_json_cannot_encode(runpool):
+    from datetime import date
+
+    entry = json.loads(runpool.JsonLogFormatter().format(make_record(day=date(2024, 4, 2))))
+
+    assert entry['day'] == '2024-04-02'
+
+
+def test_configured_handler_samples_and_writes_json(runpool):
+    handler = logging.getLogger('runpool').handlers[0]
+    stream = io.StringIO()
+    previous = handler.setStream(stream)
+    try:
+        for number in range(runpool.LOG_SAMPLE_EVERY + 1):
+            runpool.scorecard_logger.warning("Pool %d scored", number, extra={'sample_key': 'handler-test'})
+    finally:
+        handler.setStream(previous)
+
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(entry['message'], entry['sample_count']) for entry in entries] == [
+        ('Pool 0 scored', 1), (f'Pool {runpool.LOG_SAMPLE_EVERY} scored', runpool.LOG_SAMPLE_EVERY + 1)
+    ]
+    assert entries[0]['logger'] == 'runpool.scorecard'
+    assert entries[0]['sample_key'] == 'handler-test'
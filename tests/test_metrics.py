@@ -0,0 +1,58 @@
+import json
+from datetime import datetime
+
+PROXY = {'REMOTE_ADDR': '10.0.0.5'}
+
+
+def record_run(runpool, status="success"):
+    recorder = runpool.JobRunRecorder('nightly')
+    with recorder.phase('store_results') as phase:
+        phase['rows'] = 4
+    with recorder.phase('update_scorecard') as phase:
+        phase['rows'] = 2
+    recorder.finish(status)
+    return recorder.run
+
+
+def test_latest_successful_run_is_exported(runpool, client):
+    run = record_run(runpool)
+    runpool.db.session.add(runpool.IngestRun(job='nightly', status="failed", started_at=datetime.utcnow(),
+                                             finished_at=datetime.utcnow(), summary=json.dumps({'error': 'boom'})))
+    runpool.db.session.commit()
+
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain; version=0.0.4')
+    lines = response.get_data(as_text=True).splitlines()
+    assert '# TYPE runpool_job_runs gauge' in lines
+    assert 'runpool_job_runs{job="nightly",status="success"} 1' in lines
+    assert 'runpool_job_runs{job="nightly",status="failed"} 1' in lines
+    assert 'runpool_job_running{job="nightly"} 0' in lines
+    # Per-phase figures come from the latest successful run, not the failed one after it
+    assert 'runpool_job_phase_rows{job="nightly",phase="store_results"} 4' in lines
+    assert 'runpool_job_phase_rows{job="nightly",phase="update_scorecard"} 2' in lines
+    assert 'runpool_job_upstream_calls{job="nightly"} 0' in lines
+    finished = run.finished_at.replace(tzinfo=runpool.timezone.utc).timestamp()
+    assert f'runpool_job_last_success_timestamp_seconds{{job="nightly"}} {finished}' in lines
+    assert 'runpool_schedule_cache_hits_total 0' in lines
+
+
+def test_metrics_are_hidden_from_other_addresses(runpool, client):
+    assert client.get('/metrics', environ_base=PROXY).status_code == 404
+
+
+def test_token_opens_metrics_behind_a_proxy(runpool, client, monkeypatch):
+    monkeypatch.setattr(runpool, 'METRICS_TOKEN', 'scrape-me')
+
+    assert client.get('/metrics', environ_base=PROXY,
+                      headers={'Authorization': 'Bearer scrape-me'}).status_code == 200
+    assert client.get('/metrics', environ_base=PROXY,
+                      headers={'Authorization': 'Bearer wrong'}).status_code == 404
+
+
+def test_allowlisted_address_needs_no_token(runpool, client, monkeypatch):
+    monkeypatch.setattr(runpool, 'METRICS_ALLOWED_IPS', {'10.0.0.5'})
+
+    assert client.get('/metrics', environ_base=PROXY).status_code == 200
+    assert client.get('/metrics').status_code == 404
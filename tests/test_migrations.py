@@ -0,0 +1,50 @@
+import os
+
+import pytest
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+
+def test_migrate_database_from_another_directory(runpool, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runpool.db.drop_all()
+    runpool.db.session.execute(text('DROP TABLE IF EXISTS alembic_version'))
+    runpool.db.session.commit()
+
+    runpool.migrate_database()
+
+    head = ScriptDirectory(os.path.join(os.path.dirname(runpool.__file__), 'alembic')).get_current_head()
+    revision = runpool.db.session.execute(text('SELECT version_num FROM alembic_version')).scalar()
+    assert revision == head
+    assert 'game' in runpool.db.inspect(runpool.db.engine).get_table_names()
+
+
+def drop_alembic_version(runpool):
+    runpool.db.session.execute(text('DROP TABLE IF EXISTS alembic_version'))
+    runpool.db.session.commit()
+
+
+def test_wait_for_migrations_returns_once_the_schema_is_at_head(runpool, monkeypatch):
+    from alembic import command
+
+    drop_alembic_version(runpool)
+    sleeps = []
+
+    def sleep(seconds):
+        # Another service finishes migrating while the worker waits
+        sleeps.append(seconds)
+        command.stamp(runpool.alembic_config(), 'head')
+
+    monkeypatch.setattr(runpool.time, 'sleep', sleep)
+
+    runpool.wait_for_migrations(timeout=60)
+
+    assert sleeps == [runpool.MIGRATION_POLL_SECONDS]
+
+
+def test_wait_for_migrations_gives_up_on_an_unmigrated_schema(runpool, monkeypatch):
+    drop_alembic_version(runpool)
+    monkeypatch.setattr(runpool.time, 'sleep', lambda seconds: None)
+
+    with pytest.raises(RuntimeError, match='init-db'):
+        runpool.wait_for_migrations(timeout=0)
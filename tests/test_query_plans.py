@@ -0,0 +1,112 @@
+import re
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from conftest import add_pool, add_results
+
+# Tables that grow with the season or the number of pools; a hot query must never scan them. game is
+# left out: the ingest's data_version bump by start date touches most pools, so a scan is the right plan
+LARGE_TABLES = ('mlb_game_result', 'player', 'team_coverage', 'team_game_run_totals')
+
+
+def capture_query_plans(runpool, func):
+    """Run ``func`` and return (statement, EXPLAIN QUERY PLAN details) for every SELECT, INSERT and UPDATE it ran."""
+    engine = runpool.db.engine
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(('SELECT', 'INSERT', 'UPDATE')):
+            statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        func()
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+    connection = engine.raw_connection()
+    try:
+        return [
+            (' '.join(statement.split()), [row[3] for row in connection.execute('EXPLAIN QUERY PLAN ' + statement, parameters)])
+            for statement, parameters in statements
+        ]
+    finally:
+        connection.close()
+
+
+def plan_lines(plans):
+    return [line for statement, plan in plans for line in plan]
+
+
+def assert_plan(plans, pattern):
+    assert any(re.search(pattern, line) for line in plan_lines(plans)), \
+        f"no plan matches {pattern!r}:\n" + '\n'.join(plan_lines(plans))
+
+
+def assert_no_scans(plans):
+    for statement, plan in plans:
+        for line in plan:
+            assert not re.match(rf"SCAN ({'|'.join(LARGE_TABLES)})\b", line), f"{line}\n  in {statement}"
+
+
+def populate(runpool):
+    game = add_pool(runpool, players=10)
+    teams = [team.id for team in runpool.team_registry.all()]
+    for day in range(5):
+        add_results(runpool, date(2024, 4, 2) + timedelta(days=day),
+                    {team_id: (team_id + day) % 14 for team_id in teams})
+    return game
+
+
+def test_nightly_pipeline_queries_search_indexes(runpool):
+    populate(runpool)
+
+    def pipeline():
+        runpool.update_scorecard()
+        runpool.update_player_scores()
+        runpool.evaluate_game_winners()
+        runpool.complete_finished_games(set())
+
+    plans = capture_query_plans(runpool, pipeline)
+
+    assert_no_scans(plans)
+    # New results since the watermark, joined to the active pools
+    assert_plan(plans, r'SEARCH mlb_game_result USING INTEGER PRIMARY KEY \(rowid>\? AND rowid<\?\)')
+    assert_plan(plans, r'SEARCH game USING COVERING INDEX ix_game_status_start_date \(status=\?')
+    # Which pool/team/run totals are new
+    assert_plan(plans, r'SEARCH team_game_run_totals USING INDEX sqlite_autoindex_team_game_run_totals_1 '
+                       r'\(team_id=\? AND game_id=\? AND run_total=\?\)')
+    # Player scores and winner evaluation
+    assert_plan(plans, r'SEARCH player USING (COVERING )?INDEX ix_player_game_team \(game_id=\?\)')
+    assert_plan(plans, r'SEARCH team_coverage USING INDEX sqlite_autoindex_team_coverage_1 \(game_id=\?')
+    # Pools still waiting for a winner
+    assert_plan(plans, r'SEARCH team_coverage USING (COVERING )?INDEX ix_team_coverage_run_mask \(run_mask=\?\)')
+
+
+def test_scorecard_queries_search_indexes(runpool, client):
+    game = populate(runpool)
+    runpool.update_scorecard()
+
+    plans = capture_query_plans(runpool, lambda: client.get(f'/game/{game.token}/scorecard'))
+
+    assert_no_scans(plans)
+    assert_plan(plans, r'SEARCH game USING INDEX sqlite_autoindex_game_1 \(token=\?\)')
+    assert_plan(plans, r'SEARCH player USING INDEX ix_player_game_team \(game_id=\?\)')
+    assert_plan(plans, r'SEARCH team_coverage USING INDEX sqlite_autoindex_team_coverage_1 \(game_id=\?\)')
+    # Games played is answered from the index alone
+    assert_plan(plans, r'SEARCH mlb_game_result USING COVERING INDEX ix_mlb_game_result_team_datetime '
+                       r'\(team_id=\? AND game_datetime>\?\)')
+
+
+def test_ingest_dedupe_searches_the_unique_index(runpool):
+    populate(runpool)
+    parsed = [
+        runpool.TeamScore(api_game_id=9001, team_id=1, score=4, game_datetime=runpool.datetime(2024, 4, 8, 23)),
+        runpool.TeamScore(api_game_id=9001, team_id=2, score=6, game_datetime=runpool.datetime(2024, 4, 8, 23)),
+    ]
+
+    plans = capture_query_plans(runpool, lambda: runpool.ingest_final_scores('04/08/2024', parsed))
+
+    assert_no_scans(plans)
+    assert_plan(plans, r'SEARCH mlb_game_result USING (COVERING )?INDEX sqlite_autoindex_mlb_game_result_1 \(api_game_id=\?\)')
@@ -0,0 +1,74 @@
+import logging
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from conftest import add_pool, count_queries
+
+
+@pytest.fixture
+def query_stats(runpool, monkeypatch):
+    """Turn query counting on, as QUERY_STATS=1 does at import time."""
+    monkeypatch.setattr(runpool, 'QUERY_STATS_ENABLED', True)
+    event.listen(Engine, 'before_cursor_execute', runpool._before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', runpool._after_cursor_execute)
+    yield
+    event.remove(Engine, 'before_cursor_execute', runpool._before_cursor_execute)
+    event.remove(Engine, 'after_cursor_execute', runpool._after_cursor_execute)
+
+
+@pytest.fixture
+def db_warnings(caplog):
+    """Capture the 'runpool' loggers' warnings, which don't propagate to the root logger."""
+    logger = logging.getLogger('runpool')
+    logger.addHandler(caplog.handler)
+    caplog.set_level(logging.WARNING, logger='runpool')
+    yield caplog
+    logger.removeHandler(caplog.handler)
+
+
+def test_request_reports_its_query_count(runpool, client, query_stats):
+    url = f'/game/{add_pool(runpool, players=2).token}/scorecard'
+
+    with count_queries(runpool.db.engine) as count:
+        response = client.get(url)
+
+    assert response.status_code == 200
+    assert int(response.headers['X-Query-Count']) == count[0] > 0
+    assert f'desc="{count[0]} queries"' in response.headers['Server-Timing']
+
+
+def test_no_query_headers_when_disabled(runpool, client):
+    game = add_pool(runpool, players=2)
+
+    response = client.get(f'/game/{game.token}/scorecard')
+
+    assert 'X-Query-Count' not in response.headers
+    assert 'Server-Timing' not in response.headers
+
+
+def test_repeated_statement_shape_is_reported_as_n_plus_one(runpool, query_stats, db_warnings, monkeypatch):
+    monkeypatch.setattr(runpool, 'N_PLUS_ONE_THRESHOLD', 3)
+
+    with runpool.query_scope('load pools') as stats:
+        # Differently sized IN lists are the same statement shape
+        for ids in ('1', '1, 2', '1, 2, 3', '4', '5, 6'):
+            runpool.db.session.execute(text(f'SELECT id FROM game WHERE id IN ({ids})')).all()
+        runpool.db.session.execute(text('SELECT count(*) FROM team')).scalar()
+    runpool.report_repeated_queries(stats)
+
+    assert stats.count == 6
+    assert [record.getMessage() for record in db_warnings.records] == [
+        'Possible N+1 in load pools: 5 x SELECT id FROM game WHERE id IN (?)'
+    ]
+
+
+def test_statements_under_the_threshold_are_not_reported(runpool, query_stats, db_warnings):
+    with runpool.query_scope('load pool') as stats:
+        for game_id in range(runpool.N_PLUS_ONE_THRESHOLD):
+            runpool.db.session.execute(text('SELECT id FROM game WHERE id = :id'), {'id': game_id}).all()
+    runpool.report_repeated_queries(stats)
+
+    assert stats.count == runpool.N_PLUS_ONE_THRESHOLD
+    assert db_warnings.records == []
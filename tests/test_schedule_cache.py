@@ -0,0 +1,94 @@
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+from conftest import schedule_game
+
+PAST_DAY = date(2024, 7, 13)
+PAST_DATE = PAST_DAY.strftime('%m/%d/%Y')
+
+
+@pytest.fixture
+def clock(runpool, monkeypatch):
+    """Control the time the schedule cache sees."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(runpool.time, 'time', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(runpool, tmp_path):
+    return runpool.ScheduleCache(str(tmp_path / 'cache.db'), ttl=300, max_entries=3)
+
+
+def game(status):
+    return schedule_game(1, PAST_DAY, 'Atlanta Braves', 'Boston Red Sox', 2, 1, status=status)
+
+
+def test_unsettled_date_expires_after_the_ttl(cache, clock):
+    cache.set(PAST_DATE, [game('In Progress')])
+
+    clock[0] += 299
+    assert cache.get(PAST_DATE) == [game('In Progress')]
+    # The live poller asks for a shorter max age
+    assert cache.get(PAST_DATE, max_age=30) is None
+
+    clock[0] += 2
+    assert cache.get(PAST_DATE) is None
+
+
+def test_settled_date_is_kept_indefinitely(cache, clock):
+    cache.set(PAST_DATE, [game('Final'), game('Postponed')])
+
+    clock[0] += 365 * 24 * 3600
+    assert cache.get(PAST_DATE, max_age=0) == [game('Final'), game('Postponed')]
+    assert cache.stats()['settled_entries'] == 1
+
+
+def test_least_recently_used_dates_are_evicted(cache, clock):
+    dates = [(PAST_DAY + timedelta(days=offset)).strftime('%m/%d/%Y') for offset in range(4)]
+    for schedule_date in dates[:3]:
+        clock[0] += 1
+        cache.set(schedule_date, [])
+
+    # Reading the oldest date makes the second the least recently used
+    clock[0] += 1
+    assert cache.get(dates[0]) == []
+    clock[0] += 1
+    cache.set(dates[3], [])
+
+    assert cache.get(dates[1]) is None
+    assert [cache.get(schedule_date) for schedule_date in (dates[0], dates[2], dates[3])] == [[], [], []]
+    assert cache.stats()['entries'] == 3
+
+
+def test_hits_and_misses_are_counted(cache, clock):
+    assert cache.get(PAST_DATE) is None
+    cache.set(PAST_DATE, [game('Final')])
+    cache.get(PAST_DATE)
+    cache.get(PAST_DATE)
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (2, 1)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_connections_are_closed(runpool, cache, monkeypatch):
+    opened = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        opened.append(connect(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(runpool.sqlite3, 'connect', tracking_connect)
+    cache.set(PAST_DATE, [game('Final')])
+    cache.get(PAST_DATE)
+    cache.stats()
+    monkeypatch.setattr(runpool.sqlite3, 'connect', connect)
+
+    assert len(opened) == 3
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
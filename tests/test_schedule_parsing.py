@@ -0,0 +1,110 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'schedules')
+
+
+@pytest.fixture
+def load_schedule(runpool, monkeypatch):
+    """Run a stored /api/v1/schedule response through statsapi.schedule, as the app receives it."""
+
+    def load(name):
+        with open(os.path.join(FIXTURES, f'{name}.json')) as f:
+            response = json.load(f)
+        monkeypatch.setattr(runpool.statsapi, 'get', lambda endpoint, params, **kwargs: response)
+        day = response['dates'][0]['date'] if response['dates'] else '2024-12-25'
+        return runpool.statsapi.schedule(date=datetime.strptime(day, '%Y-%m-%d').strftime('%m/%d/%Y'))
+
+    return load
+
+
+def scores_by_team(runpool, parsed):
+    names = runpool.team_registry.names()
+    return sorted((score.api_game_id, names[score.team_id], score.score) for score in parsed)
+
+
+@pytest.mark.parametrize('status, state', [
+    ('Final', 'final'),
+    ('Game Over', 'final'),
+    ('Completed Early: Rain', 'final'),
+    ('Scheduled', 'pregame'),
+    ('Pre-Game', 'pregame'),
+    ('Warmup', 'pregame'),
+    ('Delayed Start: Rain', 'pregame'),
+    ('Postponed', 'off'),
+    ('Cancelled', 'off'),
+    ('Suspended: Rain', 'off'),
+    ('In Progress', 'live'),
+    ('Manager challenge: Tag play', 'live'),
+    ('Delayed: Rain', 'live'),
+])
+def test_game_state(runpool, status, state):
+    assert runpool.game_state(status) == state
+
+
+def test_doubleheader_games_are_kept_apart(runpool, load_schedule):
+    parsed = runpool.parse_game_scores(load_schedule('doubleheader'), 'final')
+
+    assert scores_by_team(runpool, parsed) == [
+        (746200, 'ATL', 5), (746200, 'NYM', 3),
+        (746201, 'ATL', 2), (746201, 'NYM', 7),
+        (746215, 'BOS', 4), (746215, 'NYY', 4),
+    ]
+    assert parsed[0].game_datetime == datetime(2024, 7, 13, 17, 5)
+
+
+def test_postponed_games_have_no_scores(runpool, load_schedule):
+    schedule = load_schedule('postponed')
+
+    assert scores_by_team(runpool, runpool.parse_game_scores(schedule, 'final')) == [
+        (745410, 'DET', 6), (745410, 'MIN', 1),
+    ]
+    assert runpool.parse_game_scores(schedule, 'live') == []
+
+
+def test_spring_training_and_exhibition_games_do_not_count(runpool, load_schedule):
+    schedule = load_schedule('spring_training')
+
+    assert runpool.parse_game_scores(schedule, 'final') == []
+
+
+def test_rain_shortened_games_are_final_and_suspended_ones_are_not(runpool, load_schedule):
+    schedule = load_schedule('rain_shortened')
+
+    assert scores_by_team(runpool, runpool.parse_game_scores(schedule, 'final')) == [
+        (745900, 'CHC', 9), (745900, 'PIT', 2),
+    ]
+    assert runpool.parse_game_scores(schedule, 'live') == []
+
+
+def test_athletics_resolve_under_both_names(runpool, load_schedule):
+    parsed = runpool.parse_game_scores(load_schedule('athletics'), 'final')
+
+    assert scores_by_team(runpool, parsed) == [
+        (778300, 'OAK', 6), (778300, 'SEA', 4),
+        (778310, 'OAK', 3), (778310, 'SEA', 1),
+    ]
+
+
+def test_live_games_are_parsed_only_in_live_mode(runpool, load_schedule):
+    schedule = load_schedule('in_progress')
+
+    assert runpool.parse_game_scores(schedule, 'final') == []
+    assert scores_by_team(runpool, runpool.parse_game_scores(schedule, 'live')) == [
+        (746700, 'ATL', 2), (746700, 'LAD', 1),
+        (746710, 'HOU', 0), (746710, 'MIN', 3),
+    ]
+
+
+def test_empty_schedule(runpool, load_schedule):
+    assert runpool.parse_final_scores(load_schedule('no_games')) == []
+
+
+def test_unknown_teams_are_skipped(runpool, load_schedule):
+    schedule = load_schedule('doubleheader')
+    schedule[0].update(away_id=999, away_name='Montreal Expos')
+
+    assert [score.api_game_id for score in runpool.parse_final_scores(schedule)] == [746201, 746201, 746215, 746215]
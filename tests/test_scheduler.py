@@ -0,0 +1,124 @@
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from conftest import add_pool
+
+
+@pytest.fixture
+def nightly_calls(runpool, monkeypatch):
+    """Replace the nightly phases with stubs that record which ran."""
+    calls = []
+    monkeypatch.setattr(runpool, 'fetch_final_scores', lambda day: calls.append('fetch') or [])
+    monkeypatch.setattr(runpool, 'ingest_final_scores', lambda day, parsed: calls.append('ingest') or [])
+    monkeypatch.setattr(runpool, 'update_scorecard', lambda: calls.append('scorecard') or set())
+    monkeypatch.setattr(runpool, 'update_player_scores', lambda: calls.append('players') or 0)
+    return calls
+
+
+def nightly_runs(runpool):
+    runpool.db.session.expire_all()
+    return runpool.IngestRun.query.filter_by(job='nightly').order_by(runpool.IngestRun.id).all()
+
+
+def test_new_leader_does_not_replay_a_finished_night(runpool, nightly_calls):
+    yesterday = date.today() - timedelta(days=1)
+    runpool.db.session.add(runpool.IngestRun(job='nightly', status="success", run_date=yesterday,
+                                             started_at=datetime.utcnow(), finished_at=datetime.utcnow()))
+    runpool.db.session.commit()
+
+    runpool.job()
+
+    assert nightly_calls == []
+    assert len(nightly_runs(runpool)) == 1
+
+
+def test_failed_night_is_run_again(runpool, nightly_calls):
+    yesterday = date.today() - timedelta(days=1)
+    runpool.db.session.add(runpool.IngestRun(job='nightly', status="failed", run_date=yesterday,
+                                             started_at=datetime.utcnow(), finished_at=datetime.utcnow()))
+    runpool.db.session.commit()
+
+    runpool.job()
+
+    assert nightly_calls == ['fetch', 'ingest', 'scorecard', 'players']
+    assert [(run.status, run.run_date) for run in nightly_runs(runpool)][-1] == ("success", yesterday)
+
+
+def test_job_stops_when_the_lease_is_lost(runpool, nightly_calls, monkeypatch):
+    heartbeat = runpool.SchedulerHeartbeat('leader')
+    assert heartbeat.renew()
+    monkeypatch.setattr(runpool, 'scheduler_heartbeat', heartbeat)
+
+    def take_over(day, parsed):
+        # A standby takes the lease while the job is between phases
+        nightly_calls.append('ingest')
+        runpool.SchedulerLease.query.update({'expires_at': datetime.utcnow() - timedelta(seconds=1)})
+        runpool.db.session.commit()
+        assert runpool.SchedulerLease.acquire(runpool.SCHEDULER_LEASE_NAME, 'standby', runpool.SCHEDULER_LEASE_TTL)
+        assert not heartbeat.renew()
+        return []
+
+    monkeypatch.setattr(runpool, 'ingest_final_scores', take_over)
+
+    runpool.job()
+
+    assert nightly_calls == ['fetch', 'ingest']
+    run = nightly_runs(runpool)[-1]
+    assert run.status == "failed"
+    assert 'lease' in run.summary
+
+
+def test_heartbeat_keeps_the_lease_through_a_long_job(runpool, monkeypatch):
+    monkeypatch.setattr(runpool, 'SCHEDULER_LEASE_TTL', 0.6)
+    monkeypatch.setattr(runpool, 'SCHEDULER_HEARTBEAT_SECONDS', 0.2)
+    heartbeat = runpool.SchedulerHeartbeat('leader')
+    heartbeat.start()
+    try:
+        # Several TTLs pass without the scheduler loop touching the lease
+        time.sleep(1.5)
+        assert heartbeat.is_leader
+        assert not runpool.SchedulerLease.acquire(runpool.SCHEDULER_LEASE_NAME, 'standby', 60)
+    finally:
+        heartbeat.stop()
+
+    assert runpool.SchedulerLease.acquire(runpool.SCHEDULER_LEASE_NAME, 'standby', 60)
+
+
+@pytest.mark.parametrize('failing_phase', ['ingest_final_scores', 'update_scorecard', 'update_player_scores'])
+def test_database_error_fails_the_nightly_run(runpool, monkeypatch, failing_phase):
+    yesterday = date.today() - timedelta(days=1)
+    game = add_pool(runpool, players=2, start_date=datetime.combine(yesterday, datetime.min.time()))
+    teams = [team.id for team in runpool.team_registry.all()[:2]]
+    game_datetime = datetime.combine(yesterday, datetime.min.time()).replace(hour=23)
+    monkeypatch.setattr(runpool, 'fetch_final_scores', lambda day: [
+        runpool.TeamScore(api_game_id=5001, team_id=teams[0], score=3, game_datetime=game_datetime),
+        runpool.TeamScore(api_game_id=5001, team_id=teams[1], score=5, game_datetime=game_datetime),
+    ])
+
+    # Every phase bumps the pools' data version; make that write fail in the chosen phase
+    failing = []
+    original = getattr(runpool, failing_phase)
+
+    def phase(*args, **kwargs):
+        failing.append(True)
+        return original(*args, **kwargs)
+
+    def bump_data_version(*args, **kwargs):
+        if failing:
+            raise OperationalError('UPDATE game', {}, Exception('database is locked'))
+
+    monkeypatch.setattr(runpool, failing_phase, phase)
+    monkeypatch.setattr(runpool, 'bump_data_version', bump_data_version)
+
+    runpool.job()
+
+    runs = nightly_runs(runpool)
+    assert [run.status for run in runs] == ["failed"]
+    assert 'database is locked' in runs[0].summary
+    # The scorecard watermark only moves once its update has committed
+    scored = runpool.IngestWatermark.get_last_id('scorecard') > 0
+    assert scored == (failing_phase == 'update_player_scores')
+    assert all(player.score in (0, None) for player in runpool.Player.query.filter_by(game_id=game.id))
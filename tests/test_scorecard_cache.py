@@ -0,0 +1,50 @@
+from datetime import date, datetime
+
+from conftest import add_pool, login
+
+
+def test_renaming_a_user_refreshes_their_scorecards(runpool, client):
+    game = add_pool(runpool, players=3)
+    user = login(runpool, client, game)
+
+    response = client.get(f'/game/{game.token}/scorecard')
+    assert f'player-name">{user.name}<'.encode() in response.data
+    game_page = client.get(f'/game/{game.id}')
+    assert game_page.status_code == 200
+
+    client.post('/user_profile', data={'name': 'Renamed Player', 'email': user.email}, follow_redirects=True)
+
+    response = client.get(f'/game/{game.token}/scorecard')
+    assert b'player-name">Renamed Player<' in response.data
+    # The game page's old ETag no longer matches
+    response = client.get(f'/game/{game.id}', headers={'If-None-Match': game_page.headers['ETag']})
+    assert response.status_code == 200
+
+
+def test_ingest_only_invalidates_pools_whose_window_covers_the_results(runpool):
+    active = add_pool(runpool, players=2, pool_name='Active')
+    completed = add_pool(runpool, players=2, pool_name='Completed')
+    completed.status = "completed"
+    completed.end_date = datetime(2024, 4, 10)
+    not_started = add_pool(runpool, players=2, start_date=datetime(2024, 5, 1), pool_name='Later')
+    runpool.db.session.commit()
+    team_id = runpool.team_registry.all()[0].id
+
+    def ingest(day, api_game_id):
+        runpool.ingest_final_scores(day.strftime('%m/%d/%Y'), [runpool.TeamScore(
+            api_game_id=api_game_id, team_id=team_id, score=3,
+            game_datetime=datetime.combine(day, datetime.min.time()).replace(hour=23)
+        )])
+
+    def versions():
+        runpool.db.session.expire_all()
+        return [runpool.Game.query.get(game.id).data_version or 0 for game in (active, completed, not_started)]
+
+    before = versions()
+    ingest(date(2024, 4, 20), 1)
+    assert [after - start for after, start in zip(versions(), before)] == [1, 0, 0]
+
+    # A backfilled result inside the completed pool's window does change it
+    before = versions()
+    ingest(date(2024, 4, 10), 2)
+    assert [after - start for after, start in zip(versions(), before)] == [1, 1, 0]
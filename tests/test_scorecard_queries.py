@@ -0,0 +1,29 @@
+from datetime import date, timedelta
+
+from conftest import add_pool, add_results, count_queries, reset_database
+
+
+def scorecard_query_count(runpool, client, players):
+    """Statements one uncached scorecard request runs for a pool of ``players`` players."""
+    game = add_pool(runpool, players)
+    teams = [team.id for team in runpool.team_registry.all()]
+    for day in range(10):
+        add_results(runpool, date(2024, 4, 2) + timedelta(days=day),
+                    {team_id: (team_id + day) % 14 for team_id in teams})
+    runpool.update_scorecard()
+    runpool.update_player_scores()
+
+    with count_queries(runpool.db.engine) as count:
+        response = client.get(f'/game/{game.token}/scorecard')
+    assert response.status_code == 200
+    return count[0]
+
+
+def test_scorecard_query_count_is_constant_in_pool_size(runpool, client):
+    small = scorecard_query_count(runpool, client, players=2)
+
+    reset_database(runpool)
+    large = scorecard_query_count(runpool, client, players=25)
+
+    assert small == large
+    assert large <= 6
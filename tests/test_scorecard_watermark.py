@@ -0,0 +1,54 @@
+from datetime import date, datetime
+
+from conftest import add_pool
+
+
+def store_result(runpool, result_id, team_id, score, day=date(2024, 4, 2)):
+    """Commit one final result with a chosen id, as a transaction that took that id would."""
+    runpool.db.session.add(runpool.MLBGameResult(
+        id=result_id, api_game_id=9000 + result_id, team_id=team_id, score=score, date=day,
+        game_datetime=datetime.combine(day, datetime.min.time()).replace(hour=23), final=True
+    ))
+    runpool.db.session.commit()
+
+
+def run_mask(runpool, game, team_id):
+    runpool.db.session.expire_all()
+    coverage = runpool.TeamCoverage.query.filter_by(game_id=game.id, team_id=team_id).first()
+    return coverage.run_mask if coverage else 0
+
+
+def test_result_committed_below_the_watermark_is_still_scored(runpool):
+    game = add_pool(runpool, players=2)
+    first, second = [team.id for team in runpool.team_registry.all()[:2]]
+    store_result(runpool, 1, first, 2)
+    store_result(runpool, 3, second, 5)
+
+    # Id 2 was taken by a transaction that has not committed yet
+    assert runpool.update_scorecard() == {game.id}
+    assert runpool.IngestWatermark.get_last_id('scorecard') == 3
+    assert runpool.IngestWatermark.get_pending_ids('scorecard') == [2]
+
+    store_result(runpool, 2, first, 9)
+
+    assert runpool.update_scorecard() == {game.id}
+    assert run_mask(runpool, game, first) == (1 << 2) | (1 << 9)
+    assert runpool.IngestWatermark.get_pending_ids('scorecard') == []
+
+
+def test_ids_that_never_commit_stop_being_waited_for(runpool, monkeypatch):
+    monkeypatch.setattr(runpool, 'SCORECARD_LATE_COMMIT_IDS', 3)
+    add_pool(runpool, players=2)
+    first, second = [team.id for team in runpool.team_registry.all()[:2]]
+    store_result(runpool, 1, first, 2)
+    store_result(runpool, 3, second, 5)
+    runpool.update_scorecard()
+
+    # Ids 4-6 are stored later; id 2 (a rolled back insert) is now more than 3 ids behind
+    for result_id in (4, 5, 6):
+        store_result(runpool, result_id, second, result_id)
+    runpool.update_scorecard()
+
+    assert runpool.IngestWatermark.get_pending_ids('scorecard') == []
+    # Nothing new and nothing pending: no work
+    assert runpool.update_scorecard() == set()
@@ -0,0 +1,51 @@
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from conftest import add_pool
+
+BUSY_TIMEOUT_MS = 500
+
+
+@pytest.fixture
+def short_busy_timeout(runpool, monkeypatch):
+    """Reconnect with a short busy timeout, so a blocked commit fails fast instead of waiting 10s."""
+    monkeypatch.setattr(runpool, 'SQLITE_BUSY_TIMEOUT_MS', BUSY_TIMEOUT_MS)
+    runpool.db.session.remove()
+    runpool.db.engine.dispose()
+    yield
+    runpool.db.session.remove()
+    runpool.db.engine.dispose()
+
+
+def test_ingest_commits_while_a_read_is_open(runpool, short_busy_timeout):
+    add_pool(runpool, players=2)
+    teams = [team.id for team in runpool.team_registry.all()[:2]]
+    parsed = [
+        runpool.TeamScore(api_game_id=7001, team_id=teams[0], score=2, game_datetime=datetime(2024, 4, 2, 23)),
+        runpool.TeamScore(api_game_id=7001, team_id=teams[1], score=6, game_datetime=datetime(2024, 4, 2, 23)),
+    ]
+
+    with runpool.db.engine.connect() as reader:
+        assert reader.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+        assert reader.execute(text('PRAGMA busy_timeout')).scalar() == BUSY_TIMEOUT_MS
+
+        # A page render part-way through a result set holds a read transaction open
+        with reader.begin():
+            page = reader.execute(text('SELECT id FROM team ORDER BY id'))
+            page.fetchone()
+            assert reader.execute(text('SELECT count(*) FROM mlb_game_result')).scalar() == 0
+
+            started = time.perf_counter()
+            stored = runpool.ingest_final_scores('04/02/2024', parsed)
+            elapsed = time.perf_counter() - started
+
+            assert len(stored) == 2
+            assert elapsed < BUSY_TIMEOUT_MS / 1000 / 2
+            # The reader keeps its snapshot until its transaction ends
+            assert reader.execute(text('SELECT count(*) FROM mlb_game_result')).scalar() == 0
+            assert len(page.fetchall()) == len(runpool.team_registry.all()) - 1
+
+        assert reader.execute(text('SELECT count(*) FROM mlb_game_result')).scalar() == 2